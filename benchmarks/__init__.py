@@ -0,0 +1,6 @@
+###
+#
+# N3rdP1um23
+# The following package is used to handle benchmarking the operations over generated subtitle files
+#
+###
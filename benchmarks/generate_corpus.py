@@ -0,0 +1,180 @@
+###
+#
+# N3rdP1um23
+# The following file is used to handle generating synthetic subtitle files with a configurable amount of sections and share of the defects the operations correct
+#
+###
+
+# Import the required packages
+import argparse
+import random
+import sys
+
+# Create the words that the lines are built from
+words = ['the', 'you', 'what', 'are', 'doing', 'here', 'there', 'we', 'have', 'to', 'go', 'now', 'I', 'know', 'it', 'was', 'never', 'going', 'to', 'work', 'come', 'on', 'just', 'listen', 'me', 'please', 'tell', 'him', 'her', 'about', 'tonight', 'dr', 'mr', 'mrs', 'st', 'jr', 'okay', 'maybe', 'yeah', 'where', 'home', 'again', 'something', 'wrong', 'with', 'this', 'place']
+
+# Create the punctuation that the lines can end with (the empty ending leaves the line without any)
+endings = ['.', '.', '.', '?', '!', '...', ',', '']
+
+# Create the endings and beginnings of sentences that are split over two sections (with and without the dashes that mark them)
+split_endings = ['-', ' -', '...', ',', '']
+split_beginnings = ['-', '- ', '', '...']
+
+# Create the default settings of the corpus
+default_settings = {
+    'uppercase_share': 0.05, # The share of lines that are full uppercase (such as speaker names or sound effects)
+    'dash_share': 0.1, # The share of lines with dash defects (unspaced starting dashes, ending dashes, or more than one speaker) and of sentences split over two sections
+    'italic_share': 0.05, # The share of lines that open italics (half of which are never closed)
+    'overlap_share': 0.05, # The share of sections that start before the previous section ends
+    'line_length': 40, # The average length of a line in characters
+    'max_lines': 3, # The most lines a section can have
+}
+
+# The following function is used to handle formatting a time in milliseconds into a time stamp
+def format_time(milliseconds, separator = ','):
+    # Return the formatted time stamp
+    return '%02d:%02d:%02d%s%03d' % (milliseconds // 3600000, milliseconds // 60000 % 60, milliseconds // 1000 % 60, separator, milliseconds % 1000)
+
+# The following function is used to handle generating a single line of a section (continuing a sentence from the previous line when requested)
+def generate_line(generator, settings, continues = False):
+    # Build the line from random words until it reaches a random length around the average length (continuing lines start with a lowercase word)
+    target_length = generator.randint(settings['line_length'] // 2, settings['line_length'] * 3 // 2)
+    line = generator.choice(words) if continues else generator.choice(words).capitalize()
+    while len(line) < target_length:
+        line = line + ('... ' + generator.choice(words).capitalize() if generator.random() < 0.02 else ' ' + generator.choice(words))
+
+    # Check to see if the line should trail off part way through
+    if generator.random() < 0.1:
+        # Add three dots after one of the words
+        line = line.replace(' ', '... ', 1)
+
+    # Add the punctuation to the end of the line
+    line = line + generator.choice(endings)
+
+    # Check to see if the line should be full uppercase
+    if generator.random() < settings['uppercase_share']:
+        # Uppercase the line (labelling it with a speaker some of the time)
+        line = line.upper() if generator.random() < 0.5 else 'NAME: ' + line.upper()
+
+    # Check to see if the line should have a dash defect
+    if generator.random() < settings['dash_share']:
+        # Grab the kind of dash defect to add
+        defect = generator.randrange(4)
+
+        # Add the respective dash defect
+        if defect == 0:
+            line = generator.choice(['-', '-...', '<i>-']) + line
+        elif defect == 1:
+            line = line.rstrip('.,?!') + '-'
+        elif defect == 2:
+            line = line.rstrip('.,?!') + ' -'
+        else:
+            line = '- ' + line + ' - ' + generator.choice(words).capitalize() + '.'
+
+    # Check to see if the line should open italics
+    if generator.random() < settings['italic_share']:
+        # Open the italics (closing them half of the time)
+        line = '<i>' + line + ('</i>' if generator.random() < 0.5 else '')
+
+    # Return the line
+    return line
+
+# The following function is used to handle generating the text of a subtitle file with the provided amount of sections
+def generate_corpus(cue_count, file_format = 'srt', seed = 0, **settings):
+    # Grab the settings of the corpus (falling back to the defaults)
+    settings = {key: settings[key] if key in settings and settings[key] is not None else value for key, value in default_settings.items()}
+
+    # Create the random generator (seeded so that the same corpus is generated each time)
+    generator = random.Random(seed)
+
+    # Grab the millisecond separator used by the format
+    separator = '.' if file_format == 'vtt' else ','
+
+    # Create the list that will hold the sections (starting with the header for vtt files)
+    sections = ['WEBVTT'] if file_format == 'vtt' else []
+
+    # Iterate over each of the sections being generated
+    current_time = 1000
+    continues = False
+    for index in range(1, cue_count + 1):
+        # Grab the start and end time of the section
+        start_time = current_time
+        end_time = start_time + generator.randint(800, 4000)
+
+        # Move the time onto the next section (starting it before this section ends when it should overlap)
+        current_time = max(end_time - generator.randint(1, 500), 0) if generator.random() < settings['overlap_share'] else end_time + generator.randint(50, 5000)
+
+        # Grab the lines of the section (continuing the sentence of the previous section when it was split)
+        lines = [generate_line(generator, settings, continues and line_index == 0) for line_index in range(generator.randint(1, settings['max_lines']))]
+
+        # Check to see if the section continues the sentence of the previous section
+        if continues:
+            # Add the beginning of the split sentence to the first line
+            lines[0] = generator.choice(split_beginnings) + lines[0]
+
+        # Check to see if the sentence of the last line should be split over into the next section
+        continues = generator.random() < settings['dash_share']
+        if continues:
+            # Replace the punctuation of the last line with the ending of the split sentence
+            lines[-1] = lines[-1].rstrip('.,?!- ') + generator.choice(split_endings)
+
+        # Create the section (including some cue settings for vtt files)
+        sections.append('\n'.join([str(index), format_time(start_time, separator) + ' --> ' + format_time(end_time, separator) + (' line:90%' if file_format == 'vtt' and generator.random() < 0.1 else '')] + lines))
+
+    # Return the text of the file
+    return '\n\n'.join(sections) + '\n'
+
+# The following function is used to handle generating a corpus and writing it to the provided path
+def write_corpus(path, cue_count, file_format = 'srt', seed = 0, **settings):
+    # Write the corpus to the file
+    with open(path, 'w', encoding = 'utf-8', newline = '\n') as file:
+        file.write(generate_corpus(cue_count, file_format, seed, **settings))
+
+    # Return the path to the file
+    return path
+
+# The following function is used to handle parsing the command line arguments
+def parse_arguments(arguments = None):
+    # Create the argument parser
+    parser = argparse.ArgumentParser(prog = 'generate_corpus', description = 'Generate a synthetic subtitle file for benchmarking the operations.')
+
+    # Add the supported arguments
+    parser.add_argument('output', nargs = '?', help = 'the file to write the corpus to (printed when not provided)')
+    parser.add_argument('-n', '--cues', type = int, default = 5000, help = 'the amount of sections to generate')
+    parser.add_argument('-f', '--format', choices = ['srt', 'vtt'], default = 'srt', help = 'the format of the file')
+    parser.add_argument('-s', '--seed', type = int, default = 0, help = 'the seed of the random generator')
+    parser.add_argument('--uppercase-share', type = float, help = 'the share of full uppercase lines (default %s)' % default_settings['uppercase_share'])
+    parser.add_argument('--dash-share', type = float, help = 'the share of lines with dash defects (default %s)' % default_settings['dash_share'])
+    parser.add_argument('--italic-share', type = float, help = 'the share of lines that open italics (default %s)' % default_settings['italic_share'])
+    parser.add_argument('--overlap-share', type = float, help = 'the share of sections that overlap the previous section (default %s)' % default_settings['overlap_share'])
+    parser.add_argument('--line-length', type = int, help = 'the average length of a line in characters (default %s)' % default_settings['line_length'])
+    parser.add_argument('--max-lines', type = int, help = 'the most lines a section can have (default %s)' % default_settings['max_lines'])
+
+    # Return the parsed arguments
+    return parser.parse_args(arguments)
+
+# The following function is used to handle grabbing the corpus settings from the parsed arguments
+def get_settings(parsed_arguments):
+    # Return the settings that were provided
+    return {key: getattr(parsed_arguments, key) for key in default_settings}
+
+# The following function is used as the main entry point of the corpus generator
+def main(arguments = None):
+    # Call the function to handle parsing the command line arguments
+    parsed_arguments = parse_arguments(arguments)
+
+    # Check to see if the corpus should be written to a file
+    if parsed_arguments.output:
+        # Write the corpus to the file
+        write_corpus(parsed_arguments.output, parsed_arguments.cues, parsed_arguments.format, parsed_arguments.seed, **get_settings(parsed_arguments))
+    else:
+        # Display the corpus
+        sys.stdout.write(generate_corpus(parsed_arguments.cues, parsed_arguments.format, parsed_arguments.seed, **get_settings(parsed_arguments)))
+
+    # Return the exit code
+    return 0
+
+# Check to see if the file is being ran directly
+if __name__ == '__main__':
+    # Call the main function and exit with the respective code
+    sys.exit(main())
@@ -0,0 +1,253 @@
+###
+#
+# N3rdP1um23
+# The following file is used to handle timing each of the operations end to end and per stage over generated subtitle files (writing the results as json so that they can be compared across versions)
+#
+###
+
+# Import the required packages
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from benchmarks.generate_corpus import default_settings, get_settings, write_corpus
+from subtitle_processor import subtitle_processor, process_file
+from subtitle_operations import get_operation, get_operation_names
+from subtitle_stats import stages
+
+# The following function is used to handle timing each stage of an operation on a copy of the file
+def time_stages(file, working_file, operation, find_and_replace, memory_map = False, columnar = False):
+    # Copy the file so that the original is left untouched
+    shutil.copyfile(file, working_file)
+
+    # Create the processor and the timings of each stage
+    processor = subtitle_processor(operation, find_and_replace, memory_map, False, columnar)
+    timings = {}
+
+    # Time loading the data from the file
+    start_time = time.perf_counter()
+    processor.load_data(working_file)
+    timings['load'] = time.perf_counter() - start_time
+
+    # Time detecting all of the matches
+    start_time = time.perf_counter()
+    processor.parse_file()
+    timings['detect'] = time.perf_counter() - start_time
+
+    # Grab the amount of sections the operation spans and the amount of matches
+    section_span = processor.get_section_span()
+    matches = len(processor.sections_to_modify) // section_span
+
+    # Time modifying each of the matches without approving them
+    start_time = time.perf_counter()
+    for section_index in range(0, len(processor.sections_to_modify), section_span):
+        processor.modify_section(processor.sections_to_modify[section_index], processor.sections_to_modify[section_index + 1] if section_span > 1 else None)
+    timings['modify'] = time.perf_counter() - start_time
+
+    # Time modifying and approving all of the matches
+    start_time = time.perf_counter()
+    processor.auto_approve()
+    timings['approve'] = time.perf_counter() - start_time
+
+    # Time saving the file (even when nothing changed so that writing is always timed)
+    start_time = time.perf_counter()
+    processor.save_modifications(working_file, force = True)
+    timings['save'] = time.perf_counter() - start_time
+
+    # Call the function to handle closing the file if it was memory mapped
+    processor.close_file()
+
+    # Return the amount of matches and the timings of each stage
+    return matches, timings
+
+# The following function is used to handle timing an operation end to end on a copy of the file (the same way the command line handles it)
+def time_end_to_end(file, working_file, operation, find_and_replace, memory_map = False, columnar = False):
+    # Copy the file so that the original is left untouched
+    shutil.copyfile(file, working_file)
+
+    # Time processing the file
+    start_time = time.perf_counter()
+    process_file(working_file, operation, find_and_replace, None, memory_map, False, None, columnar)
+
+    # Return the time it took
+    return time.perf_counter() - start_time
+
+# The following function is used to handle benchmarking an operation on a file (keeping the fastest time of each stage over the repeats)
+def benchmark_operation(file, working_directory, operation, find_and_replace, repeat = 3, memory_map = False, columnar = False):
+    # Grab the path to the working copy of the file
+    working_file = os.path.join(working_directory, os.path.basename(file))
+
+    # Create the result of the operation
+    result = {'operation': operation, 'matches': 0, 'stages': {stage: None for stage in stages}, 'end_to_end': None}
+
+    # Iterate over each of the repeats
+    for _ in range(repeat):
+        # Time each stage and keep the fastest times
+        result['matches'], timings = time_stages(file, working_file, operation, find_and_replace, memory_map, columnar)
+        result['stages'] = {stage: min(timings[stage], result['stages'][stage]) if result['stages'][stage] is not None else timings[stage] for stage in stages}
+
+        # Time the operation end to end and keep the fastest time
+        end_to_end = time_end_to_end(file, working_file, operation, find_and_replace, memory_map, columnar)
+        result['end_to_end'] = min(end_to_end, result['end_to_end']) if result['end_to_end'] is not None else end_to_end
+
+    # Return the result
+    return result
+
+# The following function is used to handle grabbing the commit that's being benchmarked (if the code is in a git repository)
+def get_commit():
+    # Attempt to ask git for the current commit
+    try:
+        # Return the current commit (flagging when there are uncommitted changes)
+        directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd = directory, capture_output = True, text = True, check = True).stdout.strip()
+        changed = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd = directory, capture_output = True, text = True, check = True).stdout.strip()
+        return commit + ('-dirty' if changed else '')
+    except (OSError, subprocess.CalledProcessError):
+        # Return nothing as the commit couldn't be found
+        return None
+
+# The following function is used to handle running the benchmarks over generated files of each of the sizes and formats
+def run_benchmarks(operations, sizes, formats, settings = None, seed = 0, repeat = 3, find_and_replace = None, memory_map = False, columnar = False, progress = None):
+    # Create the results along with the details of what was benchmarked
+    results = {
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'repeat': repeat,
+        'memory_map': memory_map,
+        'columnar': columnar,
+        'corpus': {'seed': seed, 'settings': {key: settings[key] if settings is not None and key in settings and settings[key] is not None else value for key, value in default_settings.items()}},
+        'results': [],
+    }
+
+    # Create the directory that holds the generated files and their working copies
+    with tempfile.TemporaryDirectory() as directory:
+        # Iterate over each of the sizes and formats
+        for cue_count in sizes:
+            for file_format in formats:
+                # Generate the file and create the directory for its working copies
+                file = write_corpus(os.path.join(directory, 'corpus_%d.%s' % (cue_count, file_format)), cue_count, file_format, seed, **(settings if settings is not None else {}))
+                working_directory = os.path.join(directory, 'working')
+                os.makedirs(working_directory, exist_ok = True)
+
+                # Iterate over each of the operations
+                for operation in operations:
+                    # Benchmark the operation and store the result along with the file it was ran on
+                    result = benchmark_operation(file, working_directory, operation, find_and_replace, repeat, memory_map, columnar)
+                    result.update({'format': file_format, 'cues': cue_count})
+                    results['results'].append(result)
+
+                    # Check to see if the progress should be reported
+                    if progress is not None:
+                        # Call the function to handle reporting the result
+                        progress(result)
+
+    # Return the results
+    return results
+
+# The following function is used to handle comparing the results against the results of another run (returning the lines of the comparison)
+def compare_results(results, baseline, threshold = 0.1):
+    # Index the baseline results by the operation and file they were ran on
+    baseline_results = {(result['operation'], result['format'], result['cues']): result for result in baseline['results']}
+
+    # Create the lines of the comparison
+    lines = ['comparing {commit} against {baseline} (changes over {threshold:.0%} are flagged)'.format(commit = results['commit'], baseline = baseline['commit'], threshold = threshold)]
+
+    # Iterate over each of the results that are in the baseline
+    for result in [result for result in results['results'] if (result['operation'], result['format'], result['cues']) in baseline_results]:
+        # Grab the baseline result
+        baseline_result = baseline_results[(result['operation'], result['format'], result['cues'])]
+
+        # Grab the ratio of the time against the baseline for the whole operation and each stage
+        ratios = [('end_to_end', result['end_to_end'] / baseline_result['end_to_end'] if baseline_result['end_to_end'] else None)] + [(stage, result['stages'][stage] / baseline_result['stages'][stage] if baseline_result['stages'].get(stage) else None) for stage in stages]
+
+        # Grab the stages that changed by more than the threshold
+        changes = ['{stage} x{ratio:.2f}'.format(stage = stage, ratio = ratio) for stage, ratio in ratios if ratio is not None and abs(ratio - 1) > threshold]
+
+        # Add the line of the result (noting when the amount of matches changed as the operation behaves differently)
+        lines.append('{operation} ({format}, {cues} cues): {changes}{matches}'.format(operation = result['operation'], format = result['format'], cues = result['cues'], changes = ', '.join(changes) if changes else 'unchanged', matches = ' (matches changed from {old} to {new})'.format(old = baseline_result['matches'], new = result['matches']) if baseline_result['matches'] != result['matches'] else ''))
+
+    # Return the lines of the comparison
+    return lines
+
+# The following function is used to handle parsing the command line arguments
+def parse_arguments(arguments = None):
+    # Create the argument parser
+    parser = argparse.ArgumentParser(prog = 'run_benchmarks', description = 'Time each operation end to end and per stage (load, detect, modify, approve, save) over generated subtitle files.')
+
+    # Add the supported arguments
+    parser.add_argument('-o', '--operation', dest = 'operations', action = 'append', choices = get_operation_names(), metavar = 'OPERATION', help = 'the operation to benchmark (can be repeated, all operations are benchmarked when not provided)')
+    parser.add_argument('-n', '--cues', dest = 'sizes', type = int, action = 'append', help = 'the amount of sections in the generated files (can be repeated, default 5000)')
+    parser.add_argument('-f', '--format', dest = 'formats', choices = ['srt', 'vtt'], action = 'append', help = 'the format of the generated files (can be repeated, both formats are benchmarked when not provided)')
+    parser.add_argument('-r', '--repeat', type = int, default = 3, help = 'the amount of times to run each operation (the fastest time is kept)')
+    parser.add_argument('-s', '--seed', type = int, default = 0, help = 'the seed used to generate the files')
+    parser.add_argument('--output', help = 'the file to write the json results to (printed when not provided)')
+    parser.add_argument('--compare', metavar = 'RESULTS', help = 'the json results of a previous run to compare against')
+    parser.add_argument('--threshold', type = float, default = 0.1, help = 'the change against the compared results that is flagged (default 0.1 for 10%%)')
+    parser.add_argument('-m', '--memory-map', action = 'store_true', help = 'memory map the generated files instead of reading them into memory')
+    parser.add_argument('--columnar', action = 'store_true', help = 'check the lines of many sections at once for the operations that support it (requires numpy)')
+    parser.add_argument('--find', default = 'the', help = 'the word or sentence to find when benchmarking the "Find and replace" operation')
+    parser.add_argument('--replace', default = 'a', help = 'the value to replace the found word or sentence with when benchmarking the "Find and replace" operation')
+    parser.add_argument('--uppercase-share', type = float, help = 'the share of full uppercase lines (default %s)' % default_settings['uppercase_share'])
+    parser.add_argument('--dash-share', type = float, help = 'the share of lines with dash defects (default %s)' % default_settings['dash_share'])
+    parser.add_argument('--italic-share', type = float, help = 'the share of lines that open italics (default %s)' % default_settings['italic_share'])
+    parser.add_argument('--overlap-share', type = float, help = 'the share of sections that overlap the previous section (default %s)' % default_settings['overlap_share'])
+    parser.add_argument('--line-length', type = int, help = 'the average length of a line in characters (default %s)' % default_settings['line_length'])
+    parser.add_argument('--max-lines', type = int, help = 'the most lines a section can have (default %s)' % default_settings['max_lines'])
+
+    # Parse the arguments
+    parsed_arguments = parser.parse_args(arguments)
+
+    # Check to see if the repeat count is invalid
+    if parsed_arguments.repeat < 1:
+        # Display the error and exit
+        parser.error('--repeat must be 1 or greater')
+
+    # Return the parsed arguments
+    return parsed_arguments
+
+# The following function is used as the main entry point of the benchmarks
+def main(arguments = None):
+    # Call the function to handle parsing the command line arguments
+    parsed_arguments = parse_arguments(arguments)
+
+    # Grab what's being benchmarked (falling back to the defaults)
+    operations = parsed_arguments.operations if parsed_arguments.operations is not None else get_operation_names()
+    sizes = parsed_arguments.sizes if parsed_arguments.sizes is not None else [5000]
+    formats = parsed_arguments.formats if parsed_arguments.formats is not None else ['srt', 'vtt']
+
+    # Run the benchmarks (reporting each result as it completes)
+    results = run_benchmarks(operations, sizes, formats, get_settings(parsed_arguments), parsed_arguments.seed, parsed_arguments.repeat, {'find': parsed_arguments.find, 'replace': parsed_arguments.replace}, parsed_arguments.memory_map, parsed_arguments.columnar, lambda result: print('{operation} ({format}, {cues} cues): {end_to_end:.3f}s'.format(**result), file = sys.stderr))
+
+    # Check to see if the results should be written to a file
+    if parsed_arguments.output:
+        # Write the results to the file
+        with open(parsed_arguments.output, 'w') as output_file:
+            json.dump(results, output_file, indent = 4)
+    else:
+        # Display the results
+        print(json.dumps(results, indent = 4))
+
+    # Check to see if the results should be compared against a previous run
+    if parsed_arguments.compare:
+        # Load the previous results
+        with open(parsed_arguments.compare, 'r') as baseline_file:
+            baseline = json.load(baseline_file)
+
+        # Display the comparison
+        for line in compare_results(results, baseline, parsed_arguments.threshold):
+            print(line, file = sys.stderr)
+
+    # Return the exit code
+    return 0
+
+# Check to see if the file is being ran directly
+if __name__ == '__main__':
+    # Call the main function and exit with the respective code
+    sys.exit(main())
@@ -14,53 +14,19 @@ from tkinter import messagebox as mb
 from tkinter import simpledialog as sd
 import os
 from tkinter.constants import BOTH, BOTTOM, DISABLED, END, HORIZONTAL, LEFT, NONE, NORMAL, NW, RIGHT, SW, TOP, VERTICAL, W, X, Y
-import regex
-from datetime import datetime, timedelta
 import json
+import threading
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from subtitle_processor import subtitle_processor, subtitle_cue, process_file, process_pipeline_file, get_error_summary
+from subtitle_cache import subtitle_cache
+from subtitle_operations import get_operation, get_operation_names, load_plugins
+from subtitle_stats import format_summary, write_stats
 
 # The following is a class that's used for setting up the application GUI
 class assister_application:
     # Create the class specific properties
     config = {}
-    operations = [
-        'Add dashes to split lines (lowercase)',
-        'Add dashes to split lines (uppercase)',
-        'Add missing italics',
-        'Add space after line starting dash',
-        'Add space after line starting dash and lowercase character',
-        'Add space after line starting dash and three dots',
-        'Add space after line starting dash and uppercase character',
-        'Capitalize, add a period, and space people abbreviations',
-        'Convert vtt to srt',
-        'Edit full uppercase lines',
-        'Edit lines with colon immediately after a letter',
-        'Edit lines with two or more consecutive uppercase characters',
-        'Edit lines that don\'t have line ending punctuation',
-        'Edit lines that don\'t have line ending punctuation (add dashes)',
-        'Find and replace',
-        'Fix time overlaps',
-        'Remove full uppercase lines',
-        'Remove line ending dash',
-        'Remove lines with two or more consecutive uppercase characters',
-        'Remove sections that don\'t have line ending punctuation',
-        'Remove space after three dots and a lowercase word',
-        'Remove space after three dots and an uppercase word',
-        'Remove space after three dots',
-        'Remove spaced dashes from split lines',
-        'Remove spaced line ending dash',
-        'Remove spaced line starting dash',
-        'Replace dashes with three dots for quick lines',
-        'Sanitize file',
-        'Trim long lines',
-    ]
-    section_spanning_operations = { # Operations that span more than one section and their respective sections they span
-        'Add dashes to split lines (lowercase)': 2,
-        'Add dashes to split lines (uppercase)': 2,
-        'Edit lines that don\'t have line ending punctuation (add dashes)': 2,
-        'Fix time overlaps': 2,
-        'Remove spaced dashes from split lines': 2,
-        'Replace dashes with three dots for quick lines': 2,
-    }
     supported_files = (
         ('SubRip File', '*.srt'),
         ('MicroDVD/VobSub Subtitle File', '*.sub'),
@@ -73,44 +39,10 @@ class assister_application:
     current_file_index = -1
     current_index = 0
     total_items = 0
-    sections_to_modify = []
-    regex_statements = {
-        'Add dashes to split lines (lowercase)': {
-            'positive_first_section': r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?(\"|\”|\'|\$)?(\-|\–)(\"|\”|\'|\$)?(\<i\>|\<\/i\>)?$',
-            'negative_first_section': r'(\d+|[[:lower:]]|[[:upper:]])(\ |\,|\.\.\.)?(\"|\”|\'|\$)?(\ )?(\-|\–)?(\"|\”|\'|\$)?(\<i\>|\<\/i\>)?$',
-            'positive_second_section': r'^(\<i\>|\<\/i\>)?(\"|\”|\'|\$)?(\-|\–)(\"|\”|\'|\$)?(\d+|[[:lower:]])',
-            'negative_second_section': r'^(\<i\>|\<\/i\>)?(\"|\”|\'|\$)?(\-|\–)?(\ )?(\"|\”|\'|\$)?(\ )?(\d+|[[:lower:]])',
-        },
-        'Add dashes to split lines (uppercase)': {
-            'positive_first_section': r'(\d+|[[:lower:]])(\,|\.\.\.)?(\"|\”|\'|\$)?(\-|\–)(\"|\”|\'|\$)?(\<i\>|\<\/i\>)?$',
-            'negative_first_section': r'(\d+|[[:lower:]])(\ |\,)?(\"|\”|\'|\$)?(\ )?(\-|\–)?(\"|\”|\'|\$)?(\<i\>|\<\/i\>)?$',
-            'positive_second_section': r'^(\<i\>|\<\/i\>)?(\"|\”|\'|\$)?(\-|\–)(\"|\”|\'|\$)?(\d+|[[:upper:]])',
-            'negative_second_section': r'^(\<i\>|\<\/i\>)?(\"|\”|\'|\$)?(\-|\–)?(\ )?(\"|\”|\'|\$)?(\ )?(\d+|[[:upper:]])',
-        },
-        'Add space after line starting dash': r'^((\-|\–)\w|\<i\>(\-|\–)\w|(\-|\–)\<i\>\w)',
-        'Add space after line starting dash and lowercase character': r'^((\-|\–)[[:lower:]]|\<i\>(\-|\–)[[:lower:]]|(\-|\–)\<i\>[[:lower:]]|(\-|\–)(\"|\”)[[:lower:]]|(\-|\–)\.\.\.[[:lower:]])',
-        'Add space after line starting dash and three dots': r'^((\-|\–)|\<i\>(\-|\–)|(\-|\–)\<i\>)\.\.\.\w',
-        'Add space after line starting dash and uppercase character': r'^((\-|\–)[[:upper:]]|\<i\>(\-|\–)[[:upper:]]|(\-|\–)\<i\>[[:upper:]]|(\-|\–)(\"|\”)[[:upper:]]|(\-|\–)\.\.\.[[:upper:]])',
-        'Capitalize, add a period, and space people abbreviations': r'(?:^|\ |\/)(dr(?:\ |\.|\.\ )|Dr(?:\ |\.)|jr(?:\ |\.|\.\ )|Jr(?:\ |\.)|mr(?:\ |\.|\.\ )|Mr(?:\ |\.)|mrs(?:\ |\.|\.\ )|Mrs(?:\ |\.)|ms(?:\ |\.|\.\ )|Ms(?:\ |\.)|sr(?:\ |\.|\.\ )|Sr(?:\ |\.)|st(?:\ |\.|\.\ )|St(?:\ |\.))[a-zA-Z]',
-        'Edit lines with colon immediately after a letter': r'\w\:',
-        'Edit lines with two or more consecutive uppercase characters': r'[[:upper:]]{2,}',
-        'Edit lines that don\'t have line ending punctuation': r'\w(\.\,\!\?){0}(\"|\”|\<\/i\>|\<i\>)?$',
-        'Edit lines that don\'t have line ending punctuation (add dashes)': r'\w(\.\,\!\?){0}(\"|\”|\<\/i\>|\<i\>)?$',
-        'Remove line ending dash': r'(\-|\–)$',
-        'Remove lines with two or more consecutive uppercase characters': r'[[:upper:]]{2,}',
-        'Remove space after three dots': r'\.\.\.\ ',
-        'Remove space after three dots and a lowercase word': r'\.\.\.\ [[:lower:]]',
-        'Remove space after three dots and an uppercase word': r'\.\.\.\ [[:upper:]]',
-        'Remove spaced dashes from split lines': {
-            'first_section_dash_ending': r'(\-|\–)$',
-            'second_section_dash_starting': r'^(\-|\–)',
-            'first_section_spaced_dash_ending': r'\ (\-|\–)$',
-            'second_section_dash_spaced_starting': r'^(\-|\–)\ ',
-        },
-        'Remove spaced line ending dash': r'\ (\-|\–)$',
-        'Remove spaced line starting dash': r'^(\-|\–)\ ',
-        'Trim long lines': r'((?:\-|\–)\ .+(?|!|.|))\ ((?:\-|\–)\ .*)',
-    }
+    file_futures = {}
+    prefetched_files = {}
+    file_stats = []
+    pipeline_operations = []
     find_and_replace = {
         'find': '',
         'replace': ''
@@ -119,11 +51,26 @@ class assister_application:
     # Global variables
     favourite_operations_checkbox_values = {}
     favourite_operations_checkboxes = {}
+    pipeline_prefix = 'Pipeline: '
 
     # The following function is used as a constructor
     def __init__(self):
-        # Load the config
+        # Load the config and any plugins that provide extra operations
         self.load_config()
+        load_plugins(self.config['operation_plugins'] if 'operation_plugins' in self.config else None)
+
+        # Grab the available operations
+        self.operations = get_operation_names()
+
+        # Create an empty processor until a file is being modified
+        self.processor = subtitle_processor()
+
+        # Create the worker thread that loads, detects, and saves files off of the window's thread (and the lock that stops both threads using the processor at once)
+        self.worker = ThreadPoolExecutor(max_workers = 1)
+        self.processor_lock = threading.RLock()
+
+        # Create the thread that loads and detects the matches of the next files in the queue while the current file is being reviewed
+        self.prefetcher = ThreadPoolExecutor(max_workers = 1)
 
         # Initialize the various parts of the application
         self.setup_window()
@@ -136,6 +83,9 @@ class assister_application:
         # Run the application
         self.window.mainloop()
 
+        # Swap out the processor so that the worker thread stops scanning once the window has been closed
+        self.processor = subtitle_processor()
+
     ###
     #
     # View setup functions
@@ -212,6 +162,15 @@ class assister_application:
                 # Append the operation
                 self.drpOperation['menu'].add_command(label = operation, command = tk._setit(self.selected_operation, operation))
 
+        # Check to see if there are any saved pipelines
+        if 'pipelines' in self.config and len(self.config['pipelines']) > 0:
+            # Add a separator
+            self.drpOperation['menu'].add_separator()
+
+            # Iterate over each of the pipelines and append them
+            for pipeline in sorted(self.config['pipelines']):
+                self.drpOperation['menu'].add_command(label = self.pipeline_prefix + pipeline, command = tk._setit(self.selected_operation, self.pipeline_prefix + pipeline))
+
         # Add the options menu to the application
         self.drpOperation.pack(pady = 5, fill = X)
 
@@ -224,9 +183,13 @@ class assister_application:
 
         # Add the start and clear buttons
         tk.Button(frame, text = 'Start', command = self.start_operation).pack(pady = 5, fill = X)
+        self.btnCancel = tk.Button(frame, text = 'Cancel', command = self.cancel_operation)
+        self.btnCancel.configure(state = DISABLED)
+        self.btnCancel.pack(pady = 5, fill = X)
         tk.Button(frame, text = 'Clear', command = self.clear_application).pack(pady = 5, fill = X)
         tk.Button(frame, text = 'Reset Find and Replace', command = self.clear_find_and_replace).pack(pady = 5, fill = X)
         tk.Button(frame, text = 'Select favourite operations', command = self.select_favourite_operations).pack(pady = 5, fill = X)
+        tk.Button(frame, text = 'Create pipeline', command = self.create_pipeline).pack(pady = 5, fill = X)
 
         # Add the queue label
         tk.Label(frame, text = 'Progress', font = 'Helvetica 12 bold').pack(anchor = W, pady = 5)
@@ -252,11 +215,18 @@ class assister_application:
         # Create the frame to hold the file viewer and also vertical scroll bar
         main_view_frame = tk.Frame(frame)
 
-        # Create the main input area
+        # Create the main input area (the vertical scroll bar represents the whole file as only a window of sections is shown at a time)
         self.txtFileViewer = tk.Text(main_view_frame, wrap = NONE, state = DISABLED)
-        self.vsbFileViewer = ttk.Scrollbar(main_view_frame, command = self.txtFileViewer.yview, orient = VERTICAL)
+        self.vsbFileViewer = ttk.Scrollbar(main_view_frame, command = self.scroll_file_viewer, orient = VERTICAL)
         self.hsbFileViewer = ttk.Scrollbar(frame, command = self.txtFileViewer.xview, orient = HORIZONTAL)
-        self.txtFileViewer.configure(yscrollcommand = self.vsbFileViewer.set, xscrollcommand = self.hsbFileViewer.set)
+        self.txtFileViewer.configure(yscrollcommand = self.set_file_viewer_scrollbar, xscrollcommand = self.hsbFileViewer.set)
+
+        # Bind the mouse wheel so that the window of sections can be moved when scrolling past either end of it
+        for sequence in ['<MouseWheel>', '<Button-4>', '<Button-5>']:
+            self.txtFileViewer.bind(sequence, lambda event: self.window.after_idle(self.check_file_viewer_edges), add = '+')
+
+        # Initialize the window of sections shown in the file viewer
+        self.reset_file_viewer_window()
 
         # Place the file viewer on the page
         self.txtFileViewer.pack(side = LEFT, fill = BOTH, expand = True)
@@ -404,25 +374,38 @@ class assister_application:
             # Display a notice that there aren't any items to process currently
             mb.showerror(title = 'Queue Empty', message = 'Please add files to the queue before starting.')
         else:
-            # Disable the operations dropdown
+            # Disable the operations dropdown and enable the cancel button
             self.drpOperation.configure(state = DISABLED)
+            self.btnCancel.configure(state = NORMAL)
 
-            # Enable the view buttons
-            self.btnEdit.configure(state = NORMAL)
-            self.btnSkip.configure(state = NORMAL)
-            self.btnSkipAll.configure(state = NORMAL)
-            self.btnApprove.configure(state = NORMAL)
-            self.btnApproveAll.configure(state = NORMAL)
-            self.btnApproveAllFiles.configure(state = NORMAL)
+            # Grab the operations to perform on each file (more than one when a pipeline is selected)
+            self.pipeline_operations = self.get_selected_operations()
 
             # Check if performing the sanitization operation
-            if self.selected_operation.get() == 'Sanitize file':
+            if 'Sanitize file' in self.pipeline_operations:
                 # Enable the save sanitization button
                 self.btnSaveSanitization.configure(state = NORMAL)
 
+            # Reset the stats of the files
+            self.file_stats = []
+
             # Call the function that's used to handle changing the current file pointer
             self.change_file()
 
+    # The following function is used to handle cancelling the operation on the queue
+    def cancel_operation(self):
+        # Check to see if the rest of the files are being processed in the process pool
+        if len(self.file_futures) > 0:
+            # Cancel the files that haven't started processing yet (the monitor finishes up once the running files are done)
+            for future in self.file_futures:
+                future.cancel()
+
+            # Return to stop further processing
+            return
+
+        # Call the function to handle clearing the application (which swaps out the processor so the worker thread stops at its next chunk)
+        self.clear_application(clear_queue = False)
+
     # The following function is used to handle clearing the application
     def clear_application(self, clear_queue = True):
         # Check to see if the user would like to clear the queue also
@@ -439,6 +422,9 @@ class assister_application:
         self.drpOperation.configure(state = NORMAL)
         self.current_file_index = -1
 
+        # Call the function to handle dropping the files that have been prefetched
+        self.clear_prefetched_files()
+
         # Call the function that's used for clearing the file viewer items
         self.clear_file_viewer()
 
@@ -451,6 +437,7 @@ class assister_application:
         self.btnApproveAll.configure(state = DISABLED)
         self.btnApproveAllFiles.configure(state = DISABLED)
         self.btnSaveSanitization.configure(state = DISABLED)
+        self.btnCancel.configure(state = DISABLED)
 
         # Reset the progress bar
         self.pgbQueue['value'] = 0
@@ -517,12 +504,73 @@ class assister_application:
         # Call the function to handle saving the config to a local file
         self.write_config()
 
+    # The following function is used to allow the user to create a pipeline of operations that are performed on each file in order
+    def create_pipeline(self):
+        # Create and setup the initial dialog
+        pipeline_dialog = tk.Toplevel(self.window)
+        pipeline_dialog.title("Pipeline Creation")
+
+        # Add an opening title
+        tk.Label(pipeline_dialog, text = "Create a pipeline of operations!", font = ('Helvetica 12 bold')).pack(pady = 5, padx = 5, anchor = 'n')
+
+        # Add the name of the pipeline
+        tk.Label(pipeline_dialog, text = 'Name').pack(padx = 5, anchor = 'w')
+        pipeline_name = tk.StringVar(master = pipeline_dialog)
+        tk.Entry(pipeline_dialog, textvariable = pipeline_name).pack(padx = 5, fill = X)
+
+        # Add the dropdown of operations that can be added to the pipeline
+        tk.Label(pipeline_dialog, text = 'Operations (performed in order)').pack(padx = 5, pady = (5, 0), anchor = 'w')
+        pipeline_operation = tk.StringVar(master = pipeline_dialog, value = self.operations[0])
+        ttk.OptionMenu(pipeline_dialog, pipeline_operation, self.operations[0], *self.operations).pack(padx = 5, fill = X)
+
+        # Add the list of operations in the pipeline
+        lbxPipeline = tk.Listbox(pipeline_dialog, width = 60)
+        lbxPipeline.pack(padx = 5, pady = 5, fill = BOTH, expand = True)
+
+        # Append a few buttons
+        tk.Button(pipeline_dialog, text = 'Save', command = lambda: self.save_pipeline(pipeline_name.get(), list(lbxPipeline.get(0, END))) and pipeline_dialog.destroy(), width = 15, height = 2, font = 'Helvetica 9 bold').pack(side = RIGHT, padx = 5, pady = 10)
+        tk.Button(pipeline_dialog, text = 'Remove', command = lambda: [lbxPipeline.delete(index) for index in reversed(lbxPipeline.curselection())], width = 15, height = 2, font = 'Helvetica 9 bold').pack(side = RIGHT)
+        tk.Button(pipeline_dialog, text = 'Add', command = lambda: lbxPipeline.insert(END, pipeline_operation.get()), width = 15, height = 2, font = 'Helvetica 9 bold').pack(side = RIGHT, padx = 5)
+        tk.Button(pipeline_dialog, text = 'Close', command = lambda: pipeline_dialog.destroy(), width = 15, height = 2, font = 'Helvetica 9 bold').pack(side = RIGHT)
+
+    # The following function is used to handle saving a pipeline of operations to config (returning if it was saved)
+    def save_pipeline(self, name, operations):
+        # Check to see if the pipeline is missing its name or operations
+        if name.strip() == '' or len(operations) == 0:
+            # Display an error to the user
+            mb.showerror(title = 'Pipeline Not Saved', message = 'Please name the pipeline and add at least one operation to it.')
+
+            # Return False as the pipeline wasn't saved
+            return False
+
+        # Check to see if the config has a 'pipelines' option
+        if not 'pipelines' in self.config:
+            # Create the config value
+            self.config['pipelines'] = {}
+
+        # Check to see if the pipeline is new
+        if not name.strip() in self.config['pipelines']:
+            # Append the pipeline to the operations dropdown (adding a separator before the first pipeline)
+            if len(self.config['pipelines']) == 0:
+                self.drpOperation['menu'].add_separator()
+            self.drpOperation['menu'].add_command(label = self.pipeline_prefix + name.strip(), command = tk._setit(self.selected_operation, self.pipeline_prefix + name.strip()))
+
+        # Update the pipeline config value
+        self.config['pipelines'][name.strip()] = operations
+
+        # Call the function to handle saving the config to a local file
+        self.write_config()
+
+        # Return True as the pipeline was saved
+        return True
+
     # The folowing function is used to handle clearing the file viewer items
     def clear_file_viewer(self):
         # Clear file viewer items
         self.txtFileViewer.configure(state = NORMAL)
         self.txtFileViewer.delete(1.0, END)
         self.txtFileViewer.configure(state = DISABLED)
+        self.reset_file_viewer_window()
         self.txtOldSection.configure(state = NORMAL)
         self.txtOldSection.delete(1.0, END)
         self.txtOldSection.configure(state = DISABLED)
@@ -533,8 +581,7 @@ class assister_application:
         self.total_items = 0
         self.lblCurrentMatch['text'] = str(self.current_index)
         self.lblTotalMatched['text'] = str(self.total_items)
-        self.sections_to_modify = []
-        self.file_data = []
+        self.processor = subtitle_processor()
 
     # The following function is used to handle opening the new section for editing
     def edit_new_section(self, disabled = False):
@@ -553,11 +600,11 @@ class assister_application:
 
     # The following function is used to handle skipping the current section
     def previous_section(self):
-        # Grab the current operation the user would like to perform
-        current_operation = self.selected_operation.get()
+        # Grab the current operation being performed
+        current_operation = self.processor.operation
 
         # Update the current index to the previous pointer
-        self.current_index = self.current_index - ((self.section_spanning_operations[current_operation] if current_operation in self.section_spanning_operations.keys() else 1) * 2)
+        self.current_index = self.current_index - (get_operation(current_operation).span * 2)
 
         # Check to see if the current index is 0
         if self.current_index == 0:
@@ -569,92 +616,204 @@ class assister_application:
 
     # The following function is used to handle skipping all sections
     def skip_all_sections(self):
+        # Check to see if the rest of the matches are still being detected
+        if not self.processor.scan_complete:
+            # Disable the view buttons until the file has been scanned
+            self.toggle_view_buttons(DISABLED)
+
+            # Check back shortly
+            self.window.after(50, self.resume_file, self.processor, self.skip_all_sections)
+
+            # Return to stop further processing
+            return
+
         # Update the current index to dynamically pass all sections of the current file
-        self.current_index = len(self.sections_to_modify)
+        self.current_index = len(self.processor.sections_to_modify)
 
         # Call the function to handle setting up the data on the screen
         self.setup_data()
 
     # The following function is used to handle approving the current section
-    def approve_section(self, approve_all = False):
-        # Grab the current operation the user would like to perform
-        current_operation = self.selected_operation.get()
+    def approve_section(self):
+        # Call the function to handle applying the modifications in the new section viewer
+        self.apply_new_section()
+
+        # Correct the new section text area to not be editable
+        self.edit_new_section(disabled = True)
+
+        # Call the function to handle setting up the data on the screen
+        self.setup_data()
+
+    # The following function is used to handle applying the modifications in the new section viewer to the file
+    def apply_new_section(self):
+        # Grab the current operation being performed
+        current_operation = self.processor.operation
 
         # Grab the current modifications
         current_modifications = self.txtNewSection.get('1.0', END)
 
         # Check to see if the current operation is a section spanner
-        if current_operation in self.section_spanning_operations.keys():
+        if get_operation(current_operation).span > 1:
             # Break the spanning sections
             sectional_modifications = current_modifications.split('\n\n')
 
             # Reset the current index
-            section_index = self.current_index - self.section_spanning_operations[current_operation]
+            section_index = self.current_index - get_operation(current_operation).span
+        else:
+            # Treat the modifications as a single section
+            sectional_modifications = [current_modifications]
+
+            # Reset the current index
+            section_index = self.current_index - 1
 
+        # Create a list to hold the modified sections
+        modified_sections = []
+
+        # Hold the processor while the sections are updated (the worker thread waits between chunks of the scan)
+        with self.processor_lock:
             # Iterate over each of the sections and handle accordingly
-            for section in sectional_modifications:
+            for section_offset, section in enumerate(sectional_modifications):
                 # Handle further modifications to the current modified section
                 current_modifications = section.split('\n')
                 current_modifications = [x for x in current_modifications if x != '\n' and x != '\n\n']
                 current_modifications = list(filter(None, current_modifications))
-                current_modifications = {'index': current_modifications[0], 'time': current_modifications[1], 'text': current_modifications[2:]}
-
-                # Grab the current file_data index and update the text section with the new edits
-                current_line_index = self.sections_to_modify[section_index]['index']
-                current_section = [section for section in self.file_data if section['index'] == current_line_index][0]
-                current_section['text'] = current_modifications['text']
+                modified_sections.append(subtitle_cue(self.processor.sections_to_modify[section_index + section_offset].index, current_modifications[1], current_modifications[2:]))
 
-                # Check to see if the current section modifies the time stamps
-                if current_operation == 'Fix time overlaps':
-                    # Handle updating the time as well
-                    current_section['time'] = current_modifications['time']
+            # Call the function to handle updating the respective sections of the file with the new edits and re-detecting the pending matches around them
+            self.processor.approve_match(section_index, modified_sections)
 
-                # Check to see if the section ends up blank
-                if len(current_section['text']) == 0:
-                    # Remove the current section
-                    self.file_data = [section for section in self.file_data if section['index'] != current_line_index]
+        # Call the function to handle updating the total matched label as the pending matches could have changed
+        self.update_total_matched()
 
-                # Increment the section index pointer
-                section_index = section_index + 1
-        else:
-            # Handle further modifications to the current modifications pointer
-            current_modifications = current_modifications.split('\n')
-            current_modifications = [x for x in current_modifications if x != '\n' and x != '\n\n']
-            current_modifications = list(filter(None, current_modifications))
-            current_modifications = {'index': current_modifications[0], 'time': current_modifications[1], 'text': current_modifications[2:]}
-
-            # Grab the current file_data index and update the text section with the new edits
-            current_line_index = self.sections_to_modify[self.current_index - 1]['index']
-            current_section = [section for section in self.file_data if section['index'] == current_line_index][0]
-            current_section['text'] = current_modifications['text']
-
-            # Check to see if the section ends up blank
-            if len(current_section['text']) == 0:
-                # Remove the current section
-                self.file_data = [section for section in self.file_data if section['index'] != current_line_index]
+    # The following function is used to handle approving all sections
+    def approve_all_sections(self):
+        # Call the function to handle applying the modifications in the new section viewer (the rest of the sections are approved without being shown)
+        self.apply_new_section()
 
-        # Correct the new section text area to not be editable
+        # Correct the new section text area to not be editable and disable the view buttons while the rest of the file is approved
         self.edit_new_section(disabled = True)
+        self.toggle_view_buttons(DISABLED)
 
-        # Call the function to handle setting up the data on the screen
-        self.setup_data(approve_all = approve_all)
+        # Grab the processor of the file
+        processor = self.processor
 
-    # The following function is used to handle approving all sections
-    def approve_all_sections(self):
-        # Call the function to handle approving the current section - and passalong that the user wan't to approve all sections
-        self.approve_section(approve_all = True)
+        # Call the function to handle approving the rest of the operation's matches on the worker thread before moving onto the next operation (or saving the file once and changing to the next file)
+        self.run_in_background(self.approve_rest_of_operation, lambda approved: self.resume_file(processor, self.finish_operation), processor, self.current_index)
 
     # The following function is used to handle approving all files in the queue
     def approve_all_files(self):
-        # Iterate over each of the sections approving and changing the file
-        for file in self.selected_files:
-            # Call the function to handle approving the current section - and passalong that the user wan't to approve all sections
-            self.approve_section(approve_all = True)
+        # Disable the view buttons while the files are processed
+        self.btnEdit.configure(state = DISABLED)
+        self.btnPrevious.configure(state = DISABLED)
+        self.btnSkip.configure(state = DISABLED)
+        self.btnSkipAll.configure(state = DISABLED)
+        self.btnApprove.configure(state = DISABLED)
+        self.btnApproveAll.configure(state = DISABLED)
+        self.btnApproveAllFiles.configure(state = DISABLED)
+
+        # Call the function to handle applying the modifications in the new section viewer
+        self.apply_new_section()
+
+        # Grab the processor and file being modified
+        processor = self.processor
+        file = self.selected_files[self.current_file_index]
+
+        # Call the function to handle approving the rest of the current file and saving it on the worker thread before moving onto the remaining files
+        self.run_in_background(self.approve_rest_of_file, lambda saved: self.approve_remaining_files(processor, file), processor, self.current_index, file)
+
+    # The following function is used to handle approving the rest of the current operation's matches (ran on the worker thread)
+    def approve_rest_of_operation(self, processor, start_index):
+        # Hold the processor while the rest of the matches are approved
+        with self.processor_lock:
+            # Call the function to handle approving the rest of the matches
+            processor.auto_approve(start_index)
+
+    # The following function is used to handle approving the rest of a file (including each pending operation of a pipeline) and saving it (ran on the worker thread)
+    def approve_rest_of_file(self, processor, start_index, file):
+        # Hold the processor while the rest of the file is approved
+        with self.processor_lock:
+            # Call the function to handle approving the rest of the file
+            processor.auto_approve_pipeline(start_index)
+
+            # Call the function to handle saving the modifications to the file
+            return processor.save_modifications(file)
+
+    # The following function is used to handle fanning the remaining files in the queue out over the process pool once the current file has been approved
+    def approve_remaining_files(self, processor, file):
+        # Check to see if the operation has been cancelled
+        if processor is not self.processor:
+            # Return to stop further processing
+            return
+
+        # Call the function to handle updating the total matched label
+        self.update_total_matched()
+
+        # Call the function to handle dropping the files that have been prefetched (the process pool handles the rest of the queue)
+        self.clear_prefetched_files()
+
+        # Create the summary of the processed files (with the matches of each operation when performing a pipeline) and store the stats of the current file
+        self.file_summaries = [{'file': file, 'status': 'complete', 'matches': processor.get_matches_by_operation() if len(self.pipeline_operations) > 1 else self.total_items // processor.get_section_span()}]
+        self.file_stats.append(processor.get_stats())
+
+        # Create the process pool with the configured amount of workers
+        self.file_executor = ProcessPoolExecutor(max_workers = self.config['workers'] if 'workers' in self.config else None, initializer = load_plugins, initargs = (self.config['operation_plugins'] if 'operation_plugins' in self.config else None,))
+
+        # Check to see if a pipeline is being performed
+        if len(self.pipeline_operations) > 1:
+            # Fan the remaining files out over the process pool (the cache only holds the results of single operations)
+            self.file_futures = {self.file_executor.submit(process_pipeline_file, file, self.pipeline_operations, self.find_and_replace, None, self.config['memory_map_files'] if 'memory_map_files' in self.config else False, self.config['fsync_saves'] if 'fsync_saves' in self.config else False, self.config['columnar_detection'] if 'columnar_detection' in self.config else False): file for file in self.selected_files[(self.current_file_index + 1):]}
+        else:
+            # Fan the remaining files out over the process pool
+            self.file_futures = {self.file_executor.submit(process_file, file, self.pipeline_operations[0], self.find_and_replace, None, self.config['memory_map_files'] if 'memory_map_files' in self.config else False, self.config['fsync_saves'] if 'fsync_saves' in self.config else False, subtitle_cache.default_path if 'cache_results' in self.config and self.config['cache_results'] else None, self.config['columnar_detection'] if 'columnar_detection' in self.config else False): file for file in self.selected_files[(self.current_file_index + 1):]}
+
+        # Call the function to handle monitoring the progress of the files
+        self.monitor_all_files()
+
+    # The following function is used to handle monitoring the files being processed in the process pool
+    def monitor_all_files(self):
+        # Iterate over each of the files that have finished processing
+        for future in [future for future in self.file_futures if future.done()]:
+            # Attempt to append the summary of the file (noting if it was cancelled or couldn't be handled)
+            try:
+                self.file_summaries.append(future.result() if not future.cancelled() else {'file': self.file_futures[future], 'status': 'cancelled'})
+            except Exception as error:
+                self.file_summaries.append(get_error_summary(self.file_futures[future], error))
+
+            # Stop tracking the file
+            del self.file_futures[future]
+
+            # Check to see if the file has stats
+            if 'stats' in self.file_summaries[-1]:
+                # Store the stats of the file
+                self.file_stats.append(self.file_summaries[-1]['stats'])
+
+        # Update the progressbar with the current status
+        self.pgbQueue['value'] = abs((len(self.file_summaries) / len(self.selected_files)) * 100)
+
+        # Check to see if there are still files being processed
+        if len(self.file_futures) > 0:
+            # Check back on the files shortly
+            self.window.after(100, self.monitor_all_files)
+
+            # Return to stop further processing
+            return
+
+        # Shut down the process pool
+        self.file_executor.shutdown()
+
+        # Create the per-file summary message
+        summary_message = '\n'.join(os.path.basename(summary['file']) + ': ' + (self.format_matches(summary['matches']) if summary['status'] == 'complete' else ('cancelled' if summary['status'] == 'cancelled' else ('failed, skipped (' + summary['error'] + ')' if summary['status'] == 'error' else 'missing, skipped'))) for summary in self.file_summaries)
+
+        # Display a notice to the user
+        mb.showinfo(title = 'Queue Complete', message = 'Operation complete successfully!\n\n' + summary_message + self.report_stats())
+
+        # Call the function to handle clearing the application
+        self.clear_application(clear_queue = False)
 
     # The following function is used to handle approving all sections
     def save_sanitization(self):
-        # Call the function to handle saving the modifications to the file
-        self.save_modifications()
+        # Call the function to handle saving the modifications to the file on the worker thread (even if nothing has changed so that the file is rewritten cleanly)
+        self.run_in_background(self.processor.save_modifications, None, self.selected_files[self.current_file_index], True)
 
     ###
     #
@@ -662,8 +821,50 @@ class assister_application:
     #
     ###
 
+    # The following function is used to handle grabbing the operations to perform on each file from the selected operation (the operations of a pipeline in order when one is selected)
+    def get_selected_operations(self):
+        # Grab the selected operation
+        selected_operation = self.selected_operation.get()
+
+        # Check to see if a saved pipeline was selected
+        if selected_operation.startswith(self.pipeline_prefix) and 'pipelines' in self.config and selected_operation[len(self.pipeline_prefix):] in self.config['pipelines']:
+            # Return the operations of the pipeline
+            return list(self.config['pipelines'][selected_operation[len(self.pipeline_prefix):]])
+
+        # Return the selected operation on its own
+        return [selected_operation]
+
+    # The following function is used to handle formatting the matches of a file to be displayed (listing the matches of each operation when a pipeline was performed)
+    def format_matches(self, matches):
+        # Check to see if the matches are for each operation of a pipeline
+        if isinstance(matches, dict):
+            # Return the matches of each operation
+            return ', '.join('{operation} {matches} match(es)'.format(operation = operation, matches = operation_matches) for operation, operation_matches in matches.items())
+
+        # Return the matches
+        return str(matches) + ' match(es)'
+
+    # The following function is used to handle writing the stats of the files to the configured file (if there is one) and grabbing the summary of them to display
+    def report_stats(self):
+        # Check to see if the stats should be written to a file
+        if 'stats_file' in self.config and self.config['stats_file']:
+            # Attempt to write the stats of each file
+            try:
+                write_stats(self.file_stats, self.config['stats_file'])
+            except OSError as error:
+                # Display an error to the user
+                mb.showerror(title = 'Stats Not Saved', message = 'The stats could not be written to ' + self.config['stats_file'] + '.\n\n' + str(error))
+
+        # Return the summary of the stats (if any files were handled)
+        return '\n\n' + '\n'.join(format_summary(self.file_stats)) if len(self.file_stats) > 0 else ''
+
     # The following function is used to handle changing the current file that's being modified
     def change_file(self):
+        # Check to see if a file was being modified
+        if self.current_file_index >= 0 and self.processor.stats['file'] is not None:
+            # Store the stats of the file
+            self.file_stats.append(self.processor.get_stats())
+
         # Update the file index pointer
         self.current_file_index = self.current_file_index + 1
 
@@ -672,8 +873,8 @@ class assister_application:
             # Update the current progress to be 100%
             self.pgbQueue['value'] = 100
 
-            # Display a notice to the user
-            mb.showinfo(title = 'Queue Complete', message = 'Operation complete successfully!')
+            # Display a notice to the user (along with the stats of the files)
+            mb.showinfo(title = 'Queue Complete', message = 'Operation complete successfully!' + self.report_stats())
 
             # Call the function to handle clearing the application
             self.clear_application(clear_queue = False)
@@ -698,203 +899,120 @@ class assister_application:
 
     # The following function is used to handle operating & loading the data into the sections and getting user input
     def modify_file(self, file):
+        # Disable the view buttons while the file is loaded
+        self.toggle_view_buttons(DISABLED)
+
+        # Grab the file if it has been prefetched
+        prefetched_file = self.prefetched_files.pop(self.current_file_index, None)
+
+        # Check to see if the file has been prefetched
+        if prefetched_file is not None and prefetched_file[0] == file:
+            # Swap out the processor so that anything still running for the previous file stops
+            self.processor = subtitle_processor()
+            processor = self.processor
+
+            # Call the function to handle starting on the prefetched file once it has finished loading and detecting
+            self.watch_background(prefetched_file[1], lambda result: self.start_prefetched_file(processor, file, *result))
+
+            # Return to stop further processing
+            return
+
+        # Create the processor that handles the operations for the file (starting with the first operation of a pipeline)
+        self.processor = subtitle_processor(self.pipeline_operations[0], self.find_and_replace, False, self.config['fsync_saves'] if 'fsync_saves' in self.config else False, self.config['columnar_detection'] if 'columnar_detection' in self.config else False)
+        self.processor.pending_operations = self.pipeline_operations[1:]
+        processor = self.processor
+
+        # Call the function to handle loading the data from the file on the worker thread before starting on it
+        self.run_in_background(processor.load_data, lambda loaded: self.start_file(processor, file, loaded), file)
+
+    # The following function is used to handle loading a file and detecting all of its matches ahead of time (ran on the prefetch thread)
+    def prefetch_file(self, file, operations, find_and_replace):
+        # Grab when the file was last modified (so that it can be loaded again if it changes before it's reached)
+        modified_time = os.path.getmtime(file) if os.path.exists(file) else None
+
+        # Create the processor that handles the operations for the file (only the matches of the first operation can be detected ahead of time)
+        processor = subtitle_processor(operations[0], find_and_replace, False, self.config['fsync_saves'] if 'fsync_saves' in self.config else False, self.config['columnar_detection'] if 'columnar_detection' in self.config else False)
+        processor.pending_operations = operations[1:]
+
         # Call the function to handle loading the data from the file
-        if self.load_data(file) == False:
-            # Call the function to change to the next file
-            self.change_file()
+        loaded = processor.load_data(file)
+
+        # Check to see if the file was loaded
+        if loaded:
+            # Call the function to handle detecting all of the matches
+            processor.start_matches()
+            processor.fill_matches()
+
+        # Return the processor, if the file was loaded, and when it was last modified
+        return (processor, loaded, modified_time)
+
+    # The following function is used to handle prefetching the next files in the queue (as set in the config) while the current file is being reviewed
+    def prefetch_next_files(self):
+        # Grab the amount of files to prefetch
+        prefetch_files = self.config['prefetch_files'] if 'prefetch_files' in self.config else 1
+
+        # Drop the prefetched files that are no longer ahead of the current file (keeping the memory used bounded)
+        for file_index in [file_index for file_index in self.prefetched_files if file_index <= self.current_file_index or file_index > self.current_file_index + prefetch_files]:
+            self.prefetched_files.pop(file_index)[1].cancel()
+
+        # Iterate over each of the next files in the queue
+        for file_index in range(self.current_file_index + 1, min(self.current_file_index + prefetch_files + 1, len(self.selected_files))):
+            # Check to see if the file hasn't been prefetched yet
+            if file_index not in self.prefetched_files:
+                # Prefetch the file with a copy of the find and replace values (so that it can be checked if they change before the file is reached)
+                self.prefetched_files[file_index] = (self.selected_files[file_index], self.prefetcher.submit(self.prefetch_file, self.selected_files[file_index], self.pipeline_operations, dict(self.find_and_replace)))
+
+    # The following function is used to handle dropping the files that have been prefetched
+    def clear_prefetched_files(self):
+        # Iterate over each of the prefetched files and cancel them if they haven't started
+        for prefetched_file in self.prefetched_files.values():
+            prefetched_file[1].cancel()
+
+        # Reset the prefetched files
+        self.prefetched_files = {}
+
+    # The following function is used to handle starting on a file that has been prefetched
+    def start_prefetched_file(self, processor, file, prefetched_processor, loaded, modified_time):
+        # Check to see if the operation has been cancelled
+        if processor is not self.processor:
+            # Return to stop further processing
+            return
+
+        # Check to see if the file or the find and replace values have changed since the file was prefetched
+        if (os.path.getmtime(file) if os.path.exists(file) else None) != modified_time or prefetched_processor.find_and_replace != self.find_and_replace:
+            # Call the function to handle loading the file again
+            self.modify_file(file)
 
             # Return to stop further processing
             return
 
-        # Call the function to handle checking if the file has any sections to edit based on the operation
-        self.parse_file()
+        # Use the prefetched processor (using the current find and replace values as they'd be for a file that wasn't prefetched)
+        self.processor = prefetched_processor
+        self.processor.find_and_replace = self.find_and_replace
 
-        # Call the function that is used to handle setting up the data for confirmation and modification
-        self.setup_data()
+        # Call the function to handle starting on the file (skipping the detection as it has already been done)
+        self.start_file(self.processor, file, loaded, prefetched = True)
 
-    # The following function is used to handle loading the data from the file
-    def load_data(self, file):
-        # Check to see if the file exists
-        if not os.path.exists(file):
+    # The following function is used to handle starting on a file once it has been loaded
+    def start_file(self, processor, file, loaded, prefetched = False):
+        # Check to see if the operation has been cancelled
+        if processor is not self.processor:
+            # Return to stop further processing
+            return
+
+        # Check to see if the file failed to load
+        if loaded == False:
             # Display an error message
             mb.showerror(title = 'File Missing', message = os.path.basename(file) + ' is missing. Skipping.')
 
-            # Return False as the file wasn't found
-            return False
-        else:
-            # Grab the current operation the user would like to perform
-            current_operation = self.selected_operation.get()
-
-            # Load the file contents
-            with open(file, 'r', encoding = 'utf-8-sig') as file:
-                # Create a dictionary that holds the line number and line number
-                line_numbers = dict((line_text.split('\n')[0], line_number) for line_number, line_text in enumerate(file, 1) if line_text.split('\n')[0].isnumeric())
-
-                # Seek back to the start of the file
-                file.seek(0)
-
-                # Check to see if converting a vtt to srt file
-                if current_operation == 'Convert vtt to srt':
-                    # Skip the first three lines of the file as they're header information
-                    file.seek(sum([len(line) for line in file.readlines()[0:3]]))
-
-                # Grab the file content
-                file_content = file.read()
-
-                # Split the data into a list
-                self.file_data = file_content.split('\n\n') # Split the file based on any double new lines
-                self.file_data = [x for x in self.file_data if x != '\n' and x != '\n\n'] # Filter out any remaining new lines or double new lines
-                self.file_data = list(filter(None, self.file_data)) # Filter out any empty stings
-                self.file_data = [x for x in self.file_data if len(list(filter(None, x.split('\n')))) >= 3] # Filter out any lines that have no text
-                has_index = list(filter(None, self.file_data[0].split('\n')))[0].isnumeric()
-                index = 0
-                self.file_data = [
-                    {
-                        'index': list(filter(None, section.split('\n')))[0] if has_index else str(index := index + 1),
-                        'time': list(filter(None, section.split('\n')))[1 if has_index else 0],
-                        'text': list(filter(None, section.split('\n')))[2:] if has_index else list(filter(None, section.split('\n')))[1:],
-                        'line_number': line_numbers[list(filter(None, section.split('\n')))[0]] if has_index else index
-                    } for section in self.file_data
-                ]
-
-                # Load the main data into the file viewer
-                self.txtFileViewer.configure(state = 'normal')
-                self.txtFileViewer.delete(1.0, END)
-                self.txtFileViewer.insert(END, file_content)
-                self.txtFileViewer.configure(state = 'disabled')
-
-    # The following function is used to handle parsing the respective file
-    def parse_file(self):
-        # Grab the current operation the user would like to perform
-        current_operation = self.selected_operation.get()
-
-        # Create a variable that will handle storing sections that need modifying
-        sections_to_modify = []
-
-        # Check to see if the user is removing uppercase sentances
-        if current_operation == 'Add dashes to split lines (lowercase)':
-            # Iterrate over each of the sections in the file
-            for section_index, section_data in enumerate(self.file_data):
-                # Check to see if the current section isn't the last section in the file
-                if not section_index == (len(self.file_data) - 1):
-                    # Create variables that represent different cases
-                    positive_first_section = regex.search(self.regex_statements[current_operation]['positive_first_section'], section_data['text'][-1].strip()) # Determine if the last line in the first section is correctly formatted as a "split line with a dash"
-                    negative_first_section = regex.search(self.regex_statements[current_operation]['negative_first_section'], section_data['text'][-1].strip()) # Determine if the last line in the first section is incorrectly formatted as a "split line with a dash"
-                    positive_second_section = regex.search(self.regex_statements[current_operation]['positive_second_section'], self.file_data[section_index + 1]['text'][0].strip()) # Determine if the first line in the second section is correctly formatted as a "split line with a dash"
-                    negative_second_section = regex.search(self.regex_statements[current_operation]['negative_second_section'], self.file_data[section_index + 1]['text'][0].strip()) # Determine if the first line in the second section is incorrectly formatted as a "split line with a dash"
-
-                    # Check to see if either of the sections need correcting
-                    if not bool(positive_first_section and positive_second_section) and (bool(negative_first_section and negative_second_section) or bool(positive_first_section and negative_second_section) or bool(negative_first_section and positive_second_section)):
-                        # Append the sections to the list that will hold the sections that need correcting
-                        sections_to_modify.append(section_data)
-                        sections_to_modify.append(self.file_data[section_index + 1])
-        elif current_operation == 'Add dashes to split lines (uppercase)':
-            # Iterrate over each of the sections in the file
-            for section_index, section_data in enumerate(self.file_data):
-                # Check to see if the current section isn't the last section in the file
-                if not section_index == (len(self.file_data) - 1):
-                    # Create variables that represent different cases
-                    positive_first_section = regex.search(self.regex_statements[current_operation]['positive_first_section'], section_data['text'][-1].strip()) # Determine if the last line in the first section is correctly formatted as a "split line with a dash"
-                    negative_first_section = regex.search(self.regex_statements[current_operation]['negative_first_section'], section_data['text'][-1].strip()) # Determine if the last line in the first section is incorrectly formatted as a "split line with a dash"
-                    positive_second_section = regex.search(self.regex_statements[current_operation]['positive_second_section'], self.file_data[section_index + 1]['text'][0].strip()) # Determine if the first line in the second section is correctly formatted as a "split line with a dash"
-                    negative_second_section = regex.search(self.regex_statements[current_operation]['negative_second_section'], self.file_data[section_index + 1]['text'][0].strip()) # Determine if the first line in the second section is incorrectly formatted as a "split line with a dash"
-
-                    # Check to see if either of the sections need correcting
-                    if not bool(positive_first_section and positive_second_section) and (bool(negative_first_section and negative_second_section) or bool(positive_first_section and negative_second_section) or bool(negative_first_section and positive_second_section)):
-                        # Append the sections to the list that will hold the sections that need correcting
-                        sections_to_modify.append(section_data)
-                        sections_to_modify.append(self.file_data[section_index + 1])
-        elif current_operation == 'Add missing italics':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Count number of occurances in text
-                opening_italics = sum(line.count('<i>') for line in section['text'])
-                closing_italics = sum(line.count('</i>') for line in section['text'])
-
-                # Check to see if there's a line that needs handling
-                if opening_italics != closing_italics and not (section['text'][-1].endswith('<i>') or section['text'][-1].endswith('</i>')):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Add space after line starting dash':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Add space after line starting dash and lowercase character':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Add space after line starting dash and three dots':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Add space after line starting dash and uppercase character':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Capitalize, add a period, and space people abbreviations':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Convert vtt to srt':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Append the section to the list that will hold the sections that need correcting
-                sections_to_modify.append(section)
-        elif current_operation == 'Edit full uppercase lines':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(line.isupper() for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Edit lines with colon immediately after a letter':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Edit lines with two or more consecutive uppercase characters':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Edit lines that don\'t have line ending punctuation':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if regex.search(self.regex_statements[current_operation], section['text'][-1]):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Edit lines that don\'t have line ending punctuation (add dashes)':
-            # Iterrate over each of the sections in the file
-            for section_index, section_data in enumerate(self.file_data):
-                # Check to see if the current section isn't the last section in the file
-                if not section_index == (len(self.file_data) - 1):
-                    # Check to see if there's a line that needs handling
-                    if regex.search(self.regex_statements[current_operation], section_data['text'][-1].strip()):
-                        # Append the sections to the list that will hold the sections that need correcting
-                        sections_to_modify.append(section_data)
-                        sections_to_modify.append(self.file_data[section_index + 1])
-        elif current_operation == 'Find and replace':
-            # Ask the user for a work or string to find and replace
+            # Call the function to change to the next file
+            self.change_file()
+
+            # Return to stop further processing
+            return
+
+        # Check to see if the user is finding and replacing (on its own or as part of a pipeline)
+        if 'Find and replace' in self.pipeline_operations:
             # Check to see if the find value is missing
             if self.find_and_replace['find'] == "":
                 # Ask for the "find" value
@@ -907,828 +1025,376 @@ class assister_application:
                 # Update the find and replace values
                 self.find_and_replace['replace'] = replace_value if replace_value != "" else None
 
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(self.find_and_replace['find'] in line for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Fix time overlaps':
-             # Iterrate over each of the sections in the file
-            for section_index, section_data in enumerate(self.file_data):
-                # Check to see if the current section isn't the last section in the file
-                if not section_index == (len(self.file_data) - 1):
-                    # Grab the respective time values
-                    first_section_end = datetime.strptime(section_data['time'].split(' --> ')[-1].strip(), "%H:%M:%S,%f")
-                    second_section_start = datetime.strptime(self.file_data[section_index + 1]['time'].split(' --> ')[0].strip(), "%H:%M:%S,%f")
-
-                    # Check to see if the section section starts before the end of the first section
-                    if second_section_start < first_section_end:
-                        # Append the sections to the list that will hold the sections that need correcting
-                        sections_to_modify.append(section_data)
-                        sections_to_modify.append(self.file_data[section_index + 1])
-        elif current_operation == 'Remove full uppercase lines':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(line.isupper() for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Remove line ending dash':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text'] if line == section['text'][-1]):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Remove lines with two or more consecutive uppercase characters':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Remove sections that don\'t have line ending punctuation':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if regex.search(self.regex_statements['Edit lines that don\'t have line ending punctuation'], section['text'][-1]):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Remove space after three dots':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Remove space after three dots and a lowercase word':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Remove space after three dots and an uppercase word':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text']):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Remove spaced dashes from split lines':
-            # Iterrate over each of the sections in the file
-            for section_index, section_data in enumerate(self.file_data):
-                # Check to see if this section isn't the last section of the file
-                if not section_index == (len(self.file_data) - 1):
-                    # Parse the various sections to see if they match the criteria
-                    first_section_dash_ending = regex.search(self.regex_statements[current_operation]['first_section_dash_ending'], section_data['text'][-1].strip())
-                    second_section_dash_starting = regex.search(self.regex_statements[current_operation]['second_section_dash_starting'], self.file_data[section_index + 1]['text'][0].strip())
-                    first_section_spaced_dash_ending = regex.search(self.regex_statements[current_operation]['first_section_spaced_dash_ending'], section_data['text'][-1].strip())
-                    second_section_dash_spaced_starting = regex.search(self.regex_statements[current_operation]['second_section_dash_spaced_starting'], self.file_data[section_index + 1]['text'][0].strip())
-
-                    # Check to see if the appropriate sections meet the requirements
-                    if (first_section_dash_ending and second_section_dash_starting) and (first_section_spaced_dash_ending or second_section_dash_spaced_starting):
-                        # Append the sections to the list that will hold the sections that need correcting
-                        sections_to_modify.append(section_data)
-                        sections_to_modify.append(self.file_data[section_index + 1])
-        elif current_operation == 'Remove spaced line ending dash':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text'] if line == section['text'][-1]):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Remove spaced line starting dash':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if any(regex.search(self.regex_statements[current_operation], line) for line in section['text'] ):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-        elif current_operation == 'Replace dashes with three dots for quick lines':
-            # Iterrate over each of the sections in the file
-            for section_index, section_data in enumerate(self.file_data):
-                # Check to see if the current section isn't the last section in the file
-                if not section_index == (len(self.file_data) - 1):
-                    # Create variables that represent different cases
-                    positive_first_section = regex.search(self.regex_statements['Add dashes to split lines (lowercase)']['positive_first_section'], section_data['text'][-1].strip()) # Determine if the last line in the first section is correctly formatted as a "split line with a dash"
-                    positive_second_section = regex.search(self.regex_statements['Add dashes to split lines (lowercase)']['positive_second_section'], self.file_data[section_index + 1]['text'][0].strip()) or regex.search(self.regex_statements['Add dashes to split lines (uppercase)']['positive_second_section'], self.file_data[section_index + 1]['text'][0].strip()) # Determine if the first line in the second section is correctly formatted as a "split line with a dash"
-                    first_section_end = datetime.strptime(section_data['time'].split(' --> ')[-1].strip(), "%H:%M:%S,%f")
-                    second_section_start = datetime.strptime(self.file_data[section_index + 1]['time'].split(' --> ')[0].strip(), "%H:%M:%S,%f")
-                    section_delta = second_section_start - first_section_end
-
-                    # Check to see if the sections are quick and need correcting
-                    if bool(positive_first_section and positive_second_section) and (section_delta >= timedelta(seconds=1, microseconds=200000) and section_delta <= timedelta(seconds=10, microseconds=0)):
-                        # Append the sections to the list that will hold the sections that need correcting
-                        sections_to_modify.append(section_data)
-                        sections_to_modify.append(self.file_data[section_index + 1])
-        elif current_operation == 'Sanitize file':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Append the section as it needs modification
-                sections_to_modify.append(section)
-        elif current_operation == 'Trim long lines':
-            # Iterrate over each of the sections in the file
-            for section in self.file_data:
-                # Check to see if there's a line that needs handling
-                if (any(len(line) > 45 for line_index, line in enumerate(section['text']) if not line_index == (len(section['text']) - 1)) and not any(regex.search(self.regex_statements['Remove spaced dashes from split lines']['second_section_dash_starting'], line) for line_index, line in enumerate(section['text']) if not line_index == (len(section['text']) - 1)) or (any(regex.search(self.regex_statements[current_operation], line) for line_index, line in enumerate(section['text']) if not line_index == (len(section['text']) - 1)))):
-                    # Append the section to the list that will hold the sections that need correcting
-                    sections_to_modify.append(section)
-
-        # Update the total matched label with the amount of sections to process
-        self.total_items = len(sections_to_modify)
-        self.lblTotalMatched['text'] = str(self.total_items)
+        # Check to see if the matches haven't already been detected while the file was prefetched
+        if not prefetched:
+            # Call the function to handle starting the detection of the sections to edit based on the operation
+            processor.start_matches()
 
-        # Set the sections to be modified to the class
-        self.sections_to_modify = sections_to_modify
+            # Call the function to handle detecting the matches on the worker thread
+            self.worker.submit(self.scan_file, processor)
 
-    # The following function is used to handle setting up the data to have changes confirmed and modified if needed
-    def setup_data(self, approve_all = False):
-        # Grab the current operation the user would like to perform
-        current_operation = self.selected_operation.get()
+        # Call the function to handle showing the start of the file in the file viewer
+        self.render_file_viewer(0)
 
-        # Check to see if the current index is greater than 0
-        if self.current_index > 0:
-            # Disable the previous button to avoid issues
-            self.btnPrevious.configure(state = NORMAL)
+        # Call the function to handle keeping the total matched label up to date as the matches are detected
+        self.monitor_scan(processor)
 
-        # Check to see if the file has been fully modified
-        if self.current_index >= len(self.sections_to_modify):
-            # Call the function to handle saving the modifications to the file
-            self.save_modifications()
+        # Call the function to handle prefetching the next files in the queue while this one is reviewed
+        self.prefetch_next_files()
 
-            # Call the function that's used to handle changing to the next file
-            self.change_file()
+        # Call the function that is used to handle setting up the data for confirmation and modification (waiting on the first match if need be)
+        self.setup_data()
 
+    # The following function is used to handle detecting the matches of a file a chunk at a time until the whole file has been scanned (ran on the worker thread)
+    def scan_file(self, processor):
+        # Continue scanning until the file is done
+        while True:
+            # Hold the processor while the next chunk is scanned (so the window only waits on a single chunk)
+            with self.processor_lock:
+                # Check to see if the file has changed or has been fully scanned
+                if processor is not self.processor or processor.scan_complete:
+                    # Return to stop further processing
+                    return
+
+                # Call the function to handle scanning the next chunk of sections
+                processor.scan_matches(2000)
+
+    # The following function is used to handle updating the total matched label while a file is being scanned
+    def monitor_scan(self, processor):
+        # Check to see if the file has changed
+        if processor is not self.processor:
             # Return to stop further processing
             return
 
-        # Grab the current and next data data to handle
-        current_data = self.sections_to_modify[self.current_index]
-        next_data = self.sections_to_modify[self.current_index + 1] if current_operation in self.section_spanning_operations.keys() else None
+        # Call the function to handle updating the total matched label
+        self.update_total_matched()
 
-        # Calculate the ending index to highlight
-        highlight_end_index = ((next_data['line_number'] + (len(next_data) - 2) + len(next_data['text']))) if current_operation in self.section_spanning_operations.keys() and not next_data == None else (current_data['line_number'] + (len(current_data) - 2) + len(current_data['text']))
+        # Check to see if the file still hasn't been fully scanned
+        if not processor.scan_complete:
+            # Check back shortly
+            self.window.after(100, self.monitor_scan, processor)
 
-        # Call the function to handle highlighting the text and scrolling to it if need be
-        self.highlight_and_view(current_data['line_number'], highlight_end_index)
+    # The following function is used to handle running a function on the worker thread and calling the callback with its result once it has finished
+    def run_in_background(self, function, callback, *arguments):
+        # Submit the function to the worker thread and call the function to handle watching for it to finish
+        self.watch_background(self.worker.submit(function, *arguments), callback)
 
-        # Remove the line_number from the data array
-        current_data_line_number = current_data.pop('line_number')
+    # The following function is used to handle watching for a function on the worker thread to finish (so that the result is handled on the window's thread)
+    def watch_background(self, future, callback):
+        # Check to see if the function is still running
+        if not future.done():
+            # Check back shortly
+            self.window.after(50, self.watch_background, future, callback)
 
-        # Create a variable that will store the next_data's line number
-        next_data_line_number = None
+            # Return to stop further processing
+            return
 
-        # Update the current_data's text to be joined
-        current_data['text'] = '\n'.join(current_data['text'])
+        # Grab the result (raising any error from the worker thread here)
+        result = future.result()
+
+        # Check to see if there's a callback
+        if callback is not None:
+            # Call the callback with the result
+            callback(result)
+
+    # The following function is used to handle continuing with a file after waiting on the worker thread (as long as the operation hasn't been cancelled)
+    def resume_file(self, processor, function, *arguments):
+        # Check to see if the file hasn't changed
+        if processor is self.processor:
+            # Call the function to continue
+            function(*arguments)
+
+    # The following function is used to handle saving the modifications to the current file on the worker thread and then moving onto the next file
+    def save_file(self):
+        # Grab the processor of the file
+        processor = self.processor
+
+        # Disable the view buttons while the file is saved
+        self.toggle_view_buttons(DISABLED)
+
+        # Call the function to handle saving the modifications to the file on the worker thread before changing to the next file
+        self.run_in_background(processor.save_modifications, lambda saved: self.resume_file(processor, self.change_file), self.selected_files[self.current_file_index])
+
+    # The following function is used to handle moving onto the next operation of the pipeline once the current operation has been performed on the file (saving the file and changing to the next file once every operation has been performed)
+    def finish_operation(self):
+        # Check to see if there are still operations to perform on the file
+        if len(self.processor.pending_operations) > 0:
+            # Call the function to handle starting on the next operation
+            self.start_next_operation()
+        else:
+            # Call the function to handle saving the modifications to the file and changing to the next file
+            self.save_file()
 
-        # Check to see if using an operation that spans more than one section
-        if current_operation in self.section_spanning_operations.keys():
-            # Remove the line number from the dictionary
-            next_data_line_number = next_data.pop('line_number')
+    # The following function is used to handle starting the next operation of the pipeline on the sections of the file as they've been modified so far (without loading the file again)
+    def start_next_operation(self):
+        # Grab the processor of the file
+        processor = self.processor
 
-            # Update the following sections text to be joined
-            next_data['text'] = '\n'.join(next_data['text'])
+        # Hold the processor while it moves onto the next operation
+        with self.processor_lock:
+            # Call the function to handle moving onto the next operation and starting the detection of its matches
+            processor.apply_next_operation()
 
-        # Load the section into the old viewer
-        self.txtOldSection.configure(state = 'normal')
-        self.txtOldSection.delete(1.0, END)
-        self.txtOldSection.insert(END, '\n'.join(current_data.values()) + '\n\n' + '\n'.join(next_data.values()) if current_operation in self.section_spanning_operations.keys() else '\n'.join(current_data.values()))
-        self.txtOldSection.configure(state = 'disabled')
+        # Reset the current match pointer for the operation
+        self.current_index = 0
+        self.lblCurrentMatch['text'] = str(self.current_index)
 
-        # Update the current_data's text to be in a list again
-        current_data['text'] = current_data['text'].split('\n')
+        # Call the function to handle detecting the matches on the worker thread
+        self.worker.submit(self.scan_file, processor)
 
-        # Check to see if using an operation that spans more than one section
-        if current_operation in self.section_spanning_operations.keys():
-            # Update the next_data's text to be in a list again
-            next_data['text'] = next_data['text'].split('\n')
+        # Call the function to handle showing the start of the file (as it has been modified so far) in the file viewer
+        self.render_file_viewer(0)
 
-        # Call the function that handles modifying the data and displays it in view
-        self.modify_section(current_data, next_data)
+        # Call the function to handle keeping the total matched label up to date as the matches are detected
+        self.monitor_scan(processor)
 
-        # Update current match pointer and label
-        self.current_index = self.current_index + 1 if current_operation not in self.section_spanning_operations.keys() else self.current_index + self.section_spanning_operations[current_operation]
-        self.lblCurrentMatch['text'] = str(int(self.current_index))
+        # Call the function that is used to handle setting up the data for confirmation and modification (waiting on the first match if need be)
+        self.setup_data()
+
+    # The following function is used to handle enabling or disabling the view buttons
+    def toggle_view_buttons(self, state):
+        # Update the state of the view buttons
+        self.btnEdit.configure(state = state)
+        self.btnSkip.configure(state = state)
+        self.btnSkipAll.configure(state = state)
+        self.btnApprove.configure(state = state)
+        self.btnApproveAll.configure(state = state)
+        self.btnApproveAllFiles.configure(state = state)
+
+        # Check to see if the buttons are being disabled
+        if state == DISABLED:
+            # Disable the previous button as well
+            self.btnPrevious.configure(state = state)
+
+    # The following function is used to handle updating the total matched label with the amount of sections to process (noting when more could still be found)
+    def update_total_matched(self):
+        # Update the total and label
+        self.total_items = len(self.processor.sections_to_modify)
+        self.lblTotalMatched['text'] = str(self.total_items) + ('' if self.processor.scan_complete else '+')
 
-        # Check to see if using an operation that spans more than one section
-        if current_operation in self.section_spanning_operations.keys():
-            # Add back on the line number for the next section
-            next_data['line_number'] = next_data_line_number
+    # The following function is used to handle setting up the data to have changes confirmed and modified if needed
+    def setup_data(self):
+        # Hold the processor while the section is set up (the worker thread waits between chunks of the scan)
+        with self.processor_lock:
+            # Call the function to handle setting up the current section
+            self.setup_section()
 
-        # Add back on the line number for the current section
-        current_data['line_number'] = current_data_line_number
+    # The following function is used to handle setting up the current section once its match has been detected
+    def setup_section(self):
+        # Grab the current operation being performed
+        current_operation = self.processor.operation
 
-        # Check to see if use has approved all sections
-        if approve_all == True:
-            # Call the fucntion to approve the section
-            self.approve_section(approve_all = approve_all)
+        # Check to see if the next match hasn't been detected yet while the file is still being scanned
+        if len(self.processor.sections_to_modify) < self.current_index + get_operation(current_operation).span and not self.processor.scan_complete:
+            # Disable the view buttons until the match has been detected
+            self.toggle_view_buttons(DISABLED)
 
-    # The following function is used to handle highlighting text and scrolling to it if it's out of view
-    def highlight_and_view(self, line_start, line_end):
-        # Remove the highlight tag up to the next processing section and then highlight the text in question
-        self.txtFileViewer.tag_remove('highlight', "%s.0" % 0, "%s.0" % line_start)
-        self.txtFileViewer.tag_add('highlight', "%s.0" % line_start, "%s.0" % line_end)
+            # Check back shortly
+            self.window.after(50, self.resume_file, self.processor, self.setup_data)
 
-        # Scroll to the text in question
-        self.txtFileViewer.see(str(line_start) + ".0")
-        lineinfo = self.txtFileViewer.dlineinfo(str(line_start) + ".0")
-        self.txtFileViewer.yview_scroll(lineinfo[1], 'pixels' )
+            # Return to stop further processing
+            return
+
+        # Enable the view buttons
+        self.toggle_view_buttons(NORMAL)
+
+        # Check to see if the current index is greater than 0
+        if self.current_index > 0:
+            # Disable the previous button to avoid issues
+            self.btnPrevious.configure(state = NORMAL)
+
+        # Check to see if the operation has been fully performed on the file
+        if len(self.processor.sections_to_modify) < self.current_index + get_operation(current_operation).span:
+            # Call the function to handle moving onto the next operation of the pipeline (or saving the modifications to the file and changing to the next file)
+            self.finish_operation()
+
+            # Return to stop further processing
+            return
 
-    # The following function is used to handle modifying the data and displaying it in view
-    def modify_section(self, current_data, next_data = None):
-        # Grab the current operation the user would like to perform
-        current_operation = self.selected_operation.get()
-
-        # Create flags to handle iterating over the text based on the current operation
-        first_run = True
-        process_further = False
-
-        # Grab the initial time and text information of the current section data
-        current_time = ('%s' % current_data['time'])
-        current_text = current_data['text'].copy()
-
-        # Check to see if performing an operation that spans more than one section
-        if current_operation in self.section_spanning_operations.keys() and not next_data == None:
-            # Grab the initial time and text information of the next section data
-            next_time = ('%s' % next_data['time'])
-            next_text = next_data['text'].copy()
-
-        # Store which line should be processed next
-        process_line_index = 0
-
-        # Add `process_further = True` to any function that needs to be scanned after changes
-        # Iterate only when it's the first run or further processing is needed
-        while first_run or process_further:
-            # Update the flags
-            first_run = False
-            process_further = False
-
-            # Check to see if the next line can be processed
-            if process_line_index >= len(current_data['text']):
-                # Break out of the loop
-                break
-
-            # Check to see if the user is performing a function to handle converting the file from vtt to srt
-            if current_operation == 'Convert vtt to srt':
-                # Update the time setting
-                current_data['time'] = ' '.join(current_data['time'].split(' ', 3)[:-1])
-
-            # Iterate over the lines and correct the ones with the issue
-            for index, line in enumerate(current_data['text'][process_line_index:].copy(), process_line_index):
-                # Check to see if the user is removing uppercase sentances
-                if current_operation == 'Add dashes to split lines (lowercase)':
-                    # Check to see if the current section isn't the last section in the file
-                    if index == (len(current_data['text']) - 1):
-                        # Create variables that represent different cases
-                        positive_first_section = regex.search(self.regex_statements[current_operation]['positive_first_section'], line.strip()) # Determine if the last line in the first section is correctly formatted as a "split line with a dash"
-                        negative_first_section = regex.search(self.regex_statements[current_operation]['negative_first_section'], line.strip()) # Determine if the last line in the first section is incorrectly formatted as a "split line with a dash"
-                        positive_second_section = regex.search(self.regex_statements[current_operation]['positive_second_section'], next_data['text'][0].strip()) # Determine if the first line in the second section is correctly formatted as a "split line with a dash"
-                        negative_second_section = regex.search(self.regex_statements[current_operation]['negative_second_section'], next_data['text'][0].strip()) # Determine if the first line in the second section is incorrectly formatted as a "split line with a dash"
-
-                        # Check to see if either of the sections need correcting
-                        if not bool(positive_first_section and positive_second_section) and (bool(negative_first_section and negative_second_section) or bool(positive_first_section and negative_second_section) or bool(negative_first_section and positive_second_section)):
-                            # Check to see if the first section needs correcting
-                            if negative_first_section:
-                                # Check to see which scenario the line falls under and correct it accordingly
-                                if regex.search(r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?$', line.strip()): # word, possible special character/nothing
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip() + '-'
-                                elif regex.search(r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\ (\-|\–)$', line.strip()): # word, possible special character/nothing, spaced dash
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-2].strip() + '-'
-                                elif regex.search(r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?(\"|\”)$', line.strip()): # word, possible special character/nothing, quote
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-1].strip() + '"-'
-                                elif regex.search(r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\ (\"|\”)$', line.strip()): # word, possible special character/nothing, spaced quote
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-2].strip() + '"-'
-                                elif regex.search(r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\ (\-|\–)(\"|\”)$', line.strip()): # word, possible special character/nothing, spaced dash, quote
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-3].strip() + '"-'
-                                elif regex.search(r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\<i\>$', line.strip()): # word, possible special character/nothing, starting italics tag
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-3].strip() + '-<i>'
-                                elif regex.search(r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\ (\-|\–)\<i\>$', line.strip()): # word, possible special character/nothing, spaced dash, starting italics tag
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-5].strip() + '-<i>'
-                                elif regex.search(r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\<\/i\>$', line.strip()): # word, possible special character/nothing, closing italics tag
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-4].strip() + '-</i>'
-                                elif regex.search(r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\ (\-|\–)\<\/i\>$', line.strip()): # word, possible special character/nothing, spaced dash, closing italics tag
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-6].strip() + '-</i>'
-
-                                # Check to see if the line ending includes a comma before the dash
-                                if regex.search(r'(\d+|[[:lower:]]|[[:upper:]])\,(\-|\–).*$', current_data['text'][index].strip()):
-                                    # Replace the special character instance
-                                    current_data['text'][index] = current_data['text'][index].strip()[::-1]
-                                    current_data['text'][index] = current_data['text'][index].strip().replace(',', '', 1)
-                                    current_data['text'][index] = current_data['text'][index].strip()[::-1]
-
-                                # Check to see if the line ending includes and ellipsies before the dash
-                                if regex.search(r'(\d+|[[:lower:]]|[[:upper:]])\.\.\.(\-|\–).*$', current_data['text'][index].strip()):
-                                    # Replace the special character instance
-                                    current_data['text'][index] = current_data['text'][index].strip()[::-1]
-                                    current_data['text'][index] = current_data['text'][index].strip().replace('...', '', 1)
-                                    current_data['text'][index] = current_data['text'][index].strip()[::-1]
-
-                            # Check to see if the second section needs correcting
-                            if negative_second_section:
-                                # Check to see which scenario the line falls under and correct it accordingly
-                                if regex.search(r'^(\d+|[[:lower:]])', next_data['text'][0].strip()): # word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-' + next_data['text'][0].strip()
-                                elif regex.search(r'^(\-|\–)\ (\d+|[[:lower:]])', next_data['text'][0].strip()): # dash, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-' + next_data['text'][0].strip()[2:].strip()
-                                elif regex.search(r'^(\-|\–)\ (\"|\”)(\d+|[[:lower:]])', next_data['text'][0].strip()): # dash, space, double quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-"' + next_data['text'][0].strip()[3:].strip()
-                                elif regex.search(r'^(\-|\–)\ (\')(\d+|[[:lower:]])', next_data['text'][0].strip()): # dash, space, single quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-\'' + next_data['text'][0].strip()[3:].strip()
-                                elif regex.search(r'^(\"|\”)(\d+|[[:lower:]])', next_data['text'][0].strip()): # double quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-"' + next_data['text'][0].strip()[1:].strip()
-                                elif regex.search(r'^(\')(\d+|[[:lower:]])', next_data['text'][0].strip()): # single quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-\'' + next_data['text'][0].strip()[1:].strip()
-                                elif regex.search(r'^\$(\d+|[[:lower:]])', next_data['text'][0].strip()): # dollar, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-$' + next_data['text'][0].strip()[1:].strip()
-                                elif regex.search(r'^(\"|\”)(\-|\–)\ (\d+|[[:lower:]])', next_data['text'][0].strip()): # quote, dash, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-"' + next_data['text'][0].strip()[3:].strip()
-                                elif regex.search(r'^(\"|\”)\ (\d+|[[:lower:]])', next_data['text'][0].strip()): # spaced quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-"' + next_data['text'][0].strip()[2:].strip()
-                                elif regex.search(r'^\<i\>(\d+|[[:lower:]])', next_data['text'][0].strip()): # starting italics tag, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '<i>-' + next_data['text'][0].strip()[3:].strip()
-                                elif regex.search(r'^\<i\>\ (\d+|[[:lower:]])', next_data['text'][0].strip()): # starting italics tag, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '<i>-' + next_data['text'][0].strip()[4:].strip()
-                                elif regex.search(r'^\<i\>(\-|\–)\ (\d+|[[:lower:]])', next_data['text'][0].strip()): # starting italics tag, dash, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '<i>-' + next_data['text'][0].strip()[5:].strip()
-                                elif regex.search(r'^\<i\>(\"|\”)(\d+|[[:lower:]])', next_data['text'][0].strip()): # starting italics tag, quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '<i>-"' + next_data['text'][0].strip()[4:].strip()
-                                elif regex.search(r'^\<\/i\>(\d+|[[:lower:]])', next_data['text'][0].strip()): # closing italics tag, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '</i>-' + next_data['text'][0].strip()[4:].strip()
-                                elif regex.search(r'^\<\/i\>\ (\d+|[[:lower:]])', next_data['text'][0].strip()): # closing italics tag, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '</i>-' + next_data['text'][0].strip()[5:].strip()
-                                elif regex.search(r'^\<\/i\>(\-|\–)\ (\d+|[[:lower:]])', next_data['text'][0].strip()): # closing italics tag, dash, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '</i>-' + next_data['text'][0].strip()[6:].strip()
-                                elif regex.search(r'^\<\i\>(\"|\”)(\d+|[[:lower:]])', next_data['text'][0].strip()): # ending italics tag, quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '<i>-"' + next_data['text'][0].strip()[5:].strip()
-                elif current_operation == 'Add dashes to split lines (uppercase)':
-                    # Check to see if the current section isn't the last section in the file
-                    if index == (len(current_data['text']) - 1):
-                        # Create variables that represent different cases
-                        positive_first_section = regex.search(self.regex_statements[current_operation]['positive_first_section'], line.strip()) # Determine if the last line in the first section is correctly formatted as a "split line with a dash"
-                        negative_first_section = regex.search(self.regex_statements[current_operation]['negative_first_section'], line.strip()) # Determine if the last line in the first section is incorrectly formatted as a "split line with a dash"
-                        positive_second_section = regex.search(self.regex_statements[current_operation]['positive_second_section'], next_data['text'][0].strip()) # Determine if the first line in the second section is correctly formatted as a "split line with a dash"
-                        negative_second_section = regex.search(self.regex_statements[current_operation]['negative_second_section'], next_data['text'][0].strip()) # Determine if the first line in the second section is incorrectly formatted as a "split line with a dash"
-
-                        # Check to see if either of the sections need correcting
-                        if not bool(positive_first_section and positive_second_section) and (bool(negative_first_section and negative_second_section) or bool(positive_first_section and negative_second_section) or bool(negative_first_section and positive_second_section)):
-                            # Check to see if the first section needs correcting
-                            if negative_first_section:
-                                # Check to see which scenario the line falls under and correct it accordingly
-                                if regex.search(r'(\d+|[[:lower:]])(\,|\.\.\.)?$', line.strip()): # word, possible special character/nothing
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip() + '-'
-                                elif regex.search(r'(\d+|[[:lower:]])(\,|\.\.\.)?\ (\-|\–)$', line.strip()): # word, possible special character/nothing, spaced dash
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-2].strip() + '-'
-                                elif regex.search(r'(\d+|[[:lower:]])(\,|\.\.\.)?(\"|\”)$', line.strip()): # word, possible special character/nothing, quote
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-1].strip() + '"-'
-                                elif regex.search(r'(\d+|[[:lower:]])(\,|\.\.\.)?\ (\"|\”)$', line.strip()): # word, possible special character/nothing, spaced quote
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-2].strip() + '"-'
-                                elif regex.search(r'(\d+|[[:lower:]])(\,|\.\.\.)?\ (\-|\–)(\"|\”)$', line.strip()): # word, possible special character/nothing, spaced dash, quote
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-3].strip() + '"-'
-                                elif regex.search(r'(\d+|[[:lower:]])(\,|\.\.\.)?\<i\>$', line.strip()): # word, possible special character/nothing, starting italics tag
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-3].strip() + '-<i>'
-                                elif regex.search(r'(\d+|[[:lower:]])(\,|\.\.\.)?\ (\-|\–)\<i\>$', line.strip()): # word, possible special character/nothing, spaced dash, starting italics tag
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-5].strip() + '-<i>'
-                                elif regex.search(r'(\d+|[[:lower:]])(\,|\.\.\.)?\<\/i\>$', line.strip()): # word, possible special character/nothing, closing italics tag
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-4].strip() + '-</i>'
-                                elif regex.search(r'(\d+|[[:lower:]])(\,|\.\.\.)?\ (\-|\–)\<\/i\>$', line.strip()): # word, possible special character/nothing, spaced dash, closing italics tag
-                                    # Append the line ending dash
-                                    current_data['text'][index] = line.strip()[:-6].strip() + '-</i>'
-
-                                # Check to see if the line ending includes a comma before the dash
-                                if regex.search(r'(\d+|[[:lower:]])\,(\-|\–).*$', current_data['text'][index].strip()):
-                                    # Replace the special character instance
-                                    current_data['text'][index] = current_data['text'][index].strip()[::-1]
-                                    current_data['text'][index] = current_data['text'][index].strip().replace(',', '', 1)
-                                    current_data['text'][index] = current_data['text'][index].strip()[::-1]
-
-                                # Check to see if the line ending includes and ellipsies before the dash
-                                if regex.search(r'(\d+|[[:lower:]])\.\.\.(\-|\–).*$', current_data['text'][index].strip()):
-                                    # Replace the special character instance
-                                    current_data['text'][index] = current_data['text'][index].strip()[::-1]
-                                    current_data['text'][index] = current_data['text'][index].strip().replace('...', '', 1)
-                                    current_data['text'][index] = current_data['text'][index].strip()[::-1]
-
-                            # Check to see if the second section needs correcting
-                            if negative_second_section:
-                                # Check to see which scenario the line falls under and correct it accordingly
-                                if regex.search(r'^(\d+|[[:upper:]])', next_data['text'][0].strip()): # word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-' + next_data['text'][0].strip()
-                                elif regex.search(r'^(\-|\–)\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # dash, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-' + next_data['text'][0].strip()[2:].strip()
-                                elif regex.search(r'^(\-|\–)\ (\"|\”)(\d+|[[:upper:]])', next_data['text'][0].strip()): # dash, space, double quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-"' + next_data['text'][0].strip()[3:].strip()
-                                elif regex.search(r'^(\-|\–)\ (\')(\d+|[[:upper:]])', next_data['text'][0].strip()): # dash, space, single quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-\'' + next_data['text'][0].strip()[3:].strip()
-                                elif regex.search(r'^(\"|\”)(\d+|[[:upper:]])', next_data['text'][0].strip()): # quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-"' + next_data['text'][0].strip()[1:].strip()
-                                elif regex.search(r'^(\')(\d+|[[:upper:]])', next_data['text'][0].strip()): # single quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-\'' + next_data['text'][0].strip()[1:].strip()
-                                elif regex.search(r'^\$(\d+|[[:upper:]])', next_data['text'][0].strip()): # dollar, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-$' + next_data['text'][0].strip()[1:].strip()
-                                elif regex.search(r'^(\"|\”)(\-|\–)\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # quote, dash, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-"' + next_data['text'][0].strip()[3:].strip()
-                                elif regex.search(r'^(\"|\”)\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # spaced quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '-"' + next_data['text'][0].strip()[2:].strip()
-                                elif regex.search(r'^\<i\>(\d+|[[:upper:]])', next_data['text'][0].strip()): # starting italics tag, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '<i>-' + next_data['text'][0].strip()[3:].strip()
-                                elif regex.search(r'^\<i\>\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # starting italics tag, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '<i>-' + next_data['text'][0].strip()[4:].strip()
-                                elif regex.search(r'^\<i\>(\-|\–)\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # starting italics tag, dash, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '<i>-' + next_data['text'][0].strip()[5:].strip()
-                                elif regex.search(r'^\<i\>(\"|\”)(\d+|[[:upper:]])', next_data['text'][0].strip()): # starting italics tag, quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '<i>-"' + next_data['text'][0].strip()[4:].strip()
-                                elif regex.search(r'^\<\/i\>(\d+|[[:upper:]])', next_data['text'][0].strip()): # closing italics tag, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '</i>-' + next_data['text'][0].strip()[4:].strip()
-                                elif regex.search(r'^\<\/i\>\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # closing italics tag, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '</i>-' + next_data['text'][0].strip()[5:].strip()
-                                elif regex.search(r'^\<\/i\>(\-|\–)\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # closing italics tag, dash, space, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '</i>-' + next_data['text'][0].strip()[6:].strip()
-                                elif regex.search(r'^\<\i\>(\"|\”)(\d+|[[:upper:]])', next_data['text'][0].strip()): # ending italics tag, quote, word
-                                    # Prepend the line starting dash
-                                    next_data['text'][0] = '<i>-"' + next_data['text'][0].strip()[5:].strip()
-                elif current_operation == 'Add missing italics':
-                    # Check to see if the current index is the last index in the list of text
-                    if index == len(current_data['text']) - 1:
-                        # Append the closing italic
-                        current_data['text'][index] = current_data['text'][index] + '</i>'
-                elif current_operation in ['Add space after line starting dash', 'Add space after line starting dash and lowercase character', 'Add space after line starting dash and three dots', 'Add space after line starting dash and uppercase character']:
-                    # Check to see if the current line is the one that matches
-                    if (current_operation == 'Add space after line starting dash' and regex.search(self.regex_statements[current_operation], line)) or (current_operation == 'Add space after line starting dash and three dots' and regex.search(self.regex_statements[current_operation], line)) or (current_operation == 'Add space after line starting dash and lowercase character' and regex.search(self.regex_statements[current_operation], line)) or (current_operation == 'Add space after line starting dash and uppercase character' and regex.search(self.regex_statements[current_operation], line)):
-                        # Check to see if the line contains a text modifier
-                        if regex.search(r'\<i\>', line):
-                            # Check to see if the line starts with with the text modifier
-                            if line.startswith('<i>'):
-                                # Correct the dash with no space
-                                current_data['text'][index] = '<i>- ' + current_data['text'][index].replace('<i>', '').replace('</i>', '')[1:] + '</i>'
-                            else:
-                                # Correct the dash with no space
-                                current_data['text'][index] = '- <i>' + current_data['text'][index].replace('<i>', '').replace('</i>', '')[1:] + '</i>'
-                        else:
-                            # Correct the dash with no space
-                            current_data['text'][index] = '- ' + current_data['text'][index][1:]
-                elif current_operation == 'Capitalize, add a period, and space people abbreviations':
-                    # Search the string
-                    results = regex.findall(self.regex_statements[current_operation], line)
-
-                    # Check to see if the current line is the one that matches
-                    if results:
-                        # Iterate over the matches
-                        for match in results:
-                            # Update the match
-                            match = ''.join(match)
-
-                            # Update the strings
-                            current_data['text'][index] = current_data['text'][index].replace(match, match.strip().title() + ('.' if not match.endswith('.') and not match.endswith('. ') else '') + ' ')
-                elif current_operation in ['Edit full uppercase lines', 'Edit lines with colon immediately after a letter', 'Edit lines with two or more consecutive uppercase characters', 'Edit lines that don\'t have line ending punctuation', 'Sanitize file']:
-                    # Skip iteration as no modifications need to be performed
-                    continue
-                elif current_operation == 'Edit lines that don\'t have line ending punctuation (add dashes)':
-                    # Check to see if the current section isn't the last section in the file
-                    if index == (len(current_data['text']) - 1):
-                        # Check to see which scenario the line falls under and correct it accordingly
-                        if regex.search(r'(\d+|[[:lower:]])$', line.strip()): # word, possible special character/nothing
-                            # Append the line ending dash
-                            current_data['text'][index] = line.strip() + '-'
-                        elif regex.search(r'(\d+|[[:lower:]])\ (\-|\–)$', line.strip()): # word, possible special character/nothing, spaced dash
-                            # Append the line ending dash
-                            current_data['text'][index] = line.strip()[:-2].strip() + '-'
-                        elif regex.search(r'(\d+|[[:lower:]])(\"|\”)$', line.strip()): # word, possible special character/nothing, quote
-                            # Append the line ending dash
-                            current_data['text'][index] = line.strip()[:-1].strip() + '"-'
-                        elif regex.search(r'(\d+|[[:lower:]])\ (\"|\”)$', line.strip()): # word, possible special character/nothing, spaced quote
-                            # Append the line ending dash
-                            current_data['text'][index] = line.strip()[:-2].strip() + '"-'
-                        elif regex.search(r'(\d+|[[:lower:]])\ (\-|\–)(\"|\”)$', line.strip()): # word, possible special character/nothing, spaced dash, quote
-                            # Append the line ending dash
-                            current_data['text'][index] = line.strip()[:-3].strip() + '"-'
-                        elif regex.search(r'(\d+|[[:lower:]])\<i\>$', line.strip()): # word, possible special character/nothing, starting italics tag
-                            # Append the line ending dash
-                            current_data['text'][index] = line.strip()[:-3].strip() + '-<i>'
-                        elif regex.search(r'(\d+|[[:lower:]])\ (\-|\–)\<i\>$', line.strip()): # word, possible special character/nothing, spaced dash, starting italics tag
-                            # Append the line ending dash
-                            current_data['text'][index] = line.strip()[:-5].strip() + '-<i>'
-                        elif regex.search(r'(\d+|[[:lower:]])\<\/i\>$', line.strip()): # word, possible special character/nothing, closing italics tag
-                            # Append the line ending dash
-                            current_data['text'][index] = line.strip()[:-4].strip() + '-</i>'
-                        elif regex.search(r'(\d+|[[:lower:]])\ (\-|\–)\<\/i\>$', line.strip()): # word, possible special character/nothing, spaced dash, closing italics tag
-                            # Append the line ending dash
-                            current_data['text'][index] = line.strip()[:-6].strip() + '-</i>'
-
-                        # Check to see which scenario the line falls under and correct it accordingly
-                        if regex.search(r'^(\d+|[[:upper:]])', next_data['text'][0].strip()): # word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '-' + next_data['text'][0].strip()
-                        elif regex.search(r'^(\-|\–)\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # dash, space, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '-' + next_data['text'][0].strip()[2:].strip()
-                        elif regex.search(r'^(\-|\–)\ (\"|\”)(\d+|[[:lower:]])', next_data['text'][0].strip()): # dash, space, double quote, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '-"' + next_data['text'][0].strip()[3:].strip()
-                        elif regex.search(r'^(\-|\–)\ (\')(\d+|[[:lower:]])', next_data['text'][0].strip()): # dash, space, single quote, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '-\'' + next_data['text'][0].strip()[3:].strip()
-                        elif regex.search(r'^(\"|\”)(\d+|[[:upper:]])', next_data['text'][0].strip()): # quote, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '-"' + next_data['text'][0].strip()[1:].strip()
-                        elif regex.search(r'^(\')(\d+|[[:upper:]])', next_data['text'][0].strip()): # single quote, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '-\'' + next_data['text'][0].strip()[1:].strip()
-                        elif regex.search(r'^\$(\d+|[[:upper:]])', next_data['text'][0].strip()): # dollar, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '-$' + next_data['text'][0].strip()[1:].strip()
-                        elif regex.search(r'^(\"|\”)(\-|\–)\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # quote, dash, space, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '-"' + next_data['text'][0].strip()[3:].strip()
-                        elif regex.search(r'^(\"|\”)\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # spaced quote, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '-"' + next_data['text'][0].strip()[2:].strip()
-                        elif regex.search(r'^\<i\>(\d+|[[:upper:]])', next_data['text'][0].strip()): # starting italics tag, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '<i>-' + next_data['text'][0].strip()[3:].strip()
-                        elif regex.search(r'^\<i\>\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # starting italics tag, space, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '<i>-' + next_data['text'][0].strip()[4:].strip()
-                        elif regex.search(r'^\<i\>(\-|\–)\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # starting italics tag, dash, space, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '<i>-' + next_data['text'][0].strip()[5:].strip()
-                        elif regex.search(r'^\<\/i\>(\d+|[[:upper:]])', next_data['text'][0].strip()): # closing italics tag, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '</i>-' + next_data['text'][0].strip()[4:].strip()
-                        elif regex.search(r'^\<\/i\>\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # closing italics tag, space, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '</i>-' + next_data['text'][0].strip()[5:].strip()
-                        elif regex.search(r'^\<\/i\>(\-|\–)\ (\d+|[[:upper:]])', next_data['text'][0].strip()): # closing italics tag, dash, space, word
-                            # Prepend the line starting dash
-                            next_data['text'][0] = '</i>-' + next_data['text'][0].strip()[6:].strip()
-                elif current_operation == 'Find and replace':
-                    # Check to see if the line has the find string
-                    if self.find_and_replace['find'] in line:
-                        # Grab some preliminary index points
-                        pre_i_ending_index = line.index(self.find_and_replace['find'])
-                        pre_i_starting_index = (pre_i_ending_index - 3)
-                        pre_i_string = line[pre_i_starting_index:pre_i_ending_index]
-                        post_i_starting_index = (line.index(self.find_and_replace['find']) + len(self.find_and_replace['find']))
-                        post_i_ending_index = (post_i_starting_index + 4)
-                        post_i_string = line[post_i_starting_index:post_i_ending_index]
-
-                        # Create a local replace_value holder
-                        replace_value = "" if self.find_and_replace['replace'] == None else self.find_and_replace['replace']
-
-                        # Formulate the patter to search for and replace
-                        find_string = ('\<i\>' if replace_value.startswith('<i>') and pre_i_string == '<i>' else '')
-                        find_string = find_string + regex.escape(self.find_and_replace['find'].strip())
-                        find_string = find_string + ('\ ?' if replace_value == "" and not line.endswith(self.find_and_replace['find'].strip()) else '')
-                        find_string = find_string + ('\<\/i\>' if replace_value.endswith('</i>') and post_i_string == "</i>" else '')
-
-                        # Replace the actual line
-                        current_data['text'][index] = regex.sub(find_string, replace_value.strip(), line)
-                elif current_operation == 'Fix time overlaps':
-                    # Check to see if the current section isn't the last section in the file
-                    if index == (len(current_data['text']) - 1):
-                        # Grab the respective time values
-                        first_section_end = datetime.strptime(current_data['time'].split(' --> ')[-1].strip(), "%H:%M:%S,%f")
-                        second_section_start_string = next_data['time'].split(' --> ')[0].strip()
-                        second_section_start = datetime.strptime(second_section_start_string, "%H:%M:%S,%f")
-
-                        # Calculate the modified second start time
-                        modified_second_start_time = first_section_end + timedelta(microseconds=1000)
-
-                        # Correct the start of the section start time to make sure it's after the first
-                        next_data['time'] = next_data['time'].replace(second_section_start_string, modified_second_start_time.strftime("%H:%M:%S,%f")[:-3])
-                elif current_operation == 'Remove full uppercase lines':
-                    # Check to see if the current line is the one that matches
-                    if line.isupper():
-                        # Zero out the line
-                        current_data['text'].remove(line)
-                elif current_operation == 'Remove line ending dash':
-                    # Check to see if the current line is the last line in the section and ends with a dash
-                    if line == current_data['text'][-1] and regex.search(self.regex_statements[current_operation], line):
-                        # Update the strings
-                        current_data['text'][index] = current_data['text'][index][:-1]
-                elif current_operation == 'Remove lines with two or more consecutive uppercase characters':
-                    # Check to see if the current line is the one that matches
-                    if regex.search(self.regex_statements[current_operation], line):
-                        # Zero out the line
-                        current_data['text'].remove(line)
-                elif current_operation == 'Remove sections that don\'t have line ending punctuation':
-                    # Empty out the lines in the section
-                    current_data['text'][index] = ''
-                elif current_operation == 'Remove space after three dots':
-                    # Search the string
-                    results = regex.findall(self.regex_statements[current_operation], line)
-
-                    # Check to see if the current line is the one that matches
-                    if results:
-                        # Iterate over the matches
-                        for match in results:
-                            # Update the strings
-                            current_data['text'][index] = current_data['text'][index].replace(match, match.replace(' ', ''))
-                elif current_operation == 'Remove space after three dots and a lowercase word':
-                    # Search the string
-                    results = regex.findall(self.regex_statements[current_operation], line)
-
-                    # Check to see if the current line is the one that matches
-                    if results:
-                        # Iterate over the matches
-                        for match in results:
-                            # Update the strings
-                            current_data['text'][index] = current_data['text'][index].replace(match, match.replace(' ', ''))
-                elif current_operation == 'Remove space after three dots and an uppercase word':
-                    # Search the string
-                    results = regex.findall(self.regex_statements[current_operation], line)
-
-                    # Check to see if the current line is the one that matches
-                    if results:
-                        # Iterate over the matches
-                        for match in results:
-                            # Update the strings
-                            current_data['text'][index] = current_data['text'][index].replace(match, match.replace(' ', ''))
-                elif current_operation == 'Remove spaced dashes from split lines':
-                    # Check to see if the current line pointer is the last line in the text array
-                    if index == (len(current_data['text']) - 1):
-                        # Check to see if the correction should be applied to the iterated line
-                        if regex.search(self.regex_statements[current_operation]['first_section_spaced_dash_ending'], line.strip()):
-                            # Correct the dash position
-                            current_data['text'][index] = line[:-2] + '-'
-
-                        # Check to see if the correction should be applied to the next section line
-                        if regex.search(self.regex_statements[current_operation]['second_section_dash_spaced_starting'], next_data['text'][0].strip()):
-                            # Correct the dash position
-                            next_data['text'][0] = '-' + next_data['text'][0][2:]
-                elif current_operation == 'Remove spaced line starting dash':
-                    # Check to see if the current line starts with a spaced dash
-                    if regex.search(self.regex_statements[current_operation], line):
-                        # Update the strings
-                        current_data['text'][index] = '-' + current_data['text'][index][2:]
-                elif current_operation == 'Remove spaced line ending dash':
-                    # Check to see if the current line is the last line in the section and ends with a spaced dash
-                    if line == current_data['text'][-1] and regex.search(self.regex_statements[current_operation], line):
-                        # Update the strings
-                        current_data['text'][index] = current_data['text'][index][:-2] + '-'
-                elif current_operation == 'Replace dashes with three dots for quick lines':
-                    # Iterrate over each of the sections in the file
-                    for section_index, section_data in enumerate(self.file_data):
-                        # Check to see if the current section isn't the last section in the file
-                        if not section_index == (len(self.file_data) - 1):
-                            # Create variables that represent different cases
-                            positive_first_section = regex.search(self.regex_statements['Add dashes to split lines (lowercase)']['positive_first_section'], line.strip()) # Determine if the last line in the first section is correctly formatted as a "split line with a dash"
-                            positive_second_section = regex.search(self.regex_statements['Add dashes to split lines (lowercase)']['positive_second_section'], next_data['text'][0].strip()) or regex.search(self.regex_statements['Add dashes to split lines (uppercase)']['positive_second_section'], next_data['text'][0].strip()) # Determine if the first line in the second section is correctly formatted as a "split line with a dash"
-                            first_section_end = datetime.strptime(section_data['time'].split(' --> ')[-1].strip(), "%H:%M:%S,%f")
-                            second_section_start = datetime.strptime(self.file_data[section_index + 1]['time'].split(' --> ')[0].strip(), "%H:%M:%S,%f")
-                            section_delta = second_section_start - first_section_end
-
-                            # Check to see if the sections are quick and need correcting
-                            if bool(positive_first_section and positive_second_section) and (section_delta >= timedelta(seconds=1, microseconds=200000) and section_delta <= timedelta(seconds=10, microseconds=0)):
-                                # Modify the first section and replace the respective line ending dash to three dots
-                                current_data['text'][index] = current_data['text'][index].strip()[::-1]
-                                current_data['text'][index] = current_data['text'][index].strip().replace('-', '...', 1)
-                                current_data['text'][index] = current_data['text'][index].strip()[::-1]
-
-                                # Modify the second section and replace the respective line starting dash to three dots
-                                next_data['text'][0] = next_data['text'][0].strip().replace('-', '...', 1)
-                elif current_operation == 'Trim long lines':
-                    # Check to make sure that the current line isn't the last line in the section
-                    if index == (len(current_data['text']) - 1):
-                        # Continue and skip current iteration
-                        continue
-
-                    # Store the current line in perfet shape
-                    current_line = current_data['text'][index]
-
-                    # Check to see if the current line has more than one speaker
-                    has_multiple_speakers = regex.findall(self.regex_statements[current_operation], current_line)
-
-                    # Double check to make sure the current line is greater than 45 characters and doesn't start with a dash or has multiple speakers
-                    if (len(current_line) > 45 and not current_line.startswith('- ')) or has_multiple_speakers:
-                        # Check to see if handling for more than one speaker
-                        if has_multiple_speakers:
-                            # # Iterate over the matches and insert them correctly
-                            for  matched_group_index, matched_group_text in enumerate(has_multiple_speakers[0], 0):
-                                # Check to see if the index exists
-                                if (index + matched_group_index) < len(current_data['text']):
-                                    # Update the current index pointer with the matched string
-                                    current_data['text'][index + matched_group_index] = matched_group_text
-                                else:
-                                    # Insert the current index pointer with the matched string
-                                    current_data['text'].insert((index + matched_group_index), matched_group_text)
-                        else:
-                            # Convert the string to an array split by the spaces
-                            current_line = current_line.split(' ')
-
-                            # Grab the middle of the sentance (based on arrayed (split sentance by space) index middle point)
-                            split_index = ((len(current_line) // 2) if (len(current_line) // 2) % 2 == 0 else ((len(current_line) // 2) + 1))
-
-                            # Split the line current line and inser the remaining bak into the array
-                            current_data['text'][index] = ' '.join(current_line[:split_index]).strip()
-                            current_data['text'].insert((index + 1), ' '.join(current_line[split_index:]).strip())
-
-                        # Send the section to be further processed
-                        process_further = True
-
-                        # Skip over the current line pointer and two lines that have just been modified
-                        process_line_index = process_line_index + 2
-
-        # Update the current_data's text to be joined
-        current_data['text'] = '\n'.join(current_data['text'])
-
-        # Check to see if using an operation that spans more than one section
-        if current_operation in self.section_spanning_operations.keys():
-            # Update the following sections text to be joined
-            next_data['text'] = '\n'.join(next_data['text'])
+        # Grab the current and next data data to handle
+        current_data = self.processor.sections_to_modify[self.current_index]
+        next_data = self.processor.sections_to_modify[self.current_index + 1] if get_operation(current_operation).span > 1 else None
+
+        # Grab the positions of the first and last sections to highlight
+        highlight_start_position = self.processor.section_positions.get(current_data.index)
+        highlight_end_position = self.processor.section_positions.get(next_data.index) if get_operation(current_operation).span > 1 and not next_data == None else highlight_start_position
+
+        # Call the function to handle highlighting the sections and scrolling to them if need be
+        self.highlight_and_view(highlight_start_position, highlight_end_position)
+
+        # Load the section into the old viewer
+        self.txtOldSection.configure(state = 'normal')
+        self.txtOldSection.delete(1.0, END)
+        self.txtOldSection.insert(END, self.processor.format_sections(current_data, next_data))
+        self.txtOldSection.configure(state = 'disabled')
+
+        # Call the function that handles modifying the data
+        modified_current_data, modified_next_data = self.processor.modify_section(current_data, next_data)
 
         # Load the modified section into the new viewer
         self.txtNewSection.configure(state = 'normal')
         self.txtNewSection.delete(1.0, END)
-        self.txtNewSection.insert(END, '\n'.join(current_data.values()) + '\n\n' + '\n'.join(next_data.values()) if current_operation in self.section_spanning_operations.keys() else '\n'.join(current_data.values()))
+        self.txtNewSection.insert(END, self.processor.format_sections(modified_current_data, modified_next_data))
         self.txtNewSection.configure(state = 'disabled')
 
-        # Update the current pointer and reset the time and text entry
-        current_data['time'] = current_time
-        current_data['text'] = current_text
-
-        # Check to see if performing an operation that spans more than one section
-        if current_operation in self.section_spanning_operations.keys() and not next_data == None:
-            # Update the next pointer and reset the time and text entry
-            next_data['time'] = next_time
-            next_data['text'] = next_text
+        # Update current match pointer and label
+        self.current_index = self.current_index + get_operation(current_operation).span
+        self.lblCurrentMatch['text'] = str(int(self.current_index))
 
-    # The following function is used to handle saving the modifications to file
-    def save_modifications(self):
-        # Grab the current operation the user would like to perform
-        current_operation = self.selected_operation.get()
+    # The following function is used to handle highlighting sections and scrolling to them if they're out of view
+    def highlight_and_view(self, first_position, last_position):
+        # Check to see if either of the sections have been removed from the file
+        if first_position is None or last_position is None:
+            # Return to stop further processing
+            return
 
-        # Create a variable that holds the full file path
-        file_path = self.selected_files[self.current_file_index]
+        # Check to see if the sections aren't in the window of sections shown in the file viewer
+        if first_position not in self.viewer_lines or last_position not in self.viewer_lines:
+            # Call the function to handle showing the window of sections around the sections
+            self.render_file_viewer(first_position)
 
-        # Check to see if the user desires to convert the file
-        if current_operation == 'Convert vtt to srt':
-            # Change the file extension
-            file_path = file_path.replace('vtt', 'str')
+        # Call the function to handle moving the highlight from the previous sections onto the sections in question
+        self.highlighted_positions = (first_position, last_position)
+        self.highlight_file_viewer()
 
-        # Open the file in question and save the modifications
-        with open(file_path, 'w', encoding = 'utf-8') as file:
-            # Create a list holding modified file sections
-            modified_sections = []
+        # Scroll to the text in question
+        line_start = self.viewer_lines[first_position][0]
+        self.txtFileViewer.see(str(line_start) + ".0")
+        lineinfo = self.txtFileViewer.dlineinfo(str(line_start) + ".0")
+        self.txtFileViewer.yview_scroll(lineinfo[1], 'pixels' )
 
-            # Iterate over the file data
-            for index, section in enumerate(self.file_data, 1):
-                # Append the data to the modified section
-                modified_sections.append(str(index) + '\n' + section['time'] + '\n' + '\n'.join(section['text']))
+    # The following function is used to handle moving the highlight onto the highlighted sections (only touching the previous and new lines)
+    def highlight_file_viewer(self):
+        # Check to see if there are highlighted lines
+        if self.highlighted_lines is not None:
+            # Remove the highlight tag from the previously highlighted lines
+            self.txtFileViewer.tag_remove('highlight', "%s.0" % self.highlighted_lines[0], "%s.0" % self.highlighted_lines[1])
+            self.highlighted_lines = None
+
+        # Check to see if the highlighted sections are in the window of sections shown in the file viewer
+        if self.highlighted_positions is not None and self.highlighted_positions[0] in self.viewer_lines and self.highlighted_positions[1] in self.viewer_lines:
+            # Highlight the lines of the sections
+            self.highlighted_lines = (self.viewer_lines[self.highlighted_positions[0]][0], self.viewer_lines[self.highlighted_positions[1]][1])
+            self.txtFileViewer.tag_add('highlight', "%s.0" % self.highlighted_lines[0], "%s.0" % self.highlighted_lines[1])
+
+    # The following function is used to handle resetting the window of sections shown in the file viewer
+    def reset_file_viewer_window(self):
+        # Reset the window values
+        self.viewer_range = (0, 0)
+        self.viewer_lines = {}
+        self.viewer_line_starts = []
+        self.highlighted_positions = None
+        self.highlighted_lines = None
+
+    # The following function is used to handle showing the window of sections around the provided position in the file viewer (instead of the whole file)
+    def render_file_viewer(self, position):
+        # Check to see if the worker thread has been holding the processor for a while (leaving the current window shown until it's done)
+        if not self.processor_lock.acquire(timeout = 0.1):
+            # Return to stop further processing
+            return
 
-            # Write the modified sections to the file
-            file.write('\n\n'.join(modified_sections).encode('utf-8', 'ignore').decode('utf-8'))
+        # Grab the sections of the file and the amount of sections to show either side of the position
+        file_data = self.processor.file_data
+        viewer_window = self.config['viewer_window'] if 'viewer_window' in self.config else 100
+
+        # Store the range of sections being shown
+        self.viewer_range = (max(0, position - viewer_window), min(len(file_data), position + viewer_window + 1))
+        self.viewer_lines = {}
+        self.viewer_line_starts = []
+        self.highlighted_lines = None
+
+        # Create a list to hold the lines being shown
+        lines = []
+
+        # Iterate over each of the sections in the window
+        for section_position in range(self.viewer_range[0], self.viewer_range[1]):
+            # Grab the section
+            section = file_data[section_position]
+
+            # Check to see if the section has been removed
+            if section is None:
+                # Move onto the next section
+                continue
+
+            # Check to see if the section needs to be separated from the previous section
+            if len(lines) > 0:
+                # Add the separating blank line
+                lines.append('')
+
+            # Add the lines of the section and store the lines it's shown on
+            line_start = len(lines) + 1
+            lines.extend([str(section.index), section.format_time(self.processor.time_separator)] + section.text)
+            self.viewer_lines[section_position] = (line_start, len(lines) + 1)
+            self.viewer_line_starts.append((line_start, section_position))
+
+        # Release the processor now that the lines have been gathered
+        self.processor_lock.release()
+
+        # Load the lines into the file viewer
+        self.txtFileViewer.configure(state = 'normal')
+        self.txtFileViewer.delete(1.0, END)
+        self.txtFileViewer.insert(END, '\n'.join(lines))
+        self.txtFileViewer.configure(state = 'disabled')
+
+        # Call the function to handle highlighting the sections if they're in the window
+        self.highlight_file_viewer()
+
+    # The following function is used to handle grabbing the position of the section shown at the top of the file viewer
+    def get_file_viewer_position(self):
+        # Check to see if no sections are shown
+        if len(self.viewer_line_starts) == 0:
+            # Return the start of the window
+            return self.viewer_range[0]
+
+        # Grab the first visible line and find the section it belongs to
+        line = int(self.txtFileViewer.index('@0,0').split('.')[0])
+        return self.viewer_line_starts[max(bisect_right(self.viewer_line_starts, (line, len(self.processor.file_data))) - 1, 0)][1]
+
+    # The following function is used to handle showing the window of sections around a position with that position's section at the top of the file viewer
+    def move_file_viewer(self, position):
+        # Call the function to handle showing the window of sections around the position
+        self.render_file_viewer(position)
+
+        # Grab the first shown section at or after the position and scroll it to the top
+        line_starts = [line_start for line_start, section_position in self.viewer_line_starts if section_position >= position]
+        self.txtFileViewer.yview(str(line_starts[0] if len(line_starts) > 0 else 1) + '.0')
+
+    # The following function is used to handle moving the window of sections when the file viewer is scrolled to either end of it
+    def check_file_viewer_edges(self):
+        # Grab the visible fractions of the shown lines
+        first, last = self.txtFileViewer.yview()
+
+        # Check to see if the file viewer is scrolled to an end of the window that has more sections past it
+        if (first <= 0 and self.viewer_range[0] > 0) or (last >= 1 and self.viewer_range[1] < len(self.processor.file_data)):
+            # Call the function to handle moving the window around the section at the top of the file viewer
+            self.move_file_viewer(self.get_file_viewer_position())
+
+    # The following function is used to handle the vertical scroll bar being moved (which represents the whole file)
+    def scroll_file_viewer(self, action, amount, unit = None):
+        # Check to see if the scroll bar was dragged or clicked to a position
+        if action == 'moveto':
+            # Call the function to handle moving the window to the respective section
+            self.move_file_viewer(max(min(int(float(amount) * len(self.processor.file_data)), len(self.processor.file_data) - 1), 0))
+        else:
+            # Scroll the shown lines and call the function to handle moving the window if an end was reached
+            self.txtFileViewer.yview_scroll(int(amount), unit)
+            self.check_file_viewer_edges()
+
+    # The following function is used to handle updating the vertical scroll bar so that it represents the visible lines within the whole file
+    def set_file_viewer_scrollbar(self, first, last):
+        # Grab the amount of sections in the file and in the window
+        total_sections = max(len(self.processor.file_data), 1)
+        window_sections = self.viewer_range[1] - self.viewer_range[0]
+
+        # Check to see if there's a window of sections
+        if window_sections > 0:
+            # Update the scroll bar with the fractions of the whole file
+            self.vsbFileViewer.set((self.viewer_range[0] + float(first) * window_sections) / total_sections, (self.viewer_range[0] + float(last) * window_sections) / total_sections)
+        else:
+            # Update the scroll bar with the fractions of the shown lines
+            self.vsbFileViewer.set(first, last)
 
-# Call the main function to start the application
-assister_application().display()
\ No newline at end of file
+# Check to see if the file is being ran directly (worker processes import the file as well)
+if __name__ == '__main__':
+    # Call the main function to start the application
+    assister_application().display()
\ No newline at end of file
@@ -0,0 +1,309 @@
+###
+#
+# N3rdP1um23
+# The following file is used to handle running operations on subtitle files from the command line without the application GUI
+#
+###
+
+# Import the required packages
+import argparse
+import json
+import os
+import sys
+from subtitle_processor import process_files, process_pipeline_files, detect_files
+from subtitle_cache import subtitle_cache
+from subtitle_columns import columnar_available
+from subtitle_stats import format_summaries, summarize_stats, write_stats, write_summaries
+from subtitle_operations import get_operation_names, load_plugins
+from subtitle_watcher import watch_folders
+from subtitle_server import serve_corrections
+
+# The following function is used to handle loading configuration values
+def load_config():
+    # Check to see if the config file exists
+    if os.path.exists('config.json'):
+        # Read the file
+        with open("config.json", "r") as config_file:
+            # Return the config
+            return json.load(config_file)
+
+    # Return an empty config as there isn't a config file
+    return {}
+
+# The following function is used to handle writing the provided config to the config file
+def write_config(config):
+    # Open the file writer
+    with open("config.json", "w") as config_file:
+        # Write the config to the file
+        config_file.write(json.dumps(config, indent = 4))
+
+# The following function is used to handle parsing the command line arguments
+def parse_arguments(arguments = None):
+    # Grab the config and load any plugins that provide extra operations
+    config = load_config()
+    load_plugins(config['operation_plugins'] if 'operation_plugins' in config else None)
+
+    # Create the argument parser
+    parser = argparse.ArgumentParser(prog = 'subtitle_assister', description = 'Your helping hand when modifying and correcting subtitles! Runs an operation on the provided files and approves all modifications.')
+
+    # Add the supported arguments
+    parser.add_argument('files', nargs = '*', help = 'the subtitle file(s) to process')
+    parser.add_argument('-o', '--operation', dest = 'operations', action = 'append', choices = get_operation_names(), metavar = 'OPERATION', help = 'the operation to perform on the file(s) (can be repeated to perform the operations in order as a pipeline, or with --detect)')
+    parser.add_argument('-p', '--pipeline', help = 'perform the operations of a pipeline saved in config.json in order (loading and saving each file once)')
+    parser.add_argument('--save-pipeline', metavar = 'NAME', help = 'save the provided operations to config.json as a pipeline with the provided name')
+    parser.add_argument('-d', '--output-directory', help = 'the directory to write the modified file(s) to instead of modifying them in place')
+    parser.add_argument('-w', '--workers', type = int, default = 1, help = 'the amount of worker processes to spread the files over (0 uses one per processor)')
+    parser.add_argument('-m', '--memory-map', action = 'store_true', help = 'memory map the file(s) instead of reading them into memory, only decoding the sections being detected or modified (useful for very large files)')
+    parser.add_argument('--columnar', action = 'store_true', help = 'check the lines of many sections at once for the operations that support it (requires numpy, ignored with --memory-map)')
+    parser.add_argument('--fsync', action = 'store_true', help = 'flush each saved file to disk before it replaces the original')
+    parser.add_argument('--cache', nargs = '?', const = subtitle_cache.default_path, metavar = 'PATH', help = 'skip files whose content has already been processed by the operation, storing the results in a cache (%s next to config.json unless a path is provided)' % subtitle_cache.default_path)
+    parser.add_argument('--detect', action = 'store_true', help = 'only report the amount of matches for each operation in a single pass over each file (uses the favourite operations from config.json when no operation is provided)')
+    parser.add_argument('--find', default = '', help = 'the word or sentence to find when using the "Find and replace" operation')
+    parser.add_argument('--replace', default = '', help = 'the value to replace the found word or sentence with when using the "Find and replace" operation')
+    parser.add_argument('--stats', action = 'store_true', help = 'display how long each stage took along with the throughput and bytes read and written once all of the files are handled')
+    parser.add_argument('--stats-file', metavar = 'PATH', help = 'write the stats of each file (or the summary of each operation when serving) to the provided path (as csv when the path ends with .csv, otherwise as json)')
+    parser.add_argument('--watch', action = 'append', metavar = 'FOLDER', help = 'keep running and perform the operation (or pipeline) on each new or changed .srt/.vtt file in the folder, writing it to --output-directory (can be repeated)')
+    parser.add_argument('--settle-time', type = float, default = 2.0, metavar = 'SECONDS', help = 'how long a watched file has to go without changing before it\'s handled (default 2)')
+    parser.add_argument('--poll-interval', type = float, default = 1.0, metavar = 'SECONDS', help = 'how often the watched folders are checked (default 1)')
+    parser.add_argument('--poll', action = 'store_true', help = 'poll the watched folders instead of using inotify (such as for network shares)')
+    parser.add_argument('--serve', metavar = '[HOST:]PORT', help = 'keep running and serve corrections over http (POST subtitle text to /correct or /detect with operation or pipeline parameters), listening on localhost unless a host is provided')
+    parser.add_argument('--max-concurrent', type = int, metavar = 'REQUESTS', help = 'the most requests that are processed at once when serving (defaults to the amount of workers)')
+    parser.add_argument('--keep-alive', type = float, default = 5.0, metavar = 'SECONDS', help = 'how long idle connections are kept open when serving (default 5)')
+    parser.add_argument('--request-timeout', type = float, default = 30.0, metavar = 'SECONDS', help = 'how long a client has to send the rest of a request once it has started when serving (default 30)')
+    parser.add_argument('--list-operations', action = 'store_true', help = 'list the available operations and exit')
+
+    # Parse the arguments
+    parsed_arguments = parser.parse_args(arguments)
+
+    # Check to see if the user is only listing the operations
+    if parsed_arguments.list_operations:
+        # Return the parsed arguments as no further validation is needed
+        return parsed_arguments
+
+    # Check to see if the user is performing a saved pipeline
+    if parsed_arguments.pipeline is not None:
+        # Grab the saved pipelines
+        pipelines = config['pipelines'] if 'pipelines' in config else {}
+
+        # Check to see if the operations were also provided or the pipeline doesn't exist
+        if parsed_arguments.operations is not None:
+            # Display the error and exit
+            parser.error('use either --operation or --pipeline')
+        elif parsed_arguments.pipeline not in pipelines:
+            # Display the error and exit
+            parser.error('the pipeline "%s" isn\'t saved in config.json (saved pipelines: %s)' % (parsed_arguments.pipeline, ', '.join(sorted(pipelines)) or 'none'))
+
+        # Grab the operations of the pipeline
+        parsed_arguments.operations = list(pipelines[parsed_arguments.pipeline])
+
+        # Check to see if any of the operations aren't available
+        for operation in [operation for operation in parsed_arguments.operations if operation not in get_operation_names()]:
+            # Display the error and exit
+            parser.error('the pipeline "%s" has an unknown operation "%s"' % (parsed_arguments.pipeline, operation))
+
+    # Check to see if the user is saving a pipeline
+    if parsed_arguments.save_pipeline is not None:
+        # Check to see if the operations are missing
+        if parsed_arguments.operations is None:
+            # Display the error and exit
+            parser.error('--save-pipeline requires the operations of the pipeline')
+
+        # Store the pipeline in the config and save it
+        config['pipelines'] = dict(config['pipelines'] if 'pipelines' in config else {}, **{parsed_arguments.save_pipeline: parsed_arguments.operations})
+        write_config(config)
+
+        # Check to see if there aren't any files to perform the pipeline on
+        if len(parsed_arguments.files) == 0:
+            # Return the parsed arguments as the pipeline was only being saved
+            return parsed_arguments
+
+    # Check to see if the user is detecting without providing any operations
+    if parsed_arguments.detect and parsed_arguments.operations is None:
+        # Use the favourite operations
+        parsed_arguments.operations = config['favourite_operations'] if 'favourite_operations' in config and len(config['favourite_operations']) > 0 else None
+
+    # Check to see if the user is serving corrections
+    if parsed_arguments.serve is not None:
+        # Grab the host and port to listen on
+        host, _, port = parsed_arguments.serve.rpartition(':')
+        parsed_arguments.serve = (host or '127.0.0.1', int(port) if port.isdigit() else -1)
+
+        # Check to see if the port is invalid, or the server has been given operations, files, or folders to watch
+        if not 0 <= parsed_arguments.serve[1] <= 65535:
+            # Display the error and exit
+            parser.error('--serve requires a port between 0 and 65535')
+        elif parsed_arguments.operations is not None or len(parsed_arguments.files) > 0 or parsed_arguments.watch is not None or parsed_arguments.detect:
+            # Display the error and exit
+            parser.error('--serve can\'t be used with operations, files, --watch, or --detect (they\'re sent with each request)')
+        elif parsed_arguments.max_concurrent is not None and parsed_arguments.max_concurrent < 1:
+            # Display the error and exit
+            parser.error('--max-concurrent must be 1 or greater')
+
+        # Check to see if the columnar backend was requested without numpy being installed
+        if parsed_arguments.columnar and not columnar_available():
+            # Display the error and exit
+            parser.error('--columnar requires numpy to be installed')
+
+        # Return the parsed arguments as the operations are sent with each request
+        return parsed_arguments
+
+    # Check to see if the user is watching folders
+    if parsed_arguments.watch is not None:
+        # Check to see if the watch is missing its operation or output directory, or has been given files or --detect
+        if parsed_arguments.operations is None or parsed_arguments.output_directory is None:
+            # Display the error and exit
+            parser.error('--watch requires an operation (or pipeline) and --output-directory')
+        elif len(parsed_arguments.files) > 0 or parsed_arguments.detect:
+            # Display the error and exit
+            parser.error('--watch can\'t be used with files or --detect')
+
+        # Iterate over each of the watched folders
+        for folder in parsed_arguments.watch:
+            # Check to see if the folder doesn't exist or is the output directory (which would handle each written file again)
+            if not os.path.isdir(folder):
+                # Display the error and exit
+                parser.error('the watched folder "%s" doesn\'t exist' % folder)
+            elif os.path.abspath(folder) == os.path.abspath(parsed_arguments.output_directory):
+                # Display the error and exit
+                parser.error('the output directory can\'t be one of the watched folders')
+    elif parsed_arguments.operations is None or len(parsed_arguments.files) == 0:
+        # Display the error and exit
+        parser.error('an operation and at least one file are required')
+
+    # Check to see if a pipeline of operations is being cached
+    if not parsed_arguments.detect and len(parsed_arguments.operations) > 1 and parsed_arguments.cache is not None:
+        # Display the error and exit
+        parser.error('--cache can only be used with a single operation')
+
+    # Check to see if the worker count is invalid
+    if parsed_arguments.workers < 0:
+        # Display the error and exit
+        parser.error('--workers must be 0 or greater')
+
+    # Check to see if the columnar backend was requested without numpy being installed
+    if parsed_arguments.columnar and not columnar_available():
+        # Display the error and exit
+        parser.error('--columnar requires numpy to be installed')
+
+    # Check to see if the user is finding and replacing without a value to find
+    if 'Find and replace' in parsed_arguments.operations and parsed_arguments.find == '':
+        # Display the error and exit
+        parser.error('--find is required when using the "Find and replace" operation')
+
+    # Return the parsed arguments
+    return parsed_arguments
+
+# The following function is used as the main entry point of the command line interface
+def main(arguments = None):
+    # Call the function to handle parsing the command line arguments
+    parsed_arguments = parse_arguments(arguments)
+
+    # Check to see if the user is only listing the operations
+    if parsed_arguments.list_operations:
+        # Iterate over each of the operations and display them
+        for operation in get_operation_names():
+            print(operation)
+
+        # Return to stop further processing
+        return 0
+
+    # Check to see if the user was only saving a pipeline
+    if parsed_arguments.save_pipeline is not None and len(parsed_arguments.files) == 0:
+        # Display that the pipeline was saved
+        print('Saved the pipeline "%s": %s' % (parsed_arguments.save_pipeline, ' > '.join(parsed_arguments.operations)))
+
+        # Return to stop further processing
+        return 0
+
+    # Grab the plugins that provide extra operations (so that they're loaded in the worker processes as well)
+    config = load_config()
+    plugins = config['operation_plugins'] if 'operation_plugins' in config else None
+
+    # Create the find and replace values
+    find_and_replace = {'find': parsed_arguments.find, 'replace': parsed_arguments.replace if parsed_arguments.replace != '' else None}
+
+    # Create a variable that tracks if any of the files failed, a list to hold the stats of each file, and the summaries of each operation when serving (as there aren't any files)
+    exit_code = 0
+    file_stats = []
+    operation_summaries = None
+
+    # Check to see if the user is serving corrections
+    if parsed_arguments.serve is not None:
+        # Serve the corrections until interrupted and store the summaries of the stats for each operation (there aren't any file summaries to display)
+        operation_summaries = serve_corrections(parsed_arguments.serve[0], parsed_arguments.serve[1], parsed_arguments.workers or None, parsed_arguments.max_concurrent, parsed_arguments.keep_alive, plugins, config['pipelines'] if 'pipelines' in config else None, parsed_arguments.columnar, lambda port: print('Serving corrections on http://%s:%d (press Ctrl+C to stop)' % (parsed_arguments.serve[0], port), file = sys.stderr, flush = True), parsed_arguments.request_timeout)
+        summaries = []
+    elif parsed_arguments.watch is not None:
+        # Display the folders being watched
+        print('Watching %s for new subtitle files (press Ctrl+C to stop)' % ', '.join(parsed_arguments.watch), file = sys.stderr)
+
+        # Grab the summaries of the files as they're picked up and processed (until interrupted)
+        summaries = watch_folders(parsed_arguments.watch, parsed_arguments.operations, parsed_arguments.output_directory, find_and_replace, parsed_arguments.workers or None, parsed_arguments.memory_map, parsed_arguments.fsync, parsed_arguments.cache, plugins, parsed_arguments.columnar, parsed_arguments.settle_time, parsed_arguments.poll_interval, not parsed_arguments.poll)
+    elif parsed_arguments.detect:
+        # Grab the summaries of the files as they're detected
+        summaries = detect_files(parsed_arguments.files, parsed_arguments.operations, find_and_replace, parsed_arguments.workers or None, parsed_arguments.memory_map, plugins, parsed_arguments.columnar)
+    elif len(parsed_arguments.operations) > 1:
+        # Grab the summaries of the files as the operations are performed on them in order
+        summaries = process_pipeline_files(parsed_arguments.files, parsed_arguments.operations, find_and_replace, parsed_arguments.output_directory, parsed_arguments.workers or None, parsed_arguments.memory_map, parsed_arguments.fsync, plugins, parsed_arguments.columnar)
+    else:
+        # Grab the summaries of the files as they're processed
+        summaries = process_files(parsed_arguments.files, parsed_arguments.operations[0], find_and_replace, parsed_arguments.output_directory, parsed_arguments.workers or None, parsed_arguments.memory_map, parsed_arguments.fsync, parsed_arguments.cache, plugins, parsed_arguments.columnar)
+
+    # Iterate over each of the file summaries (watching folders yields the files being processed once it's interrupted, and stops quietly if it's interrupted again)
+    try:
+        for summary in summaries:
+            # Grab the file that was handled
+            file = summary['file']
+
+            # Check to see if the file has stats
+            if 'stats' in summary:
+                # Store the stats of the file
+                file_stats.append(summary['stats'])
+
+            # Check to see if the file was missing
+            if summary['status'] == 'missing':
+                # Display an error message and flag the failure
+                print(file + ' is missing. Skipping.', file = sys.stderr)
+                exit_code = 1
+            elif summary['status'] == 'error':
+                # Display the error and flag the failure
+                print('{file} could not be processed ({error}). Skipping.'.format(file = file, error = summary['error']), file = sys.stderr)
+                exit_code = 1
+            elif isinstance(summary['matches'], dict):
+                # Display the summary of each operation for the file
+                for operation, matches in summary['matches'].items():
+                    print('{file}: {operation}: {matches} match(es)'.format(file = file, operation = operation, matches = matches))
+            else:
+                # Display the summary of the file
+                print('{file}: {matches} match(es){cached}'.format(file = file, matches = summary['matches'], cached = ' (cached)' if 'cached' in summary else ''))
+    except KeyboardInterrupt:
+        # Check to see if the folders weren't being watched
+        if parsed_arguments.watch is None:
+            # Raise the interruption again
+            raise
+
+        # Stop watching the folders without waiting on the summaries of the files being processed
+        summaries.close()
+
+    # Check to see if the stats should be displayed
+    if parsed_arguments.stats:
+        # Display the summary of the stats
+        for line in format_summaries(operation_summaries if operation_summaries is not None else summarize_stats(file_stats)):
+            print(line, file = sys.stderr)
+
+    # Check to see if the stats should be written to a file
+    if parsed_arguments.stats_file:
+        # Check to see if corrections were served
+        if operation_summaries is not None:
+            # Write the summaries of each operation
+            write_summaries(operation_summaries, parsed_arguments.stats_file)
+        else:
+            # Write the stats of each file
+            write_stats(file_stats, parsed_arguments.stats_file)
+
+    # Return the exit code
+    return exit_code
+
+# Check to see if the file is being ran directly
+if __name__ == '__main__':
+    # Call the main function and exit with the respective code
+    sys.exit(main())
@@ -0,0 +1,69 @@
+###
+#
+# N3rdP1um23
+# The following file is used to handle caching the results of running operations on subtitle files so that unchanged files can be skipped
+#
+###
+
+# Import the required packages
+import hashlib
+import json
+import sqlite3
+import zlib
+
+# The following function is used to handle hashing the content of a file without reading it all into memory at once
+def hash_file(file_path):
+    # Create the hash
+    content_hash = hashlib.sha256()
+
+    # Open the file and hash it in chunks
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            content_hash.update(chunk)
+
+    # Return the hash
+    return content_hash.hexdigest()
+
+# The following function is used to handle creating the key of an operation (including the find and replace values as they change the result)
+def get_operation_key(operation, find_and_replace = None):
+    # Return the key
+    return operation + (json.dumps(find_and_replace, sort_keys = True) if operation == 'Find and replace' and find_and_replace is not None else '')
+
+# The following is a class that's used for storing and looking up the results of operations keyed by the content of the file
+class subtitle_cache:
+    # Create the class specific properties
+    default_path = 'subtitle_cache.db'
+
+    # The following function is used as a constructor
+    def __init__(self, path = None):
+        # Open the cache (waiting on other processes that are writing to it)
+        self.connection = sqlite3.connect(path if path is not None else self.default_path, timeout = 60)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+
+        # Create the results table if it doesn't exist
+        with self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS results (content_hash TEXT NOT NULL, operation TEXT NOT NULL, rules_version TEXT NOT NULL, matches INTEGER NOT NULL, output_hash TEXT NOT NULL, output BLOB, PRIMARY KEY (content_hash, operation, rules_version))')
+
+    # The following function is used to handle looking up the result of an operation for the content of a file
+    def get(self, content_hash, operation, rules_version):
+        # Grab the result
+        result = self.connection.execute('SELECT matches, output_hash, output FROM results WHERE content_hash = ? AND operation = ? AND rules_version = ?', (content_hash, operation, rules_version)).fetchone()
+
+        # Check to see if there isn't a result
+        if result is None:
+            # Return nothing as the content hasn't been processed by the operation
+            return None
+
+        # Return the result with the output decompressed (the output is only stored when a file was written)
+        return {'matches': result[0], 'output_hash': result[1], 'output': zlib.decompress(result[2]) if result[2] is not None else None}
+
+    # The following function is used to handle storing the result of an operation for the content of a file
+    def put(self, content_hash, operation, rules_version, matches, output_hash, output = None):
+        # Store the result (compressing the output if there is one)
+        with self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)', (content_hash, operation, rules_version, matches, output_hash, zlib.compress(output) if output is not None else None))
+
+    # The following function is used to handle closing the cache
+    def close(self):
+        # Close the connection
+        self.connection.close()
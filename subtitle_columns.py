@@ -0,0 +1,108 @@
+###
+#
+# N3rdP1um23
+# The following file is used to handle checking the lines of many sections at once by storing them in columns (only available when numpy is installed)
+#
+###
+
+# Import the required packages
+import itertools
+import operator
+
+# Attempt to import numpy (the columnar backend isn't available without it)
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The following function is used to check if the columnar backend can be used
+def columnar_available():
+    # Return if numpy was imported
+    return numpy is not None
+
+# The following is a class that's used to store the lines of many sections in a single column (along with which section each line belongs to) so that simple line checks can be ran over all of them at once
+class cue_table:
+    # The following function is used as a constructor
+    def __init__(self, sections):
+        # Grab the lines of each of the sections
+        texts = list(map(operator.attrgetter('text'), sections))
+
+        # Store the amount of sections and the amount of lines in each section
+        self.size = len(texts)
+        self.line_counts = numpy.fromiter(map(len, texts), dtype = numpy.intp, count = self.size)
+
+        # Store all of the lines in a single column (kept as strings as building a fixed width numpy string array costs more than the checks save) along with the section that each line belongs to and the position of each section's last line
+        self.lines = list(itertools.chain.from_iterable(texts))
+        self.line_sections = numpy.repeat(numpy.arange(self.size), self.line_counts)
+        self.last_lines = numpy.cumsum(self.line_counts) - 1
+
+    ###
+    #
+    # Line functions
+    #
+    ###
+
+    # The following function is used to handle calling the provided string function on every line (along with any provided arguments) and storing the results in a column
+    def map_lines(self, function, dtype, *arguments):
+        # Return the results of each line
+        return numpy.fromiter(map(function, self.lines, *[itertools.repeat(argument) for argument in arguments]), dtype = dtype, count = len(self.lines))
+
+    # The following function is used to grab which lines are full uppercase
+    def upper_lines(self):
+        # Return if each line is full uppercase
+        return self.map_lines(str.isupper, bool)
+
+    # The following function is used to grab the length of each line
+    def line_lengths(self):
+        # Return the length of each line
+        return self.map_lines(len, numpy.intp)
+
+    # The following function is used to grab the amount of times the provided value appears in each line
+    def count_in_lines(self, value):
+        # Return the amount of (non overlapping) times the value appears in each line
+        return self.map_lines(str.count, numpy.intp, value)
+
+    # The following function is used to grab which lines end with the provided value
+    def lines_ending_with(self, value):
+        # Return if each line ends with the value
+        return self.map_lines(str.endswith, bool, value)
+
+    # The following function is used to grab which lines aren't the last line in their section
+    def leading_lines(self):
+        # Flag every line other than the last line of each section (sections without lines don't have a last line)
+        leading_lines = numpy.ones(len(self.lines), dtype = bool)
+        leading_lines[self.last_lines[self.line_counts > 0]] = False
+
+        # Return the flagged lines
+        return leading_lines
+
+    ###
+    #
+    # Section functions
+    #
+    ###
+
+    # The following function is used to grab which sections have any of the flagged lines
+    def any_lines(self, flags):
+        # Return if each section has at least one flagged line
+        return self.sum_lines(flags) > 0
+
+    # The following function is used to grab the total of the provided line values for each section
+    def sum_lines(self, values):
+        # Return the sum of the values of each section's lines (sections without lines have a total of 0)
+        return numpy.bincount(self.line_sections, weights = values, minlength = self.size)
+
+    # The following function is used to grab the provided line value of each section's last line
+    def last_line_values(self, values):
+        # Check to see if there aren't any lines
+        if len(values) == 0:
+            # Return empty values for each section
+            return numpy.zeros(self.size, dtype = values.dtype)
+
+        # Return the value of each section's last line (sections without lines are given a neighbouring line's value as they're always detected one at a time anyway)
+        return values[numpy.maximum(self.last_lines, 0)]
+
+    # The following function is used to grab the positions of the flagged sections (offset by the position of the table's first section in the file)
+    def flagged_positions(self, flags, offset = 0):
+        # Return the positions of the flagged sections along with any sections without lines (so that they're still detected one at a time)
+        return (numpy.flatnonzero(flags | (self.line_counts == 0)) + offset).tolist()
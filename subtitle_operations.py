@@ -0,0 +1,927 @@
+###
+#
+# N3rdP1um23
+# The following file is used to handle the operations that can be performed on subtitle files (and registering any extra operations provided by plugins)
+#
+###
+
+# Import the required packages
+import importlib
+import importlib.util
+import os
+import sys
+import regex
+
+# Create the registry of the available operations keyed by their names
+operation_registry = {}
+
+# Create a variable that tracks the plugins that have already been loaded
+loaded_plugins = set()
+
+# The following function is used to handle compiling the provided (nested) regex statements
+def compile_statements(statements, flags = 0):
+    # Return the compiled statements keyed the same way as the provided statements
+    return {key: compile_statements(statement, flags) if isinstance(statement, dict) else regex.compile(statement, flags) for key, statement in statements.items()}
+
+# The following function is used to handle registering an operation so that it can be performed (replacing any operation with the same name)
+def register_operation(operation):
+    # Store the operation by its name
+    operation_registry[operation.name] = operation
+
+    # Return the operation
+    return operation
+
+# The following function is used to handle grabbing an operation by its name
+def get_operation(name):
+    # Return the operation
+    return operation_registry[name]
+
+# The following function is used to handle grabbing the names of the available operations
+def get_operation_names():
+    # Return the sorted names of the operations
+    return sorted(operation_registry)
+
+# The following function is used to handle loading plugins that register extra operations (either module names or paths to python files)
+def load_plugins(plugins = None):
+    # Iterate over each of the plugins that haven't been loaded yet
+    for plugin in [plugin for plugin in (plugins if plugins is not None else []) if plugin not in loaded_plugins]:
+        # Check to see if the plugin is a path to a python file
+        if plugin.endswith('.py'):
+            # Load the file as a module (adding it to the loaded modules so that its operations can be found by their module)
+            specification = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(plugin))[0], plugin)
+            module = importlib.util.module_from_spec(specification)
+            sys.modules[specification.name] = module
+            specification.loader.exec_module(module)
+        else:
+            # Import the module
+            importlib.import_module(plugin)
+
+        # Store that the plugin has been loaded
+        loaded_plugins.add(plugin)
+
+# The following is a class that's used as the base of the operations, which detect the sections that need modifying and modify them a line at a time
+class subtitle_operation:
+    # Create the class specific properties
+    name = None
+    span = 1 # The amount of sections the operation spans
+    changes_time = False # If the operation modifies the time setting of the sections
+    always_save = False # If files should be saved even when nothing has changed
+    converts_to_srt = False # If files are saved as srt files (without the vtt header or settings)
+    statement = None # The statement that's used to detect the lines to modify
+    statements = {} # The named statements that are used to detect the sections to modify
+    modification_statements = {} # The named statements that are used when modifying the lines
+    filter_sections = None # The function that checks which sections of a cue table could need modifying in bulk (None when the sections can only be detected one at a time)
+
+    # The following function is used as a constructor
+    def __init__(self):
+        # Compile the operation's statements once so they aren't compiled (or looked up in the regex cache) for every line (the section statement is ran once over all lines of a section where ^ and $ still match at each line)
+        self.compiled_statement = regex.compile(self.statement) if self.statement is not None else None
+        self.compiled_section_statement = regex.compile(self.statement, regex.MULTILINE) if self.statement is not None else None
+        self.compiled_statements = compile_statements(self.statements)
+        self.compiled_modification_statements = compile_statements(self.modification_statements)
+
+    # The following function is used to detect if the section(s) starting at the provided position need modifying
+    def detect(self, processor, section_index):
+        # Raise an error as each operation needs to provide its own detection
+        raise NotImplementedError(self.name + ' does not detect any sections')
+
+    # The following function is used to handle modifying the time setting of the section before its lines are modified
+    def modify_time(self, processor, current_data):
+        # Leave the time setting untouched by default
+        pass
+
+    # The following function is used to handle modifying a line of the section (returning the amount of lines to skip over if the section needs to be processed further)
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Leave the line untouched by default
+        pass
+
+# The following is a class that's used for operations that detect sections that have any line matching the operation's statement
+class any_line_operation(subtitle_operation):
+    # The following function is used to detect sections that have any line matching the operation's statement
+    def detect(self, processor, section_index):
+        # Return if there's a line that needs handling (searching all of the lines at once)
+        return bool(self.compiled_section_statement.search(processor.get_section_text(section_index)))
+
+# The following is a class that's used for operations that detect sections where the last line matches the operation's statement
+class last_line_operation(subtitle_operation):
+    # The following function is used to detect sections where the last line matches the operation's statement
+    def detect(self, processor, section_index):
+        # Return if the last line needs handling
+        return bool(self.compiled_statement.search(processor.file_data[section_index].text[-1]))
+
+# The following is a class that's used for operations that detect sections that have a full uppercase line
+class uppercase_line_operation(subtitle_operation):
+    # The following function is used to detect sections that have a full uppercase line
+    def detect(self, processor, section_index):
+        # Return if there's a line that needs handling
+        return any(line.isupper() for line in processor.file_data[section_index].text)
+
+    # The following function is used to check which sections of a cue table have a full uppercase line
+    def filter_sections(self, table):
+        # Return if each section has a line that needs handling
+        return table.any_lines(table.upper_lines())
+
+# The following is a class that's used for operations that modify every section
+class all_sections_operation(subtitle_operation):
+    # The following function is used to detect every section
+    def detect(self, processor, section_index):
+        # Return True as every section needs modification
+        return True
+
+# The following is a class that's used for adding the missing dashes to split lines
+class add_dashes_to_split_lines(subtitle_operation):
+    # Create the class specific properties
+    span = 2
+
+    # The following function is used to detect split lines that are missing their dashes
+    def detect(self, processor, section_index):
+        # Grab the last line of the first section and the first line of the second section
+        first_section_line = processor.file_data[section_index].text[-1].strip()
+        second_section_line = processor.file_data[section_index + 1].text[0].strip()
+
+        # Create variables that represent different cases
+        positive_first_section = self.compiled_statements['positive_first_section'].search(first_section_line) # Determine if the last line in the first section is correctly formatted as a "split line with a dash"
+        negative_first_section = self.compiled_statements['negative_first_section'].search(first_section_line) # Determine if the last line in the first section is incorrectly formatted as a "split line with a dash"
+        positive_second_section = self.compiled_statements['positive_second_section'].search(second_section_line) # Determine if the first line in the second section is correctly formatted as a "split line with a dash"
+        negative_second_section = self.compiled_statements['negative_second_section'].search(second_section_line) # Determine if the first line in the second section is incorrectly formatted as a "split line with a dash"
+
+        # Return if either of the sections need correcting
+        return not bool(positive_first_section and positive_second_section) and (bool(negative_first_section and negative_second_section) or bool(positive_first_section and negative_second_section) or bool(negative_first_section and positive_second_section))
+
+    # The following function is used to handle adding the missing dashes to the last line of the first section and the first line of the second section
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the current section isn't the last section in the file
+        if index == (len(current_data.text) - 1):
+            # Create variables that represent different cases
+            positive_first_section = self.compiled_statements['positive_first_section'].search(line.strip()) # Determine if the last line in the first section is correctly formatted as a "split line with a dash"
+            negative_first_section = self.compiled_statements['negative_first_section'].search(line.strip()) # Determine if the last line in the first section is incorrectly formatted as a "split line with a dash"
+            positive_second_section = self.compiled_statements['positive_second_section'].search(next_data.text[0].strip()) # Determine if the first line in the second section is correctly formatted as a "split line with a dash"
+            negative_second_section = self.compiled_statements['negative_second_section'].search(next_data.text[0].strip()) # Determine if the first line in the second section is incorrectly formatted as a "split line with a dash"
+
+            # Check to see if either of the sections need correcting
+            if not bool(positive_first_section and positive_second_section) and (bool(negative_first_section and negative_second_section) or bool(positive_first_section and negative_second_section) or bool(negative_first_section and positive_second_section)):
+                # Check to see if the first section needs correcting
+                if negative_first_section:
+                    # Check to see which scenario the line falls under and correct it accordingly
+                    if self.compiled_modification_statements['first_section_word'].search(line.strip()): # word, possible special character/nothing
+                        # Append the line ending dash
+                        current_data.text[index] = line.strip() + '-'
+                    elif self.compiled_modification_statements['first_section_word_spaced_dash'].search(line.strip()): # word, possible special character/nothing, spaced dash
+                        # Append the line ending dash
+                        current_data.text[index] = line.strip()[:-2].strip() + '-'
+                    elif self.compiled_modification_statements['first_section_word_quote'].search(line.strip()): # word, possible special character/nothing, quote
+                        # Append the line ending dash
+                        current_data.text[index] = line.strip()[:-1].strip() + '"-'
+                    elif self.compiled_modification_statements['first_section_word_spaced_quote'].search(line.strip()): # word, possible special character/nothing, spaced quote
+                        # Append the line ending dash
+                        current_data.text[index] = line.strip()[:-2].strip() + '"-'
+                    elif self.compiled_modification_statements['first_section_word_spaced_dash_quote'].search(line.strip()): # word, possible special character/nothing, spaced dash, quote
+                        # Append the line ending dash
+                        current_data.text[index] = line.strip()[:-3].strip() + '"-'
+                    elif self.compiled_modification_statements['first_section_word_starting_italics'].search(line.strip()): # word, possible special character/nothing, starting italics tag
+                        # Append the line ending dash
+                        current_data.text[index] = line.strip()[:-3].strip() + '-<i>'
+                    elif self.compiled_modification_statements['first_section_word_spaced_dash_starting_italics'].search(line.strip()): # word, possible special character/nothing, spaced dash, starting italics tag
+                        # Append the line ending dash
+                        current_data.text[index] = line.strip()[:-5].strip() + '-<i>'
+                    elif self.compiled_modification_statements['first_section_word_closing_italics'].search(line.strip()): # word, possible special character/nothing, closing italics tag
+                        # Append the line ending dash
+                        current_data.text[index] = line.strip()[:-4].strip() + '-</i>'
+                    elif self.compiled_modification_statements['first_section_word_spaced_dash_closing_italics'].search(line.strip()): # word, possible special character/nothing, spaced dash, closing italics tag
+                        # Append the line ending dash
+                        current_data.text[index] = line.strip()[:-6].strip() + '-</i>'
+
+                    # Check to see if the line ending includes a comma before the dash
+                    if self.compiled_modification_statements['first_section_comma_dash'].search(current_data.text[index].strip()):
+                        # Replace the special character instance
+                        current_data.text[index] = current_data.text[index].strip()[::-1]
+                        current_data.text[index] = current_data.text[index].strip().replace(',', '', 1)
+                        current_data.text[index] = current_data.text[index].strip()[::-1]
+
+                    # Check to see if the line ending includes and ellipsies before the dash
+                    if self.compiled_modification_statements['first_section_ellipsis_dash'].search(current_data.text[index].strip()):
+                        # Replace the special character instance
+                        current_data.text[index] = current_data.text[index].strip()[::-1]
+                        current_data.text[index] = current_data.text[index].strip().replace('...', '', 1)
+                        current_data.text[index] = current_data.text[index].strip()[::-1]
+
+                # Check to see if the second section needs correcting
+                if negative_second_section:
+                    # Check to see which scenario the line falls under and correct it accordingly
+                    if self.compiled_modification_statements['second_section_word'].search(next_data.text[0].strip()): # word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '-' + next_data.text[0].strip()
+                    elif self.compiled_modification_statements['second_section_spaced_dash_word'].search(next_data.text[0].strip()): # dash, space, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '-' + next_data.text[0].strip()[2:].strip()
+                    elif self.compiled_modification_statements['second_section_spaced_dash_double_quote_word'].search(next_data.text[0].strip()): # dash, space, double quote, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '-"' + next_data.text[0].strip()[3:].strip()
+                    elif self.compiled_modification_statements['second_section_spaced_dash_single_quote_word'].search(next_data.text[0].strip()): # dash, space, single quote, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '-\'' + next_data.text[0].strip()[3:].strip()
+                    elif self.compiled_modification_statements['second_section_double_quote_word'].search(next_data.text[0].strip()): # double quote, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '-"' + next_data.text[0].strip()[1:].strip()
+                    elif self.compiled_modification_statements['second_section_single_quote_word'].search(next_data.text[0].strip()): # single quote, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '-\'' + next_data.text[0].strip()[1:].strip()
+                    elif self.compiled_modification_statements['second_section_dollar_word'].search(next_data.text[0].strip()): # dollar, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '-$' + next_data.text[0].strip()[1:].strip()
+                    elif self.compiled_modification_statements['second_section_quote_spaced_dash_word'].search(next_data.text[0].strip()): # quote, dash, space, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '-"' + next_data.text[0].strip()[3:].strip()
+                    elif self.compiled_modification_statements['second_section_spaced_quote_word'].search(next_data.text[0].strip()): # spaced quote, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '-"' + next_data.text[0].strip()[2:].strip()
+                    elif self.compiled_modification_statements['second_section_starting_italics_word'].search(next_data.text[0].strip()): # starting italics tag, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '<i>-' + next_data.text[0].strip()[3:].strip()
+                    elif self.compiled_modification_statements['second_section_starting_italics_space_word'].search(next_data.text[0].strip()): # starting italics tag, space, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '<i>-' + next_data.text[0].strip()[4:].strip()
+                    elif self.compiled_modification_statements['second_section_starting_italics_spaced_dash_word'].search(next_data.text[0].strip()): # starting italics tag, dash, space, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '<i>-' + next_data.text[0].strip()[5:].strip()
+                    elif self.compiled_modification_statements['second_section_starting_italics_quote_word'].search(next_data.text[0].strip()): # starting italics tag, quote, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '<i>-"' + next_data.text[0].strip()[4:].strip()
+                    elif self.compiled_modification_statements['second_section_closing_italics_word'].search(next_data.text[0].strip()): # closing italics tag, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '</i>-' + next_data.text[0].strip()[4:].strip()
+                    elif self.compiled_modification_statements['second_section_closing_italics_space_word'].search(next_data.text[0].strip()): # closing italics tag, space, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '</i>-' + next_data.text[0].strip()[5:].strip()
+                    elif self.compiled_modification_statements['second_section_closing_italics_spaced_dash_word'].search(next_data.text[0].strip()): # closing italics tag, dash, space, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '</i>-' + next_data.text[0].strip()[6:].strip()
+                    elif self.compiled_modification_statements['second_section_ending_italics_quote_word'].search(next_data.text[0].strip()): # ending italics tag, quote, word
+                        # Prepend the line starting dash
+                        next_data.text[0] = '<i>-"' + next_data.text[0].strip()[5:].strip()
+
+# The following is a class that's used for adding the missing dashes to split lines where the second section starts with a lowercase character
+class add_dashes_to_split_lines_lowercase(add_dashes_to_split_lines):
+    # Create the class specific properties
+    name = 'Add dashes to split lines (lowercase)'
+    statements = {
+        'positive_first_section': r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?(\"|\”|\'|\$)?(\-|\–)(\"|\”|\'|\$)?(\<i\>|\<\/i\>)?$',
+        'negative_first_section': r'(\d+|[[:lower:]]|[[:upper:]])(\ |\,|\.\.\.)?(\"|\”|\'|\$)?(\ )?(\-|\–)?(\"|\”|\'|\$)?(\<i\>|\<\/i\>)?$',
+        'positive_second_section': r'^(\<i\>|\<\/i\>)?(\"|\”|\'|\$)?(\-|\–)(\"|\”|\'|\$)?(\d+|[[:lower:]])',
+        'negative_second_section': r'^(\<i\>|\<\/i\>)?(\"|\”|\'|\$)?(\-|\–)?(\ )?(\"|\”|\'|\$)?(\ )?(\d+|[[:lower:]])',
+    }
+    modification_statements = {
+        'first_section_word': r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?$',
+        'first_section_word_spaced_dash': r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\ (\-|\–)$',
+        'first_section_word_quote': r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?(\"|\”)$',
+        'first_section_word_spaced_quote': r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\ (\"|\”)$',
+        'first_section_word_spaced_dash_quote': r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\ (\-|\–)(\"|\”)$',
+        'first_section_word_starting_italics': r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\<i\>$',
+        'first_section_word_spaced_dash_starting_italics': r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\ (\-|\–)\<i\>$',
+        'first_section_word_closing_italics': r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\<\/i\>$',
+        'first_section_word_spaced_dash_closing_italics': r'(\d+|[[:lower:]]|[[:upper:]])(\,|\.\.\.)?\ (\-|\–)\<\/i\>$',
+        'first_section_comma_dash': r'(\d+|[[:lower:]]|[[:upper:]])\,(\-|\–).*$',
+        'first_section_ellipsis_dash': r'(\d+|[[:lower:]]|[[:upper:]])\.\.\.(\-|\–).*$',
+        'second_section_word': r'^(\d+|[[:lower:]])',
+        'second_section_spaced_dash_word': r'^(\-|\–)\ (\d+|[[:lower:]])',
+        'second_section_spaced_dash_double_quote_word': r'^(\-|\–)\ (\"|\”)(\d+|[[:lower:]])',
+        'second_section_spaced_dash_single_quote_word': r'^(\-|\–)\ (\')(\d+|[[:lower:]])',
+        'second_section_double_quote_word': r'^(\"|\”)(\d+|[[:lower:]])',
+        'second_section_single_quote_word': r'^(\')(\d+|[[:lower:]])',
+        'second_section_dollar_word': r'^\$(\d+|[[:lower:]])',
+        'second_section_quote_spaced_dash_word': r'^(\"|\”)(\-|\–)\ (\d+|[[:lower:]])',
+        'second_section_spaced_quote_word': r'^(\"|\”)\ (\d+|[[:lower:]])',
+        'second_section_starting_italics_word': r'^\<i\>(\d+|[[:lower:]])',
+        'second_section_starting_italics_space_word': r'^\<i\>\ (\d+|[[:lower:]])',
+        'second_section_starting_italics_spaced_dash_word': r'^\<i\>(\-|\–)\ (\d+|[[:lower:]])',
+        'second_section_starting_italics_quote_word': r'^\<i\>(\"|\”)(\d+|[[:lower:]])',
+        'second_section_closing_italics_word': r'^\<\/i\>(\d+|[[:lower:]])',
+        'second_section_closing_italics_space_word': r'^\<\/i\>\ (\d+|[[:lower:]])',
+        'second_section_closing_italics_spaced_dash_word': r'^\<\/i\>(\-|\–)\ (\d+|[[:lower:]])',
+        'second_section_ending_italics_quote_word': r'^\<i\>(\"|\”)(\d+|[[:lower:]])',
+    }
+
+# The following is a class that's used for adding the missing dashes to split lines where the second section starts with an uppercase character
+class add_dashes_to_split_lines_uppercase(add_dashes_to_split_lines):
+    # Create the class specific properties
+    name = 'Add dashes to split lines (uppercase)'
+    statements = {
+        'positive_first_section': r'(\d+|[[:lower:]])(\,|\.\.\.)?(\"|\”|\'|\$)?(\-|\–)(\"|\”|\'|\$)?(\<i\>|\<\/i\>)?$',
+        'negative_first_section': r'(\d+|[[:lower:]])(\ |\,)?(\"|\”|\'|\$)?(\ )?(\-|\–)?(\"|\”|\'|\$)?(\<i\>|\<\/i\>)?$',
+        'positive_second_section': r'^(\<i\>|\<\/i\>)?(\"|\”|\'|\$)?(\-|\–)(\"|\”|\'|\$)?(\d+|[[:upper:]])',
+        'negative_second_section': r'^(\<i\>|\<\/i\>)?(\"|\”|\'|\$)?(\-|\–)?(\ )?(\"|\”|\'|\$)?(\ )?(\d+|[[:upper:]])',
+    }
+    modification_statements = {
+        'first_section_word': r'(\d+|[[:lower:]])(\,|\.\.\.)?$',
+        'first_section_word_spaced_dash': r'(\d+|[[:lower:]])(\,|\.\.\.)?\ (\-|\–)$',
+        'first_section_word_quote': r'(\d+|[[:lower:]])(\,|\.\.\.)?(\"|\”)$',
+        'first_section_word_spaced_quote': r'(\d+|[[:lower:]])(\,|\.\.\.)?\ (\"|\”)$',
+        'first_section_word_spaced_dash_quote': r'(\d+|[[:lower:]])(\,|\.\.\.)?\ (\-|\–)(\"|\”)$',
+        'first_section_word_starting_italics': r'(\d+|[[:lower:]])(\,|\.\.\.)?\<i\>$',
+        'first_section_word_spaced_dash_starting_italics': r'(\d+|[[:lower:]])(\,|\.\.\.)?\ (\-|\–)\<i\>$',
+        'first_section_word_closing_italics': r'(\d+|[[:lower:]])(\,|\.\.\.)?\<\/i\>$',
+        'first_section_word_spaced_dash_closing_italics': r'(\d+|[[:lower:]])(\,|\.\.\.)?\ (\-|\–)\<\/i\>$',
+        'first_section_comma_dash': r'(\d+|[[:lower:]])\,(\-|\–).*$',
+        'first_section_ellipsis_dash': r'(\d+|[[:lower:]])\.\.\.(\-|\–).*$',
+        'second_section_word': r'^(\d+|[[:upper:]])',
+        'second_section_spaced_dash_word': r'^(\-|\–)\ (\d+|[[:upper:]])',
+        'second_section_spaced_dash_double_quote_word': r'^(\-|\–)\ (\"|\”)(\d+|[[:upper:]])',
+        'second_section_spaced_dash_single_quote_word': r'^(\-|\–)\ (\')(\d+|[[:upper:]])',
+        'second_section_double_quote_word': r'^(\"|\”)(\d+|[[:upper:]])',
+        'second_section_single_quote_word': r'^(\')(\d+|[[:upper:]])',
+        'second_section_dollar_word': r'^\$(\d+|[[:upper:]])',
+        'second_section_quote_spaced_dash_word': r'^(\"|\”)(\-|\–)\ (\d+|[[:upper:]])',
+        'second_section_spaced_quote_word': r'^(\"|\”)\ (\d+|[[:upper:]])',
+        'second_section_starting_italics_word': r'^\<i\>(\d+|[[:upper:]])',
+        'second_section_starting_italics_space_word': r'^\<i\>\ (\d+|[[:upper:]])',
+        'second_section_starting_italics_spaced_dash_word': r'^\<i\>(\-|\–)\ (\d+|[[:upper:]])',
+        'second_section_starting_italics_quote_word': r'^\<i\>(\"|\”)(\d+|[[:upper:]])',
+        'second_section_closing_italics_word': r'^\<\/i\>(\d+|[[:upper:]])',
+        'second_section_closing_italics_space_word': r'^\<\/i\>\ (\d+|[[:upper:]])',
+        'second_section_closing_italics_spaced_dash_word': r'^\<\/i\>(\-|\–)\ (\d+|[[:upper:]])',
+        'second_section_ending_italics_quote_word': r'^\<i\>(\"|\”)(\d+|[[:upper:]])',
+    }
+
+# The following is a class that's used for adding the missing closing italics to sections
+class add_missing_italics(subtitle_operation):
+    # Create the class specific properties
+    name = 'Add missing italics'
+
+    # The following function is used to detect sections that have a different amount of opening and closing italics
+    def detect(self, processor, section_index):
+        # Grab the text of the section
+        text = processor.file_data[section_index].text
+
+        # Count number of occurances in text
+        opening_italics = sum(line.count('<i>') for line in text)
+        closing_italics = sum(line.count('</i>') for line in text)
+
+        # Return if there's a line that needs handling
+        return opening_italics != closing_italics and not (text[-1].endswith('<i>') or text[-1].endswith('</i>'))
+
+    # The following function is used to check which sections of a cue table have a different amount of opening and closing italics
+    def filter_sections(self, table):
+        # Count the number of occurances in each section
+        opening_italics = table.sum_lines(table.count_in_lines('<i>'))
+        closing_italics = table.sum_lines(table.count_in_lines('</i>'))
+
+        # Grab which sections have a last line ending with italics
+        ending_italics = table.last_line_values(table.lines_ending_with('<i>') | table.lines_ending_with('</i>'))
+
+        # Return if each section has a line that needs handling
+        return (opening_italics != closing_italics) & ~ending_italics
+
+    # The following function is used to handle appending the closing italics to the last line
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the current index is the last index in the list of text
+        if index == len(current_data.text) - 1:
+            # Append the closing italic
+            current_data.text[index] = current_data.text[index] + '</i>'
+
+# The following is a class that's used for adding a space after line starting dashes
+class add_space_after_line_starting_dash(any_line_operation):
+    # Create the class specific properties
+    name = 'Add space after line starting dash'
+    statement = r'^((\-|\–)\w|\<i\>(\-|\–)\w|(\-|\–)\<i\>\w)'
+    modification_statements = {
+        'starting_italics': r'\<i\>',
+    }
+
+    # The following function is used to handle adding the space after the dash of the matching lines
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the current line is the one that matches
+        if self.compiled_statement.search(line):
+            # Check to see if the line contains a text modifier
+            if self.compiled_modification_statements['starting_italics'].search(line):
+                # Check to see if the line starts with with the text modifier
+                if line.startswith('<i>'):
+                    # Correct the dash with no space
+                    current_data.text[index] = '<i>- ' + current_data.text[index].replace('<i>', '').replace('</i>', '')[1:] + '</i>'
+                else:
+                    # Correct the dash with no space
+                    current_data.text[index] = '- <i>' + current_data.text[index].replace('<i>', '').replace('</i>', '')[1:] + '</i>'
+            else:
+                # Correct the dash with no space
+                current_data.text[index] = '- ' + current_data.text[index][1:]
+
+# The following is a class that's used for adding a space after line starting dashes that are followed by a lowercase character
+class add_space_after_line_starting_dash_lowercase(add_space_after_line_starting_dash):
+    # Create the class specific properties
+    name = 'Add space after line starting dash and lowercase character'
+    statement = r'^((\-|\–)[[:lower:]]|\<i\>(\-|\–)[[:lower:]]|(\-|\–)\<i\>[[:lower:]]|(\-|\–)(\"|\”)[[:lower:]]|(\-|\–)\.\.\.[[:lower:]])'
+
+# The following is a class that's used for adding a space after line starting dashes that are followed by three dots
+class add_space_after_line_starting_dash_three_dots(add_space_after_line_starting_dash):
+    # Create the class specific properties
+    name = 'Add space after line starting dash and three dots'
+    statement = r'^((\-|\–)|\<i\>(\-|\–)|(\-|\–)\<i\>)\.\.\.\w'
+
+# The following is a class that's used for adding a space after line starting dashes that are followed by an uppercase character
+class add_space_after_line_starting_dash_uppercase(add_space_after_line_starting_dash):
+    # Create the class specific properties
+    name = 'Add space after line starting dash and uppercase character'
+    statement = r'^((\-|\–)[[:upper:]]|\<i\>(\-|\–)[[:upper:]]|(\-|\–)\<i\>[[:upper:]]|(\-|\–)(\"|\”)[[:upper:]]|(\-|\–)\.\.\.[[:upper:]])'
+
+# The following is a class that's used for capitalizing, adding a period, and spacing people abbreviations
+class capitalize_people_abbreviations(any_line_operation):
+    # Create the class specific properties
+    name = 'Capitalize, add a period, and space people abbreviations'
+    statement = r'(?:^|\ |\/)(dr(?:\ |\.|\.\ )|Dr(?:\ |\.)|jr(?:\ |\.|\.\ )|Jr(?:\ |\.)|mr(?:\ |\.|\.\ )|Mr(?:\ |\.)|mrs(?:\ |\.|\.\ )|Mrs(?:\ |\.)|ms(?:\ |\.|\.\ )|Ms(?:\ |\.)|sr(?:\ |\.|\.\ )|Sr(?:\ |\.)|st(?:\ |\.|\.\ )|St(?:\ |\.))[a-zA-Z]'
+
+    # The following function is used to handle correcting the abbreviations of the line
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Search the string
+        results = self.compiled_statement.findall(line)
+
+        # Check to see if the current line is the one that matches
+        if results:
+            # Iterate over the matches
+            for match in results:
+                # Update the match
+                match = ''.join(match)
+
+                # Update the strings
+                current_data.text[index] = current_data.text[index].replace(match, match.strip().title() + ('.' if not match.endswith('.') and not match.endswith('. ') else '') + ' ')
+
+# The following is a class that's used for converting vtt files to srt files
+class convert_vtt_to_srt(all_sections_operation):
+    # Create the class specific properties
+    name = 'Convert vtt to srt'
+    changes_time = True
+    always_save = True
+    converts_to_srt = True
+
+    # The following function is used to handle dropping the vtt specific settings from the time setting
+    def modify_time(self, processor, current_data):
+        # Check to see if the time setting could be parsed
+        if current_data.start is not None:
+            # Drop the vtt specific settings from the time setting
+            current_data.settings = ''
+
+# The following is a class that's used for editing sections that have a full uppercase line
+class edit_full_uppercase_lines(uppercase_line_operation):
+    # Create the class specific properties
+    name = 'Edit full uppercase lines'
+
+# The following is a class that's used for editing lines that have a colon immediately after a letter
+class edit_lines_with_colon_after_letter(any_line_operation):
+    # Create the class specific properties
+    name = 'Edit lines with colon immediately after a letter'
+    statement = r'\w\:'
+
+# The following is a class that's used for editing lines that have two or more consecutive uppercase characters
+class edit_lines_with_consecutive_uppercase(any_line_operation):
+    # Create the class specific properties
+    name = 'Edit lines with two or more consecutive uppercase characters'
+    statement = r'[[:upper:]]{2,}'
+
+# The following is a class that's used for editing sections where the last line doesn't have line ending punctuation
+class edit_lines_without_punctuation(last_line_operation):
+    # Create the class specific properties
+    name = 'Edit lines that don\'t have line ending punctuation'
+    statement = r'\w(\.\,\!\?){0}(\"|\”|\<\/i\>|\<i\>)?$'
+
+# The following is a class that's used for adding dashes to sections where the last line doesn't have line ending punctuation and the following section continues it
+class edit_lines_without_punctuation_add_dashes(subtitle_operation):
+    # Create the class specific properties
+    name = 'Edit lines that don\'t have line ending punctuation (add dashes)'
+    span = 2
+    statement = r'\w(\.\,\!\?){0}(\"|\”|\<\/i\>|\<i\>)?$'
+    modification_statements = {
+        'first_section_word': r'(\d+|[[:lower:]])$',
+        'first_section_word_spaced_dash': r'(\d+|[[:lower:]])\ (\-|\–)$',
+        'first_section_word_quote': r'(\d+|[[:lower:]])(\"|\”)$',
+        'first_section_word_spaced_quote': r'(\d+|[[:lower:]])\ (\"|\”)$',
+        'first_section_word_spaced_dash_quote': r'(\d+|[[:lower:]])\ (\-|\–)(\"|\”)$',
+        'first_section_word_starting_italics': r'(\d+|[[:lower:]])\<i\>$',
+        'first_section_word_spaced_dash_starting_italics': r'(\d+|[[:lower:]])\ (\-|\–)\<i\>$',
+        'first_section_word_closing_italics': r'(\d+|[[:lower:]])\<\/i\>$',
+        'first_section_word_spaced_dash_closing_italics': r'(\d+|[[:lower:]])\ (\-|\–)\<\/i\>$',
+        'second_section_word': r'^(\d+|[[:upper:]])',
+        'second_section_spaced_dash_word': r'^(\-|\–)\ (\d+|[[:upper:]])',
+        'second_section_spaced_dash_double_quote_word': r'^(\-|\–)\ (\"|\”)(\d+|[[:lower:]])',
+        'second_section_spaced_dash_single_quote_word': r'^(\-|\–)\ (\')(\d+|[[:lower:]])',
+        'second_section_double_quote_word': r'^(\"|\”)(\d+|[[:upper:]])',
+        'second_section_single_quote_word': r'^(\')(\d+|[[:upper:]])',
+        'second_section_dollar_word': r'^\$(\d+|[[:upper:]])',
+        'second_section_quote_spaced_dash_word': r'^(\"|\”)(\-|\–)\ (\d+|[[:upper:]])',
+        'second_section_spaced_quote_word': r'^(\"|\”)\ (\d+|[[:upper:]])',
+        'second_section_starting_italics_word': r'^\<i\>(\d+|[[:upper:]])',
+        'second_section_starting_italics_space_word': r'^\<i\>\ (\d+|[[:upper:]])',
+        'second_section_starting_italics_spaced_dash_word': r'^\<i\>(\-|\–)\ (\d+|[[:upper:]])',
+        'second_section_closing_italics_word': r'^\<\/i\>(\d+|[[:upper:]])',
+        'second_section_closing_italics_space_word': r'^\<\/i\>\ (\d+|[[:upper:]])',
+        'second_section_closing_italics_spaced_dash_word': r'^\<\/i\>(\-|\–)\ (\d+|[[:upper:]])',
+    }
+
+    # The following function is used to detect sections where the last line doesn't have line ending punctuation and should be followed by a dash
+    def detect(self, processor, section_index):
+        # Return if the last line needs handling
+        return bool(self.compiled_statement.search(processor.file_data[section_index].text[-1].strip()))
+
+    # The following function is used to handle adding the dashes to the last line of the first section and the first line of the second section
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the current section isn't the last section in the file
+        if index == (len(current_data.text) - 1):
+            # Check to see which scenario the line falls under and correct it accordingly
+            if self.compiled_modification_statements['first_section_word'].search(line.strip()): # word, possible special character/nothing
+                # Append the line ending dash
+                current_data.text[index] = line.strip() + '-'
+            elif self.compiled_modification_statements['first_section_word_spaced_dash'].search(line.strip()): # word, possible special character/nothing, spaced dash
+                # Append the line ending dash
+                current_data.text[index] = line.strip()[:-2].strip() + '-'
+            elif self.compiled_modification_statements['first_section_word_quote'].search(line.strip()): # word, possible special character/nothing, quote
+                # Append the line ending dash
+                current_data.text[index] = line.strip()[:-1].strip() + '"-'
+            elif self.compiled_modification_statements['first_section_word_spaced_quote'].search(line.strip()): # word, possible special character/nothing, spaced quote
+                # Append the line ending dash
+                current_data.text[index] = line.strip()[:-2].strip() + '"-'
+            elif self.compiled_modification_statements['first_section_word_spaced_dash_quote'].search(line.strip()): # word, possible special character/nothing, spaced dash, quote
+                # Append the line ending dash
+                current_data.text[index] = line.strip()[:-3].strip() + '"-'
+            elif self.compiled_modification_statements['first_section_word_starting_italics'].search(line.strip()): # word, possible special character/nothing, starting italics tag
+                # Append the line ending dash
+                current_data.text[index] = line.strip()[:-3].strip() + '-<i>'
+            elif self.compiled_modification_statements['first_section_word_spaced_dash_starting_italics'].search(line.strip()): # word, possible special character/nothing, spaced dash, starting italics tag
+                # Append the line ending dash
+                current_data.text[index] = line.strip()[:-5].strip() + '-<i>'
+            elif self.compiled_modification_statements['first_section_word_closing_italics'].search(line.strip()): # word, possible special character/nothing, closing italics tag
+                # Append the line ending dash
+                current_data.text[index] = line.strip()[:-4].strip() + '-</i>'
+            elif self.compiled_modification_statements['first_section_word_spaced_dash_closing_italics'].search(line.strip()): # word, possible special character/nothing, spaced dash, closing italics tag
+                # Append the line ending dash
+                current_data.text[index] = line.strip()[:-6].strip() + '-</i>'
+
+            # Check to see which scenario the line falls under and correct it accordingly
+            if self.compiled_modification_statements['second_section_word'].search(next_data.text[0].strip()): # word
+                # Prepend the line starting dash
+                next_data.text[0] = '-' + next_data.text[0].strip()
+            elif self.compiled_modification_statements['second_section_spaced_dash_word'].search(next_data.text[0].strip()): # dash, space, word
+                # Prepend the line starting dash
+                next_data.text[0] = '-' + next_data.text[0].strip()[2:].strip()
+            elif self.compiled_modification_statements['second_section_spaced_dash_double_quote_word'].search(next_data.text[0].strip()): # dash, space, double quote, word
+                # Prepend the line starting dash
+                next_data.text[0] = '-"' + next_data.text[0].strip()[3:].strip()
+            elif self.compiled_modification_statements['second_section_spaced_dash_single_quote_word'].search(next_data.text[0].strip()): # dash, space, single quote, word
+                # Prepend the line starting dash
+                next_data.text[0] = '-\'' + next_data.text[0].strip()[3:].strip()
+            elif self.compiled_modification_statements['second_section_double_quote_word'].search(next_data.text[0].strip()): # quote, word
+                # Prepend the line starting dash
+                next_data.text[0] = '-"' + next_data.text[0].strip()[1:].strip()
+            elif self.compiled_modification_statements['second_section_single_quote_word'].search(next_data.text[0].strip()): # single quote, word
+                # Prepend the line starting dash
+                next_data.text[0] = '-\'' + next_data.text[0].strip()[1:].strip()
+            elif self.compiled_modification_statements['second_section_dollar_word'].search(next_data.text[0].strip()): # dollar, word
+                # Prepend the line starting dash
+                next_data.text[0] = '-$' + next_data.text[0].strip()[1:].strip()
+            elif self.compiled_modification_statements['second_section_quote_spaced_dash_word'].search(next_data.text[0].strip()): # quote, dash, space, word
+                # Prepend the line starting dash
+                next_data.text[0] = '-"' + next_data.text[0].strip()[3:].strip()
+            elif self.compiled_modification_statements['second_section_spaced_quote_word'].search(next_data.text[0].strip()): # spaced quote, word
+                # Prepend the line starting dash
+                next_data.text[0] = '-"' + next_data.text[0].strip()[2:].strip()
+            elif self.compiled_modification_statements['second_section_starting_italics_word'].search(next_data.text[0].strip()): # starting italics tag, word
+                # Prepend the line starting dash
+                next_data.text[0] = '<i>-' + next_data.text[0].strip()[3:].strip()
+            elif self.compiled_modification_statements['second_section_starting_italics_space_word'].search(next_data.text[0].strip()): # starting italics tag, space, word
+                # Prepend the line starting dash
+                next_data.text[0] = '<i>-' + next_data.text[0].strip()[4:].strip()
+            elif self.compiled_modification_statements['second_section_starting_italics_spaced_dash_word'].search(next_data.text[0].strip()): # starting italics tag, dash, space, word
+                # Prepend the line starting dash
+                next_data.text[0] = '<i>-' + next_data.text[0].strip()[5:].strip()
+            elif self.compiled_modification_statements['second_section_closing_italics_word'].search(next_data.text[0].strip()): # closing italics tag, word
+                # Prepend the line starting dash
+                next_data.text[0] = '</i>-' + next_data.text[0].strip()[4:].strip()
+            elif self.compiled_modification_statements['second_section_closing_italics_space_word'].search(next_data.text[0].strip()): # closing italics tag, space, word
+                # Prepend the line starting dash
+                next_data.text[0] = '</i>-' + next_data.text[0].strip()[5:].strip()
+            elif self.compiled_modification_statements['second_section_closing_italics_spaced_dash_word'].search(next_data.text[0].strip()): # closing italics tag, dash, space, word
+                # Prepend the line starting dash
+                next_data.text[0] = '</i>-' + next_data.text[0].strip()[6:].strip()
+
+# The following is a class that's used for finding and replacing a word or sentence
+class find_and_replace(subtitle_operation):
+    # Create the class specific properties
+    name = 'Find and replace'
+
+    # The following function is used to detect sections that contain the value to find
+    def detect(self, processor, section_index):
+        # Return if there's a line that needs handling
+        return any(processor.find_and_replace['find'] in line for line in processor.file_data[section_index].text)
+
+    # The following function is used to handle replacing the found value in the line
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the line has the find string
+        if processor.find_and_replace['find'] in line:
+            # Grab some preliminary index points
+            pre_i_ending_index = line.index(processor.find_and_replace['find'])
+            pre_i_starting_index = (pre_i_ending_index - 3)
+            pre_i_string = line[pre_i_starting_index:pre_i_ending_index]
+            post_i_starting_index = (line.index(processor.find_and_replace['find']) + len(processor.find_and_replace['find']))
+            post_i_ending_index = (post_i_starting_index + 4)
+            post_i_string = line[post_i_starting_index:post_i_ending_index]
+
+            # Create a local replace_value holder
+            replace_value = "" if processor.find_and_replace['replace'] == None else processor.find_and_replace['replace']
+
+            # Formulate the patter to search for and replace
+            find_string = ('\<i\>' if replace_value.startswith('<i>') and pre_i_string == '<i>' else '')
+            find_string = find_string + regex.escape(processor.find_and_replace['find'].strip())
+            find_string = find_string + ('\ ?' if replace_value == "" and not line.endswith(processor.find_and_replace['find'].strip()) else '')
+            find_string = find_string + ('\<\/i\>' if replace_value.endswith('</i>') and post_i_string == "</i>" else '')
+
+            # Replace the actual line
+            current_data.text[index] = regex.sub(find_string, replace_value.strip(), line)
+
+# The following is a class that's used for fixing sections that start before the previous section ends
+class fix_time_overlaps(subtitle_operation):
+    # Create the class specific properties
+    name = 'Fix time overlaps'
+    span = 2
+    changes_time = True
+
+    # The following function is used to detect sections that start before the previous section ends
+    def detect(self, processor, section_index):
+        # Grab the respective time values
+        first_section_end = processor.file_data[section_index].end
+        second_section_start = processor.file_data[section_index + 1].start
+
+        # Return if the section section starts before the end of the first section (skipping any sections where the time setting couldn't be parsed)
+        return first_section_end is not None and second_section_start is not None and second_section_start < first_section_end
+
+    # The following function is used to handle moving the start of the second section after the end of the first section
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the current section isn't the last section in the file
+        if index == (len(current_data.text) - 1):
+            # Correct the start of the section start time to make sure it's after the first
+            next_data.start = current_data.end + 1
+
+# The following is a class that's used for removing full uppercase lines
+class remove_full_uppercase_lines(uppercase_line_operation):
+    # Create the class specific properties
+    name = 'Remove full uppercase lines'
+
+    # The following function is used to handle removing the line if it's full uppercase
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the current line is the one that matches
+        if line.isupper():
+            # Zero out the line
+            current_data.text.remove(line)
+
+# The following is a class that's used for removing line ending dashes
+class remove_line_ending_dash(last_line_operation):
+    # Create the class specific properties
+    name = 'Remove line ending dash'
+    statement = r'(\-|\–)$'
+
+    # The following function is used to handle removing the dash from the end of the last line
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the current line is the last line in the section and ends with a dash
+        if line == current_data.text[-1] and self.compiled_statement.search(line):
+            # Update the strings
+            current_data.text[index] = current_data.text[index][:-1]
+
+# The following is a class that's used for removing lines that have two or more consecutive uppercase characters
+class remove_lines_with_consecutive_uppercase(any_line_operation):
+    # Create the class specific properties
+    name = 'Remove lines with two or more consecutive uppercase characters'
+    statement = r'[[:upper:]]{2,}'
+
+    # The following function is used to handle removing the line if it matches
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the current line is the one that matches
+        if self.compiled_statement.search(line):
+            # Zero out the line
+            current_data.text.remove(line)
+
+# The following is a class that's used for removing sections where the last line doesn't have line ending punctuation
+class remove_sections_without_punctuation(last_line_operation):
+    # Create the class specific properties
+    name = 'Remove sections that don\'t have line ending punctuation'
+    statement = edit_lines_without_punctuation.statement
+
+    # The following function is used to handle emptying out the lines of the section
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Empty out the lines in the section
+        current_data.text[index] = ''
+
+# The following is a class that's used for removing the space after three dots
+class remove_space_after_three_dots(any_line_operation):
+    # Create the class specific properties
+    name = 'Remove space after three dots'
+    statement = r'\.\.\.\ '
+
+    # The following function is used to handle removing the spaces of the matches in the line
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Search the string
+        results = self.compiled_statement.findall(line)
+
+        # Check to see if the current line is the one that matches
+        if results:
+            # Iterate over the matches
+            for match in results:
+                # Update the strings
+                current_data.text[index] = current_data.text[index].replace(match, match.replace(' ', ''))
+
+# The following is a class that's used for removing the space after three dots that are followed by a lowercase word
+class remove_space_after_three_dots_lowercase(remove_space_after_three_dots):
+    # Create the class specific properties
+    name = 'Remove space after three dots and a lowercase word'
+    statement = r'\.\.\.\ [[:lower:]]'
+
+# The following is a class that's used for removing the space after three dots that are followed by an uppercase word
+class remove_space_after_three_dots_uppercase(remove_space_after_three_dots):
+    # Create the class specific properties
+    name = 'Remove space after three dots and an uppercase word'
+    statement = r'\.\.\.\ [[:upper:]]'
+
+# The following is a class that's used for removing the spaces from the dashes of split lines
+class remove_spaced_dashes_from_split_lines(subtitle_operation):
+    # Create the class specific properties
+    name = 'Remove spaced dashes from split lines'
+    span = 2
+    statements = {
+        'first_section_dash_ending': r'(\-|\–)$',
+        'second_section_dash_starting': r'^(\-|\–)',
+        'first_section_spaced_dash_ending': r'\ (\-|\–)$',
+        'second_section_dash_spaced_starting': r'^(\-|\–)\ ',
+    }
+
+    # The following function is used to detect split lines where either of the dashes are spaced
+    def detect(self, processor, section_index):
+        # Grab the last line of the first section and the first line of the second section
+        first_section_line = processor.file_data[section_index].text[-1].strip()
+        second_section_line = processor.file_data[section_index + 1].text[0].strip()
+
+        # Parse the various sections to see if they match the criteria
+        first_section_dash_ending = self.compiled_statements['first_section_dash_ending'].search(first_section_line)
+        second_section_dash_starting = self.compiled_statements['second_section_dash_starting'].search(second_section_line)
+        first_section_spaced_dash_ending = self.compiled_statements['first_section_spaced_dash_ending'].search(first_section_line)
+        second_section_dash_spaced_starting = self.compiled_statements['second_section_dash_spaced_starting'].search(second_section_line)
+
+        # Return if the appropriate sections meet the requirements
+        return bool((first_section_dash_ending and second_section_dash_starting) and (first_section_spaced_dash_ending or second_section_dash_spaced_starting))
+
+    # The following function is used to handle removing the spaces from the dashes of the last line of the first section and the first line of the second section
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the current line pointer is the last line in the text array
+        if index == (len(current_data.text) - 1):
+            # Check to see if the correction should be applied to the iterated line
+            if self.compiled_statements['first_section_spaced_dash_ending'].search(line.strip()):
+                # Correct the dash position
+                current_data.text[index] = line[:-2] + '-'
+
+            # Check to see if the correction should be applied to the next section line
+            if self.compiled_statements['second_section_dash_spaced_starting'].search(next_data.text[0].strip()):
+                # Correct the dash position
+                next_data.text[0] = '-' + next_data.text[0][2:]
+
+# The following is a class that's used for removing the space after line starting dashes
+class remove_spaced_line_starting_dash(any_line_operation):
+    # Create the class specific properties
+    name = 'Remove spaced line starting dash'
+    statement = r'^(\-|\–)\ '
+
+    # The following function is used to handle removing the space after the dash of the line
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the current line starts with a spaced dash
+        if self.compiled_statement.search(line):
+            # Update the strings
+            current_data.text[index] = '-' + current_data.text[index][2:]
+
+# The following is a class that's used for removing the space before line ending dashes
+class remove_spaced_line_ending_dash(last_line_operation):
+    # Create the class specific properties
+    name = 'Remove spaced line ending dash'
+    statement = r'\ (\-|\–)$'
+
+    # The following function is used to handle removing the space before the dash of the last line
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to see if the current line is the last line in the section and ends with a spaced dash
+        if line == current_data.text[-1] and self.compiled_statement.search(line):
+            # Update the strings
+            current_data.text[index] = current_data.text[index][:-2] + '-'
+
+# The following is a class that's used for replacing the dashes of split lines with three dots when they're spoken quickly
+class replace_dashes_for_quick_lines(subtitle_operation):
+    # Create the class specific properties
+    name = 'Replace dashes with three dots for quick lines'
+    span = 2
+    statements = {
+        'positive_first_section': add_dashes_to_split_lines_lowercase.statements['positive_first_section'],
+        'positive_second_section_lowercase': add_dashes_to_split_lines_lowercase.statements['positive_second_section'],
+        'positive_second_section_uppercase': add_dashes_to_split_lines_uppercase.statements['positive_second_section'],
+    }
+
+    # The following function is used to detect split lines that are spoken quickly enough to use three dots instead of dashes
+    def detect(self, processor, section_index):
+        # Grab the last line of the first section and the first line of the second section
+        first_section_line = processor.file_data[section_index].text[-1].strip()
+        second_section_line = processor.file_data[section_index + 1].text[0].strip()
+
+        # Create variables that represent different cases
+        positive_first_section = self.compiled_statements['positive_first_section'].search(first_section_line) # Determine if the last line in the first section is correctly formatted as a "split line with a dash"
+        positive_second_section = self.compiled_statements['positive_second_section_lowercase'].search(second_section_line) or self.compiled_statements['positive_second_section_uppercase'].search(second_section_line) # Determine if the first line in the second section is correctly formatted as a "split line with a dash"
+        section_delta = processor.file_data[section_index + 1].start - processor.file_data[section_index].end if processor.file_data[section_index + 1].start is not None and processor.file_data[section_index].end is not None else None
+
+        # Return if the sections are quick and need correcting
+        return bool(positive_first_section and positive_second_section) and section_delta is not None and (section_delta >= 1200 and section_delta <= 10000)
+
+    # The following function is used to handle replacing the dashes of the last line of the first section and the first line of the second section
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Grab the sections of the file that haven't been removed
+        file_data = [section for section in processor.file_data if section is not None]
+
+        # Iterrate over each of the sections in the file
+        for section_index, section_data in enumerate(file_data):
+            # Check to see if the current section isn't the last section in the file
+            if not section_index == (len(file_data) - 1):
+                # Create variables that represent different cases
+                positive_first_section = self.compiled_statements['positive_first_section'].search(line.strip()) # Determine if the last line in the first section is correctly formatted as a "split line with a dash"
+                positive_second_section = self.compiled_statements['positive_second_section_lowercase'].search(next_data.text[0].strip()) or self.compiled_statements['positive_second_section_uppercase'].search(next_data.text[0].strip()) # Determine if the first line in the second section is correctly formatted as a "split line with a dash"
+                section_delta = file_data[section_index + 1].start - section_data.end if file_data[section_index + 1].start is not None and section_data.end is not None else None
+
+                # Check to see if the sections are quick and need correcting
+                if bool(positive_first_section and positive_second_section) and section_delta is not None and (section_delta >= 1200 and section_delta <= 10000):
+                    # Modify the first section and replace the respective line ending dash to three dots
+                    current_data.text[index] = current_data.text[index].strip()[::-1]
+                    current_data.text[index] = current_data.text[index].strip().replace('-', '...', 1)
+                    current_data.text[index] = current_data.text[index].strip()[::-1]
+
+                    # Modify the second section and replace the respective line starting dash to three dots
+                    next_data.text[0] = next_data.text[0].strip().replace('-', '...', 1)
+
+# The following is a class that's used for rewriting files cleanly
+class sanitize_file(all_sections_operation):
+    # Create the class specific properties
+    name = 'Sanitize file'
+    always_save = True
+
+# The following is a class that's used for splitting lines that are too long or have more than one speaker
+class trim_long_lines(subtitle_operation):
+    # Create the class specific properties
+    name = 'Trim long lines'
+    statement = r'((?:\-|\–)\ .+(?|!|.|))\ ((?:\-|\–)\ .*)'
+    statements = {
+        'second_section_dash_starting': remove_spaced_dashes_from_split_lines.statements['second_section_dash_starting'],
+    }
+
+    # The following function is used to detect sections that have lines that are too long or have more than one speaker
+    def detect(self, processor, section_index):
+        # Grab all lines of the section other than the last line
+        lines = processor.file_data[section_index].text[:-1]
+
+        # Return if there's a line that needs handling
+        return (any(len(line) > 45 for line in lines) and not any(self.compiled_statements['second_section_dash_starting'].search(line) for line in lines)) or any(self.compiled_statement.search(line) for line in lines)
+
+    # The following function is used to check which sections of a cue table could have lines that are too long or have more than one speaker
+    def filter_sections(self, table):
+        # Grab the amount of spaced dashes in each line (a line with more than one speaker has at least two)
+        spaced_dashes = table.count_in_lines('- ') + table.count_in_lines('– ')
+
+        # Return if each section has a line other than the last line that could need handling (the statements are checked when the section is detected)
+        return table.any_lines(table.leading_lines() & ((table.line_lengths() > 45) | (spaced_dashes >= 2)))
+
+    # The following function is used to handle splitting the line if it's too long or has more than one speaker
+    def modify_line(self, processor, current_data, next_data, index, line):
+        # Check to make sure that the current line isn't the last line in the section
+        if index == (len(current_data.text) - 1):
+            # Return to skip the current line
+            return
+
+        # Store the current line in perfet shape
+        current_line = current_data.text[index]
+
+        # Check to see if the current line has more than one speaker
+        has_multiple_speakers = self.compiled_statement.findall(current_line)
+
+        # Double check to make sure the current line is greater than 45 characters and doesn't start with a dash or has multiple speakers
+        if (len(current_line) > 45 and not current_line.startswith('- ')) or has_multiple_speakers:
+            # Check to see if handling for more than one speaker
+            if has_multiple_speakers:
+                # # Iterate over the matches and insert them correctly
+                for  matched_group_index, matched_group_text in enumerate(has_multiple_speakers[0], 0):
+                    # Check to see if the index exists
+                    if (index + matched_group_index) < len(current_data.text):
+                        # Update the current index pointer with the matched string
+                        current_data.text[index + matched_group_index] = matched_group_text
+                    else:
+                        # Insert the current index pointer with the matched string
+                        current_data.text.insert((index + matched_group_index), matched_group_text)
+            else:
+                # Convert the string to an array split by the spaces
+                current_line = current_line.split(' ')
+
+                # Grab the middle of the sentance (based on arrayed (split sentance by space) index middle point)
+                split_index = ((len(current_line) // 2) if (len(current_line) // 2) % 2 == 0 else ((len(current_line) // 2) + 1))
+
+                # Split the line current line and inser the remaining bak into the array
+                current_data.text[index] = ' '.join(current_line[:split_index]).strip()
+                current_data.text.insert((index + 1), ' '.join(current_line[split_index:]).strip())
+
+            # Return that the section needs to be further processed (skipping over the current line pointer and two lines that have just been modified)
+            return 2
+
+# Register each of the built in operations
+for operation in [add_dashes_to_split_lines_lowercase, add_dashes_to_split_lines_uppercase, add_missing_italics, add_space_after_line_starting_dash, add_space_after_line_starting_dash_lowercase, add_space_after_line_starting_dash_three_dots, add_space_after_line_starting_dash_uppercase, capitalize_people_abbreviations, convert_vtt_to_srt, edit_full_uppercase_lines, edit_lines_with_colon_after_letter, edit_lines_with_consecutive_uppercase, edit_lines_without_punctuation, edit_lines_without_punctuation_add_dashes, find_and_replace, fix_time_overlaps, remove_full_uppercase_lines, remove_line_ending_dash, remove_lines_with_consecutive_uppercase, remove_sections_without_punctuation, remove_space_after_three_dots, remove_space_after_three_dots_lowercase, remove_space_after_three_dots_uppercase, remove_spaced_dashes_from_split_lines, remove_spaced_line_starting_dash, remove_spaced_line_ending_dash, replace_dashes_for_quick_lines, sanitize_file, trim_long_lines]:
+    register_operation(operation())
@@ -0,0 +1,1222 @@
+###
+#
+# N3rdP1um23
+# The following file is used to handle detecting and modifying subtitle sections for the various operations without any user interface
+#
+###
+
+# Import the required packages
+import codecs
+import hashlib
+import inspect
+import io
+import itertools
+import mmap
+import os
+import shutil
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from subtitle_cache import subtitle_cache, hash_file, get_operation_key
+from subtitle_columns import cue_table, columnar_available
+from subtitle_operations import get_operation, load_plugins, operation_registry
+from subtitle_stats import create_stats, timed_stage
+
+# Create a variable that stores the versions of the rules for each set of source files
+rules_versions = {}
+
+# The following function is used to handle grabbing the version of the detection and modification rules (which changes whenever this file or the file of any registered operation does) so that cached results are invalidated when they change
+def get_rules_version():
+    # Grab the source files of the rules
+    source_files = tuple(sorted({__file__} | {inspect.getfile(type(operation)) for operation in operation_registry.values()}))
+
+    # Check to see if the version of the source files hasn't been created yet
+    if source_files not in rules_versions:
+        # Create the hash of the source files
+        content_hash = hashlib.sha256()
+        for source_file in source_files:
+            with open(source_file, 'rb') as file:
+                content_hash.update(file.read())
+
+        # Store the version
+        rules_versions[source_files] = content_hash.hexdigest()[:16]
+
+    # Return the version
+    return rules_versions[source_files]
+
+# The following function is used to handle parsing a single time stamp (SRT "00:01:02,345" or VTT "00:01:02.345" / "01:02.345") into milliseconds
+def parse_timestamp(stamp):
+    # Check to see if the stamp is in the full fixed width format so that the values can be sliced out directly
+    if len(stamp) == 12 and stamp[2] == ':' and stamp[5] == ':' and stamp[8] in ',.' and (stamp[:2] + stamp[3:5] + stamp[6:8] + stamp[9:]).isdecimal():
+        # Return the time in milliseconds
+        return int(stamp[:2]) * 3600000 + int(stamp[3:5]) * 60000 + int(stamp[6:8]) * 1000 + int(stamp[9:])
+
+    # Split the stamp into its clock values and the seconds into seconds and milliseconds
+    clock = stamp.split(':')
+    seconds, separator, milliseconds = clock[-1].replace(',', '.').partition('.')
+
+    # Check to see if the stamp is in a supported format
+    if not 2 <= len(clock) <= 3 or not separator or not seconds.isdecimal() or not milliseconds.isdecimal() or not all(value.isdecimal() for value in clock[:-1]):
+        # Return an empty time as the stamp isn't supported
+        return None
+
+    # Return the time in milliseconds (VTT stamps can leave out the hours)
+    return ((int(clock[-3]) * 60 if len(clock) == 3 else 0) + int(clock[-2])) * 60000 + int(seconds) * 1000 + int(milliseconds[:3].ljust(3, '0'))
+
+# The following function is used to handle formatting milliseconds into a time stamp with the provided millisecond separator
+def format_timestamp(time, separator = ','):
+    # Split the time into its respective values
+    seconds, milliseconds = divmod(time, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    # Return the formatted stamp
+    return '%02d:%02d:%02d%s%03d' % (hours, minutes, seconds, separator, milliseconds)
+
+# The following function is used to handle parsing a time setting into its start and end times in milliseconds along with any trailing (VTT) settings
+def parse_time(time):
+    # Split the time setting into the start stamp and the remainder
+    start, arrow, remainder = time.partition('-->')
+    end, _, settings = remainder.strip().partition(' ')
+
+    # Parse the respective time values
+    start = parse_timestamp(start.strip())
+    end = parse_timestamp(end)
+
+    # Check to see if the time setting couldn't be parsed
+    if not arrow or start is None or end is None:
+        # Return empty times and keep the setting as is so that it's saved untouched
+        return None, None, time
+
+    # Return the parsed times and settings
+    return start, end, settings.strip()
+
+# The following function is used to handle writing a file by streaming it to a temporary file next to it and renaming that over the file once it's fully written
+def write_file(file_path, write, fsync = False, before_replace = None):
+    # Create the path of the temporary file
+    temporary_file_path = os.path.join(os.path.dirname(os.path.abspath(file_path)), '.' + os.path.basename(file_path) + '.' + uuid.uuid4().hex[:8] + '.tmp')
+
+    # Attempt to write and replace the file
+    try:
+        # Open the temporary file and call the function to handle writing to it
+        with open(temporary_file_path, 'xb') as file:
+            write(file)
+
+            # Check to see if the file should be flushed to disk before it replaces the file in question
+            if fsync:
+                # Flush the file to disk
+                file.flush()
+                os.fsync(file.fileno())
+
+        # Check to see if the file in question already exists
+        if os.path.exists(file_path):
+            # Keep the permissions of the file in question
+            shutil.copymode(file_path, temporary_file_path)
+
+        # Check to see if anything needs to happen before the file in question is replaced
+        if before_replace is not None:
+            # Call the provided function
+            before_replace()
+
+        # Replace the file in question with the temporary file
+        os.replace(temporary_file_path, file_path)
+    except BaseException:
+        # Check to see if the temporary file was left behind
+        if os.path.exists(temporary_file_path):
+            # Remove the temporary file
+            os.remove(temporary_file_path)
+
+        # Raise the error
+        raise
+
+# The following is a class that's used to hold a single section (cue) of a subtitle file
+class subtitle_cue:
+    # Limit the properties of the class so that a file full of sections stays compact in memory
+    __slots__ = ('index', 'start', 'end', 'settings', 'text', 'line_number')
+
+    # The following function is used as a constructor
+    def __init__(self, index, time, text, line_number = None):
+        # Store the section values
+        self.index = index
+        self.text = text
+        self.line_number = line_number
+
+        # Call the function to handle setting the time values
+        self.set_time(time)
+
+    # The following function is used to handle setting the parsed start time, end time, and settings from a time setting
+    def set_time(self, time):
+        # Store the parsed time values
+        self.start, self.end, self.settings = parse_time(time)
+
+    # The following function is used to handle formatting the time values back into a time setting
+    def format_time(self, separator = ','):
+        # Check to see if the time setting couldn't be parsed
+        if self.start is None:
+            # Return the time setting as is
+            return self.settings
+
+        # Return the formatted time setting
+        return format_timestamp(self.start, separator) + ' --> ' + format_timestamp(self.end, separator) + (' ' + self.settings if self.settings else '')
+
+    # The following function is used to create a copy of the section that can be modified without touching the original section
+    def copy(self):
+        # Create the copy of the section
+        section = subtitle_cue.__new__(subtitle_cue)
+        section.index = self.index
+        section.start = self.start
+        section.end = self.end
+        section.settings = self.settings
+        section.text = self.text.copy()
+        section.line_number = self.line_number
+
+        # Return the copy
+        return section
+
+# The following is a class that's used to hold a single section (cue) of a memory mapped file that only decodes its text when it's needed
+class mapped_cue(subtitle_cue):
+    # Limit the properties of the class to the byte offsets of the section within the mapped file
+    __slots__ = ('source', 'time_offset', 'text_offset', 'end_offset', 'decoded')
+
+    # Create a class specific property that holds the most recently decoded section so that repeated lookups don't decode it again
+    recent = (None, None)
+
+    # The following function is used as a constructor
+    def __init__(self, index, time, source, time_offset, text_offset, end_offset, line_number = None):
+        # Store the section values
+        self.index = index
+        self.line_number = line_number
+        self.source = source
+        self.time_offset = time_offset
+        self.text_offset = text_offset
+        self.end_offset = end_offset
+        self.decoded = None
+
+        # Call the function to handle setting the time values
+        self.set_time(time)
+
+    # The following function is used to handle grabbing the text of the section (decoding it from the mapped file when it hasn't been modified)
+    @property
+    def text(self):
+        # Check to see if the text has been modified
+        if self.decoded is not None:
+            # Return the modified text
+            return self.decoded
+
+        # Check to see if the section was the most recently decoded section
+        if mapped_cue.recent[0] is self:
+            # Return the decoded text
+            return mapped_cue.recent[1]
+
+        # Decode the text from the mapped file and store it as the most recently decoded section
+        text = [line.rstrip('\r') for line in self.source[self.text_offset:self.end_offset].decode('utf-8').split('\n')]
+        mapped_cue.recent = (self, text)
+
+        # Return the decoded text
+        return text
+
+    # The following function is used to handle setting the modified text of the section
+    @text.setter
+    def text(self, text):
+        # Store the modified text and detach the section from the mapped file as it no longer matches
+        self.decoded = text
+        self.source = None
+
+# The following function is used to handle creating a section from the (non blank) lines of a block in the file
+def parse_cue(lines, line_number, position):
+    # Grab which line holds the time setting (the first line when the section doesn't have an index)
+    time_line = 0 if '-->' in lines[0] else 1 if len(lines) > 1 and '-->' in lines[1] else None
+
+    # Check to see if the block isn't a section (headers, notes, styles, etc.) or doesn't have any text
+    if time_line is None or len(lines) <= time_line + 1:
+        # Return nothing as there isn't a section to create
+        return None
+
+    # Return the section (falling back to the position of the section when it doesn't have a numeric index)
+    return subtitle_cue(int(lines[0]) if time_line == 1 and lines[0].strip().isdecimal() else position, lines[time_line], lines[time_line + 1:], line_number)
+
+# The following function is used to handle walking the lines of a file a single time and yielding each section along with the line it starts on
+def read_cues(lines):
+    # Create variables to hold the block that's currently being read
+    block = []
+    block_line_number = None
+    position = 0
+
+    # Iterate over each of the lines in the file (along with a trailing blank line to finish the last block)
+    for line_number, line in itertools.chain(enumerate(lines, 1), [(None, '')]):
+        # Strip the line ending and any byte order mark
+        line = line.rstrip('\r\n').lstrip('\ufeff') if line_number == 1 else line.rstrip('\r\n')
+
+        # Check to see if the line has content
+        if line.strip():
+            # Check to see if the line starts a new block
+            if len(block) == 0:
+                # Store the line that the block starts on
+                block_line_number = line_number
+
+            # Add the line to the block and move onto the next line
+            block.append(line)
+            continue
+
+        # Check to see if a block was finished by the blank line
+        if len(block) > 0:
+            # Create the section from the block
+            section = parse_cue(block, block_line_number, position + 1)
+
+            # Check to see if the block was a section
+            if section is not None:
+                # Yield the section
+                position = position + 1
+                yield section
+
+            # Reset the block
+            block = []
+
+# The following function is used to handle creating a memory mapped section from the (non blank) lines and their byte offsets of a block in the file
+def parse_mapped_cue(file_map, lines, line_number, position):
+    # Grab which line holds the time setting (the first line when the section doesn't have an index)
+    time_line = 0 if b'-->' in lines[0][1] else 1 if len(lines) > 1 and b'-->' in lines[1][1] else None
+
+    # Check to see if the block isn't a section (headers, notes, styles, etc.) or doesn't have any text
+    if time_line is None or len(lines) <= time_line + 1:
+        # Return nothing as there isn't a section to create
+        return None
+
+    # Grab the index of the section
+    index = lines[0][1].decode('utf-8').strip()
+
+    # Return the section (falling back to the position of the section when it doesn't have a numeric index)
+    return mapped_cue(int(index) if time_line == 1 and index.isdecimal() else position, lines[time_line][1].decode('utf-8'), file_map, lines[time_line][0], lines[time_line + 1][0], lines[-1][0] + len(lines[-1][1]), line_number)
+
+# The following function is used to handle walking the lines of a memory mapped file a single time and yielding each section without decoding its text
+def map_cues(file_map):
+    # Create variables to hold the block that's currently being read
+    block = []
+    block_line_number = None
+    position = 0
+
+    # Skip any byte order mark
+    offset = len(codecs.BOM_UTF8) if file_map[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8 else 0
+    file_map.seek(offset)
+
+    # Iterate over each of the lines in the file (along with a trailing blank line to finish the last block)
+    for line_number, line in enumerate(itertools.chain(iter(file_map.readline, b''), [b'']), 1):
+        # Strip the line ending
+        stripped_line = line.rstrip(b'\r\n')
+
+        # Check to see if the line has content
+        if stripped_line.strip():
+            # Check to see if the line starts a new block
+            if len(block) == 0:
+                # Store the line that the block starts on
+                block_line_number = line_number
+
+            # Add the line and its offset to the block
+            block.append((offset, stripped_line))
+        elif len(block) > 0:
+            # Create the section from the block
+            section = parse_mapped_cue(file_map, block, block_line_number, position + 1)
+
+            # Check to see if the block was a section
+            if section is not None:
+                # Yield the section
+                position = position + 1
+                yield section
+
+            # Reset the block
+            block = []
+
+        # Move the offset onto the next line
+        offset = offset + len(line)
+
+# The following is a class that's used for loading, detecting, modifying, and saving subtitle files for an operation
+class subtitle_processor:
+    # The following function is used as a constructor
+    def __init__(self, operation = None, find_and_replace = None, memory_map = False, fsync = False, columnar = False):
+        # Store the operation that's being performed, the find and replace values, if files should be memory mapped instead of read into memory, if saves should be flushed to disk, and if sections should be checked in bulk with the columnar backend (when it's available and the file isn't memory mapped, as mapped sections would be decoded twice)
+        self.operation = operation
+        self.find_and_replace = find_and_replace if find_and_replace is not None else {'find': '', 'replace': ''}
+        self.memory_map = memory_map
+        self.fsync = fsync
+        self.columnar = columnar and not memory_map and columnar_available()
+
+        # Initialize the file specific values
+        self.file_path = None
+        self.modified = False
+        self.file_data = []
+        self.section_positions = {}
+        self.removed_sections = 0
+        self.sections_to_modify = []
+        self.scan_position = 0
+        self.scan_complete = True
+        self.section_text = (None, '')
+        self.time_separator = ','
+        self.header = ''
+        self.newline = '\n'
+        self.file_map = None
+        self.stats = create_stats(None, operation)
+
+        # Initialize the operations that are performed after the current operation (when running a pipeline) and the operations that have already been performed on the file along with their matches
+        self.pending_operations = []
+        self.applied_operations = []
+
+    # The following function is used to grab the amount of sections the current operation spans
+    def get_section_span(self):
+        # Return the amount of sections spanned by the operation
+        return get_operation(self.operation).span
+
+    # The following function is used to handle loading the data from the file
+    @timed_stage('load')
+    def load_data(self, file):
+        # Check to see if the file exists
+        if not os.path.exists(file):
+            # Return False as the file wasn't found
+            return False
+
+        # Store the file being modified and reset the modified flag
+        self.file_path = file
+        self.modified = False
+
+        # Reset the stats and performed operations for the file and store the amount of bytes being read
+        self.stats = create_stats(file, self.operation)
+        self.stats['bytes_read'] = os.path.getsize(file)
+        self.applied_operations = []
+
+        # Check to see if the file should be memory mapped
+        if self.memory_map:
+            # Call the function to handle loading the data from the file by memory mapping it
+            return self.map_data(file)
+        else:
+            # Load the file contents
+            with open(file, 'r', encoding = 'utf-8-sig') as file:
+                # Grab the file content
+                file_content = file.read()
+
+                # Store the line endings used by the file so that they're saved the same way
+                self.newline = file.newlines if isinstance(file.newlines, str) else '\n'
+
+            # Call the function to handle creating the sections from the content of the file
+            self.read_content(file_content)
+
+            # Return True as the file was loaded
+            return True
+
+    # The following function is used to handle loading the data from the provided subtitle text instead of a file (such as text sent to the correction service)
+    @timed_stage('load')
+    def load_text(self, text, name = None):
+        # Reset the file being modified and the modified flag
+        self.file_path = None
+        self.modified = False
+
+        # Reset the stats and performed operations for the text and store the amount of bytes being read
+        self.stats = create_stats(name, self.operation)
+        self.stats['bytes_read'] = len(text.encode('utf-8'))
+        self.applied_operations = []
+
+        # Store the line endings used by the text so that it's returned the same way
+        self.newline = '\r\n' if '\r\n' in text else '\n'
+
+        # Call the function to handle creating the sections from the text (with the line endings and byte order mark handled the same way as when reading a file)
+        self.read_content(text.lstrip('\ufeff').replace('\r\n', '\n').replace('\r', '\n'))
+
+        # Return True as the text was loaded
+        return True
+
+    # The following function is used to handle creating the sections from the provided content (with its line endings already normalized)
+    def read_content(self, file_content):
+        # Call the function to handle walking the lines of the content and creating the sections
+        self.file_data = list(read_cues(io.StringIO(file_content)))
+
+        # Check to see if the content has any sections
+        if len(self.file_data) > 0:
+            # Store anything before the first section (such as the vtt header) so that it can be saved back to the file
+            self.header = '\n'.join(file_content.split('\n', self.file_data[0].line_number - 1)[:-1]).strip()
+
+            # Store the millisecond separator used by the time stamps so that they're saved the same way
+            self.time_separator = '.' if '.' in file_content.partition('-->')[0].rpartition('\n')[2] else ','
+
+        # Call the function to handle indexing the sections by their index and store the amount of sections
+        self.index_file_data()
+        self.stats['sections'] = len(self.file_data)
+
+    # The following function is used to handle loading the data from the file by memory mapping it so that only the sections being detected or modified are decoded
+    def map_data(self, file):
+        # Call the function to handle closing any previously mapped file
+        self.close_file()
+
+        # Reset the file specific values
+        self.file_data = []
+
+        # Open the file and map it into memory (empty files can't be mapped and don't have any sections)
+        with open(file, 'rb') as file:
+            # Check to see if the file has any content
+            if os.fstat(file.fileno()).st_size > 0:
+                # Map the file into memory
+                self.file_map = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ)
+
+        # Check to see if the file was mapped
+        if self.file_map is not None:
+            # Call the function to handle walking the lines of the file and creating the sections
+            self.file_data = list(map_cues(self.file_map))
+
+        # Check to see if the file has any sections
+        if len(self.file_data) > 0:
+            # Grab the first section
+            first_section = self.file_data[0]
+
+            # Store anything before the first section (such as the vtt header) so that it can be saved back to the file
+            self.file_map.seek(0)
+            self.header = b''.join(self.file_map.readline() for _ in range(first_section.line_number - 1)).decode('utf-8-sig').strip()
+
+            # Store the millisecond separator and line endings used by the file so that they're saved the same way
+            time_line = self.file_map[first_section.time_offset:first_section.text_offset]
+            self.time_separator = '.' if b'.' in time_line.partition(b'-->')[0] else ','
+            self.newline = '\r\n' if time_line.endswith(b'\r\n') else '\n'
+
+        # Call the function to handle indexing the sections by their index and store the amount of sections
+        self.index_file_data()
+        self.stats['sections'] = len(self.file_data)
+
+        # Return True as the file was loaded
+        return True
+
+    # The following function is used to handle closing the memory mapped file (if there is one)
+    def close_file(self):
+        # Check to see if a file is mapped
+        if self.file_map is not None:
+            # Close the mapped file
+            self.file_map.close()
+            self.file_map = None
+
+    # The following function is used to handle indexing the position of each section by the section's index
+    def index_file_data(self):
+        # Create the index of positions (keeping the first section when an index is repeated)
+        self.section_positions = {}
+
+        # Iterate over each of the sections in the file
+        for position, section in enumerate(self.file_data):
+            # Store the position of the section
+            self.section_positions.setdefault(section.index, position)
+
+        # Reset the amount of removed sections
+        self.removed_sections = 0
+
+    # The following function is used to handle compacting the file data by dropping the sections that have been removed
+    def compact_file_data(self):
+        # Check to see if any sections have been removed
+        if self.removed_sections > 0:
+            # Move the scan position back by the amount of removed sections before it
+            self.scan_position = self.scan_position - self.file_data[:self.scan_position].count(None)
+
+            # Drop the removed sections and re-index the remaining sections
+            self.file_data = [section for section in self.file_data if section is not None]
+            self.index_file_data()
+
+    # The following function is used to handle parsing the respective file
+    def parse_file(self):
+        # Call the function to handle starting the detection of the matches and detect all of them
+        self.start_matches()
+        self.fill_matches()
+
+        # Return the sections that need modifying
+        return self.sections_to_modify
+
+    # The following function is used to handle starting the detection of the matches for the current operation (the matches are detected as they're needed)
+    def start_matches(self):
+        # Reset the matches and the position the scan is at
+        self.sections_to_modify = []
+        self.scan_position = 0
+        self.scan_complete = False
+
+    # The following function is used to handle moving onto the next pending operation of a pipeline once the current operation has been performed (returning False if there aren't any operations left)
+    def apply_next_operation(self):
+        # Check to see if there aren't any pending operations
+        if len(self.pending_operations) == 0:
+            # Return False as the pipeline is complete
+            return False
+
+        # Store the current operation along with its matches and move onto the next operation
+        self.applied_operations.append((self.operation, len(self.sections_to_modify) // self.get_section_span()))
+        self.operation = self.pending_operations.pop(0)
+
+        # Call the function to handle starting the detection of the matches for the next operation (over the sections as they've been modified so far)
+        self.start_matches()
+
+        # Return True as there's another operation to perform
+        return True
+
+    # The following function is used to handle grabbing each of the operations performed on the file (including the current operation) along with their matches
+    def get_operation_matches(self):
+        # Return the performed operations and the current operation
+        return self.applied_operations + ([(self.operation, len(self.sections_to_modify) // self.get_section_span())] if self.operation is not None else [])
+
+    # The following function is used to handle grabbing the amount of matches found for each operation performed on the file (adding them together if an operation is performed more than once)
+    def get_matches_by_operation(self):
+        # Create the amount of matches keyed by the operation
+        matches = {}
+
+        # Iterate over each of the operations and add its matches
+        for operation, operation_matches in self.get_operation_matches():
+            matches[operation] = matches.get(operation, 0) + operation_matches
+
+        # Return the amount of matches of each operation
+        return matches
+
+    # The following function is used to handle checking if any of the operations performed on the file have the provided flag (such as converting the file to srt)
+    def has_operation_flag(self, flag):
+        # Return if any of the operations have the flag
+        return any(getattr(get_operation(operation), flag) for operation, _ in self.get_operation_matches())
+
+    # The following function is used to handle scanning the next sections of the file for matches (all of the remaining sections if no limit is provided)
+    @timed_stage('detect')
+    def scan_matches(self, limit = None):
+        # Call the function to handle compacting the file data so that neighbouring sections are adjacent
+        self.compact_file_data()
+
+        # Grab the operation, the amount of sections it spans, and where the scan should stop
+        operation = get_operation(self.operation)
+        section_span = operation.span
+        scan_end = len(self.file_data) if limit is None else min(len(self.file_data), self.scan_position + limit)
+
+        # Grab the sections being scanned (skipping the sections where the operation would span past the last section in the file) and the ones that could need handling when they can be checked in bulk
+        section_range = range(self.scan_position, min(scan_end, len(self.file_data) - section_span + 1))
+        filtered_sections = self.filter_sections([operation], section_range).get(operation.name)
+
+        # Iterrate over each of the sections that could need handling
+        for section_index in (section_range if filtered_sections is None else filtered_sections):
+            # Check to see if the section(s) need handling
+            if operation.detect(self, section_index):
+                # Append the section(s) to the list that will hold the sections that need correcting
+                self.sections_to_modify.extend(self.file_data[section_index:(section_index + section_span)])
+
+        # Update the position the scan is at and if the whole file has been scanned
+        self.scan_position = scan_end
+        self.scan_complete = scan_end >= len(self.file_data)
+
+    # The following function is used to handle detecting matches until there are at least the provided amount of sections to modify (or all of them if no amount is provided)
+    def fill_matches(self, count = None):
+        # Iterate until there are enough sections or the whole file has been scanned
+        while (count is None or len(self.sections_to_modify) < count) and not self.scan_complete:
+            # Call the function to handle scanning the next sections of the file
+            self.scan_matches(1000)
+
+        # Return if there are enough sections
+        return count is None or len(self.sections_to_modify) >= count
+
+    # The following function is used to handle iterating over the matches as they're detected
+    def iterate_matches(self):
+        # Grab the amount of sections the operation spans
+        section_span = self.get_section_span()
+
+        # Iterate over the matches (detecting more as they're needed)
+        section_index = 0
+        while self.fill_matches(section_index + section_span):
+            # Yield the section(s) of the match
+            yield self.sections_to_modify[section_index:(section_index + section_span)]
+            section_index = section_index + section_span
+
+    # The following function is used to handle detecting the sections that need modifying for many operations in a single pass over the file
+    @timed_stage('detect')
+    def detect_operations(self, operations):
+        # Call the function to handle compacting the file data so that neighbouring sections are adjacent
+        self.compact_file_data()
+
+        # Create a variable that will handle storing sections that need modifying for each operation
+        sections_to_modify = {operation: [] for operation in operations}
+
+        # Grab each of the operations being detected
+        operation_detectors = [(operation, get_operation(operation)) for operation in operations]
+
+        # Create a variable that will handle storing the sections that could need handling for each operation that can be checked in bulk
+        filtered_sections = {}
+
+        # Iterrate over each of the sections in the file
+        for section_index in range(len(self.file_data)):
+            # Check to see if the columnar backend is being used and the section starts the next batch of sections
+            if self.columnar and section_index % 1000 == 0:
+                # Grab the sections of the batch that could need handling for each operation
+                filtered_sections = {operation: set(sections) for operation, sections in self.filter_sections([detector for operation, detector in operation_detectors], range(section_index, min(section_index + 1000, len(self.file_data)))).items()}
+
+            # Iterate over each of the operations being detected
+            for operation, detector in operation_detectors:
+                # Check to see if the operation spans past the last section in the file or the section was already ruled out in bulk
+                if section_index + detector.span > len(self.file_data) or (operation in filtered_sections and section_index not in filtered_sections[operation]):
+                    # Skip the operation as there aren't enough sections left or the section doesn't need handling
+                    continue
+
+                # Check to see if the section(s) need handling
+                if detector.detect(self, section_index):
+                    # Append the section(s) to the list that will hold the sections that need correcting
+                    sections_to_modify[operation].extend(self.file_data[section_index:(section_index + detector.span)])
+
+        # Return the sections that need modifying for each operation
+        return sections_to_modify
+
+    ###
+    #
+    # Detection functions
+    #
+    ###
+
+    # The following function is used to handle checking the provided range of sections in bulk with the columnar backend for each of the operations that support it (returning the positions of the sections that could need handling keyed by the operation's name)
+    def filter_sections(self, operations, section_range):
+        # Grab the operations that can be checked in bulk (operations that span more than one section are always detected one at a time)
+        filtered_operations = [operation for operation in operations if operation.filter_sections is not None and operation.span == 1] if self.columnar and len(section_range) > 0 else []
+
+        # Check to see if there aren't any operations to check in bulk
+        if len(filtered_operations) == 0:
+            # Return as the sections need to be detected one at a time
+            return {}
+
+        # Create the table of the sections (once for all of the operations)
+        table = cue_table(self.file_data[section_range.start:section_range.stop])
+
+        # Return the positions of the sections that could need handling for each of the operations
+        return {operation.name: table.flagged_positions(operation.filter_sections(table), section_range.start) for operation in filtered_operations}
+
+    # The following function is used to grab the lines of a section joined together (reusing the joined lines when the same section is checked by several operations)
+    def get_section_text(self, section_index):
+        # Grab the text of the section
+        text = self.file_data[section_index].text
+
+        # Check to see if the section's lines haven't been joined yet
+        if self.section_text[0] is not text:
+            # Join the lines and store them alongside the text they were joined from
+            self.section_text = (text, '\n'.join(text))
+
+        # Return the joined lines
+        return self.section_text[1]
+
+    ###
+    #
+    # Modification functions
+    #
+    ###
+
+    # The following function is used to handle modifying the data and displaying it in view
+    @timed_stage('modify')
+    def modify_section(self, current_data, next_data = None):
+        # Grab the operation being performed
+        operation = get_operation(self.operation)
+
+        # Create flags to handle iterating over the text based on the current operation
+        first_run = True
+        process_further = False
+
+        # Create a copy of the current section data so that the original section is left untouched
+        current_data = current_data.copy()
+
+        # Check to see if performing an operation that spans more than one section
+        if operation.span > 1 and not next_data == None:
+            # Create a copy of the next section data so that the original section is left untouched
+            next_data = next_data.copy()
+
+        # Store which line should be processed next
+        process_line_index = 0
+
+        # Iterate only when it's the first run or further processing is needed (when the operation returns the amount of lines to skip over)
+        while first_run or process_further:
+            # Update the flags
+            first_run = False
+            process_further = False
+
+            # Check to see if the next line can be processed
+            if process_line_index >= len(current_data.text):
+                # Break out of the loop
+                break
+
+            # Call the function to handle modifying the time setting of the section
+            operation.modify_time(self, current_data)
+
+            # Iterate over the lines and correct the ones with the issue
+            for index, line in enumerate(current_data.text[process_line_index:].copy(), process_line_index):
+                # Call the function to handle modifying the line and grab the amount of lines to skip over if the section needs to be processed further
+                skipped_lines = operation.modify_line(self, current_data, next_data, index, line)
+
+                # Check to see if the section needs to be processed further
+                if skipped_lines:
+                    # Send the section to be further processed skipping over the respective lines
+                    process_further = True
+                    process_line_index = process_line_index + skipped_lines
+
+        # Return the modified sections
+        return current_data, next_data
+
+    # The following function is used to handle formatting the section(s) into their textual representation
+    def format_sections(self, current_data, next_data = None):
+        # Join the index, time, and text of the current section
+        formatted_sections = '\n'.join([str(current_data.index), current_data.format_time(self.time_separator), '\n'.join(current_data.text)])
+
+        # Check to see if using an operation that spans more than one section
+        if self.get_section_span() > 1 and not next_data == None:
+            # Append the following section
+            formatted_sections = formatted_sections + '\n\n' + '\n'.join([str(next_data.index), next_data.format_time(self.time_separator), '\n'.join(next_data.text)])
+
+        # Return the formatted sections
+        return formatted_sections
+
+    # The following function is used to handle applying the approved modifications to the respective section of the file
+    @timed_stage('approve')
+    def approve_section(self, section_index, modifications):
+        # Grab the current file_data position and update the text section with the new edits
+        current_line_index = self.sections_to_modify[section_index].index
+        current_position = self.section_positions[current_line_index]
+        current_section = self.file_data[current_position]
+
+        # Check to see if the current section modifies the time stamps and if they've changed
+        time_changed = get_operation(self.operation).changes_time and (current_section.start, current_section.end, current_section.settings) != (modifications.start, modifications.end, modifications.settings)
+
+        # Check to see if the time stamps have changed
+        if time_changed:
+            # Handle updating the time as well
+            current_section.start = modifications.start
+            current_section.end = modifications.end
+            current_section.settings = modifications.settings
+
+        # Check to see if the text or time stamps have changed
+        if time_changed or current_section.text != modifications.text:
+            # Update the text section with the new edits and flag that the file has been modified
+            current_section.text = modifications.text
+            self.modified = True
+
+        # Check to see if the section ends up blank
+        if len(current_section.text) == 0:
+            # Remove the current section (leaving an empty position that's compacted when saving)
+            self.file_data[current_position] = None
+            del self.section_positions[current_line_index]
+            self.removed_sections = self.removed_sections + 1
+
+    # The following function is used to handle modifying and approving all sections from the provided pointer without user input
+    def auto_approve(self, start_index = 0):
+        # Grab the amount of sections the operation spans
+        section_span = self.get_section_span()
+
+        # Call the function to handle detecting any remaining matches before they're approved
+        self.fill_matches()
+
+        # Iterate over each of the matches that need to be modified
+        for section_index in range(start_index, len(self.sections_to_modify), section_span):
+            # Grab the current and next data to handle
+            current_data = self.sections_to_modify[section_index]
+            next_data = self.sections_to_modify[section_index + 1] if section_span > 1 else None
+
+            # Grab the modified sections and filter out any empty lines the same way an approval from the viewer does
+            modified_sections = list(self.modify_section(current_data, next_data)[:section_span])
+            for modified_section in modified_sections:
+                modified_section.text = list(filter(None, modified_section.text))
+
+            # Call the function to handle approving the modified sections (the matches are approved as they were detected)
+            self.approve_match(section_index, modified_sections, redetect = False)
+
+    # The following function is used to handle modifying and approving all sections from the provided pointer and then all matches of each pending operation in order without user input
+    def auto_approve_pipeline(self, start_index = 0):
+        # Call the function to handle approving the rest of the current operation's matches
+        self.auto_approve(start_index)
+
+        # Iterate over each of the pending operations
+        while self.apply_next_operation():
+            # Call the function to handle approving all of the operation's matches
+            self.auto_approve()
+
+    # The following function is used to handle approving the modified sections of a match and re-detecting the pending matches around them
+    def approve_match(self, section_index, modifications, redetect = True):
+        # Grab the positions of the sections in the file before they're approved (as they could be removed)
+        positions = [self.section_positions.get(self.sections_to_modify[section_index + section_offset].index) for section_offset in range(len(modifications))]
+
+        # Iterate over each of the modified sections and call the function to handle approving them
+        for section_offset, modified_section in enumerate(modifications):
+            self.approve_section(section_index + section_offset, modified_section)
+
+        # Check to see if the pending matches should be re-detected
+        if redetect and len(positions) > 0 and positions[0] is not None:
+            # Call the function to handle re-detecting the pending matches around the approved sections
+            self.redetect_matches(section_index, positions)
+
+    # The following function is used to handle re-detecting only the approved sections and their neighbours (instead of the whole file) and patching the pending matches that follow the approved match
+    @timed_stage('detect')
+    def redetect_matches(self, section_index, positions):
+        # Grab the operation and the amount of sections it spans
+        operation = get_operation(self.operation)
+        section_span = operation.span
+
+        # Create a list to hold the sections that were touched by the approval
+        touched_sections = []
+
+        # Iterate over each of the approved positions
+        for position in [position for position in positions if position is not None]:
+            # Check to see if the section is still in the file
+            if self.file_data[position] is not None:
+                # Store the section
+                touched_sections.append(self.file_data[position])
+            else:
+                # Store the sections either side of the removed section as they're now neighbours
+                touched_sections.extend(section for section in [next((self.file_data[index] for index in range(position - 1, -1, -1) if self.file_data[index] is not None), None), next((self.file_data[index] for index in range(position + 1, len(self.file_data)) if self.file_data[index] is not None), None)] if section is not None)
+
+        # Grab the first section at or after the start of the approved match and if the match's first section is still in the file
+        first_section = next((self.file_data[index] for index in range(positions[0], len(self.file_data)) if self.file_data[index] is not None), None)
+        first_section_kept = self.file_data[positions[0]] is not None
+
+        # Call the function to handle compacting the file data so that neighbouring sections are adjacent
+        self.compact_file_data()
+
+        # Check to see if there aren't any sections after the approved match
+        if first_section is None:
+            # Return to stop further processing
+            return
+
+        # Grab the position that pending matches start from (matches starting at the approved match have already been handled)
+        pending_position = self.section_positions[first_section.index] + (1 if first_section_kept else 0)
+
+        # Grab the positions of the matches that include a touched section and are still pending (positions that haven't been scanned yet are detected by the scan)
+        candidates = {candidate for section in touched_sections for candidate in range(self.section_positions[section.index] - section_span + 1, self.section_positions[section.index] + 1) if candidate >= pending_position and candidate < self.scan_position and candidate + section_span <= len(self.file_data)}
+
+        # Check to see if there aren't any pending matches to re-detect
+        if len(candidates) == 0:
+            # Return to stop further processing
+            return
+
+        # Grab the pending matches that start at or before the last candidate (only these can be affected)
+        start_index = section_index + section_span
+        end_index = start_index
+        while end_index < len(self.sections_to_modify) and self.section_positions.get(self.sections_to_modify[end_index].index, -1) <= max(candidates):
+            end_index = end_index + section_span
+
+        # Keep the affected pending matches that weren't candidates (dropping any whose sections were removed) and add the candidates that still match
+        matches = [(self.section_positions[self.sections_to_modify[index].index], self.sections_to_modify[index:(index + section_span)]) for index in range(start_index, end_index, section_span) if self.sections_to_modify[index].index in self.section_positions and self.section_positions[self.sections_to_modify[index].index] not in candidates]
+        matches.extend((candidate, self.file_data[candidate:(candidate + section_span)]) for candidate in candidates if operation.detect(self, candidate))
+
+        # Replace the affected pending matches with the re-detected matches (in the order they appear in the file)
+        self.sections_to_modify[start_index:end_index] = [section for _, sections in sorted(matches, key = lambda match: match[0]) for section in sections]
+
+    # The following function is used to handle grabbing the stats of the file along with the amount of matches that have been found
+    def get_stats(self):
+        # Grab each of the operations performed on the file along with their matches
+        operation_matches = self.get_operation_matches()
+
+        # Return a copy of the stats (counting the matches of the operations when there are any and naming each operation of a pipeline)
+        return dict(self.stats, times = dict(self.stats['times']), operation = ' > '.join(operation for operation, _ in operation_matches) if len(self.applied_operations) > 0 else self.stats['operation'], matches = sum(matches for _, matches in operation_matches) if self.operation is not None else self.stats['matches'])
+
+    # The following function is used to handle grabbing the path the modifications of a file are saved to
+    def get_save_path(self, file_path):
+        # Check to see if the user desires to convert the file (by any of the operations performed on it)
+        if self.has_operation_flag('converts_to_srt'):
+            # Return the path with the changed file extension (leaving the rest of the path untouched)
+            return os.path.splitext(file_path)[0] + '.srt'
+
+        # Return the path as is
+        return file_path
+
+    # The following function is used to handle saving the modifications to file (forcing the save even if nothing has changed when requested)
+    @timed_stage('save')
+    def save_modifications(self, file_path, force = False):
+        # Call the function to handle grabbing the path the file is saved to
+        file_path = self.get_save_path(file_path)
+
+        # Check to see if nothing has changed and the file would only be rewritten in place (converting and sanitizing always rewrite the file)
+        if not force and not self.modified and not self.has_operation_flag('always_save') and self.file_path is not None and os.path.abspath(file_path) == os.path.abspath(self.file_path):
+            # Call the function to handle closing the file if it was memory mapped
+            self.close_file()
+
+            # Return False as the file didn't need saving
+            return False
+
+        # Call the function to handle compacting the file data to drop any removed sections
+        self.compact_file_data()
+
+        # Call the function to handle streaming the sections to the file (closing the file if it was memory mapped before it's replaced)
+        write_file(file_path, self.write_sections, self.fsync, self.close_file)
+
+        # Add the amount of bytes that were written to the stats
+        self.stats['bytes_written'] = self.stats['bytes_written'] + os.path.getsize(file_path)
+
+        # Reset the modified flag and return True as the file was saved
+        self.modified = False
+        return True
+
+    # The following function is used to handle grabbing the modified sections as text instead of saving them to a file
+    @timed_stage('save')
+    def get_modified_text(self):
+        # Call the function to handle compacting the file data to drop any removed sections
+        self.compact_file_data()
+
+        # Call the function to handle writing the sections to memory
+        buffer = io.BytesIO()
+        self.write_sections(buffer)
+
+        # Add the amount of bytes that were written to the stats
+        self.stats['bytes_written'] = self.stats['bytes_written'] + buffer.tell()
+
+        # Return the text of the sections
+        return buffer.getvalue().decode('utf-8')
+
+    # The following function is used to handle writing the sections to the provided (binary) file one at a time, copying untouched memory mapped sections directly
+    def write_sections(self, file):
+        # Grab if the file is being converted to srt (by any of the operations performed on it)
+        converts_to_srt = self.has_operation_flag('converts_to_srt')
+
+        # Grab the millisecond separator to save the time stamps with (srt files always use a comma) and the line endings to use
+        time_separator = ',' if converts_to_srt else self.time_separator
+        newline = self.newline.encode('utf-8')
+
+        # Check to see if the file has a header that should be kept
+        has_header = bool(self.header) and not converts_to_srt
+
+        # Check to see if the header should be written
+        if has_header:
+            # Write the header
+            file.write(self.header.replace('\n', self.newline).encode('utf-8', 'ignore'))
+
+        # Iterate over the file data
+        for index, section in enumerate(self.file_data, 1):
+            # Check to see if the section needs to be separated from the previous content
+            if index > 1 or has_header:
+                # Write the separating blank line
+                file.write(newline + newline)
+
+            # Check to see if the section is untouched and can be copied straight from the mapped file
+            if isinstance(section, mapped_cue) and section.source is not None and not converts_to_srt:
+                # Write the index and copy the time setting and text
+                file.write(str(index).encode('utf-8') + newline)
+                file.write(self.file_map[section.time_offset:section.end_offset])
+            else:
+                # Write the section
+                file.write(self.newline.join([str(index), section.format_time(time_separator)] + section.text).encode('utf-8', 'ignore'))
+
+# The following function is used to handle running an operation on a file from start to finish while approving all modifications
+def process_file(file, operation, find_and_replace = None, output_directory = None, memory_map = False, fsync = False, cache_path = None, columnar = False):
+    # Check to see if the results should be cached
+    if cache_path is not None:
+        # Return the summary of the file processed through the cache
+        return process_cached_file(file, operation, find_and_replace, output_directory, memory_map, fsync, cache_path, columnar)
+
+    # Create the processor for the file
+    processor = subtitle_processor(operation, find_and_replace, memory_map, fsync, columnar)
+
+    # Call the function to handle loading the data from the file
+    if processor.load_data(file) == False:
+        # Return the summary noting that the file is missing
+        return {'file': file, 'status': 'missing', 'matches': 0, 'output': None}
+
+    # Call the function to handle checking if the file has any sections to edit based on the operation
+    processor.parse_file()
+
+    # Grab the amount of matches found in the file
+    matches = len(processor.sections_to_modify) // processor.get_section_span()
+
+    # Call the function to handle modifying and approving all of the matches
+    processor.auto_approve()
+
+    # Grab the path to save the modifications to (the output directory if provided)
+    file_path = os.path.join(output_directory, os.path.basename(file)) if output_directory else file
+
+    # Call the function to handle saving the modifications to the file
+    saved = processor.save_modifications(file_path)
+
+    # Return the summary of the processed file (along with the file that was written if it was saved and the stats of each stage)
+    return {'file': file, 'status': 'complete', 'matches': matches, 'output': processor.get_save_path(file_path) if saved else None, 'stats': processor.get_stats()}
+
+# The following function is used to handle running a pipeline of operations on a file in order (loading the file once and saving it once after every operation has been performed)
+def process_pipeline_file(file, operations, find_and_replace = None, output_directory = None, memory_map = False, fsync = False, columnar = False):
+    # Create the processor for the file starting with the first operation (the rest are performed in order afterwards)
+    processor = subtitle_processor(operations[0], find_and_replace, memory_map, fsync, columnar)
+    processor.pending_operations = list(operations[1:])
+
+    # Call the function to handle loading the data from the file
+    if processor.load_data(file) == False:
+        # Return the summary noting that the file is missing
+        return {'file': file, 'status': 'missing', 'matches': {}, 'output': None}
+
+    # Call the function to handle starting the detection of the matches for the first operation
+    processor.start_matches()
+
+    # Call the function to handle modifying and approving all of the matches of each operation
+    processor.auto_approve_pipeline()
+
+    # Grab the amount of matches found for each operation
+    matches = processor.get_matches_by_operation()
+
+    # Grab the path to save the modifications to (the output directory if provided)
+    file_path = os.path.join(output_directory, os.path.basename(file)) if output_directory else file
+
+    # Call the function to handle saving the modifications to the file
+    saved = processor.save_modifications(file_path)
+
+    # Return the summary of the processed file (along with the file that was written if it was saved and the stats of each stage)
+    return {'file': file, 'status': 'complete', 'matches': matches, 'output': processor.get_save_path(file_path) if saved else None, 'stats': processor.get_stats()}
+
+# The following function is used to handle detecting the matches of the provided operations in subtitle text, or performing them in order and approving every modification (the text isn't read from or saved to a file)
+def process_text(text, operations, find_and_replace = None, detect = False, name = None, columnar = False):
+    # Check to see if only the matches are being detected
+    if detect:
+        # Create the processor and call the function to handle loading the text
+        processor = subtitle_processor(None, find_and_replace, False, False, columnar)
+        processor.load_text(text, name)
+
+        # Call the function to handle detecting the sections that need modifying for each of the operations and grab the amount of matches for each of them
+        matches = {operation: len(sections) // get_operation(operation).span for operation, sections in processor.detect_operations(operations).items()}
+
+        # Return the summary of the text with the amount of matches for each operation and the stats of each stage
+        return {'file': name, 'status': 'complete', 'matches': matches, 'stats': dict(processor.get_stats(), operation = ', '.join(operations), matches = sum(matches.values()))}
+
+    # Create the processor starting with the first operation (the rest are performed in order afterwards)
+    processor = subtitle_processor(operations[0], find_and_replace, False, False, columnar)
+    processor.pending_operations = list(operations[1:])
+
+    # Call the function to handle loading the text and starting the detection of the matches for the first operation
+    processor.load_text(text, name)
+    processor.start_matches()
+
+    # Call the function to handle modifying and approving all of the matches of each operation
+    processor.auto_approve_pipeline()
+
+    # Grab the amount of matches found for each operation and the modified text
+    matches = processor.get_matches_by_operation()
+    modified_text = processor.get_modified_text()
+
+    # Return the summary of the text along with the modified text and the stats of each stage
+    return {'file': name, 'status': 'complete', 'matches': matches, 'text': modified_text, 'stats': processor.get_stats()}
+
+# The following function is used to handle running an operation on a file while looking up and storing the result in the cache so that unchanged files are skipped
+def process_cached_file(file, operation, find_and_replace = None, output_directory = None, memory_map = False, fsync = False, cache_path = None, columnar = False):
+    # Check to see if the file exists
+    if not os.path.exists(file):
+        # Return the summary noting that the file is missing
+        return {'file': file, 'status': 'missing', 'matches': 0, 'output': None}
+
+    # Open the cache
+    cache = subtitle_cache(cache_path)
+
+    # Attempt to handle the file through the cache
+    try:
+        # Grab the key of the operation, the hash of the file's content, and the path to save the modifications to
+        operation_key = get_operation_key(operation, find_and_replace)
+        content_hash = hash_file(file)
+        file_path = subtitle_processor(operation).get_save_path(os.path.join(output_directory, os.path.basename(file)) if output_directory else file)
+
+        # Grab the cached result for the content
+        result = cache.get(content_hash, operation_key, get_rules_version())
+
+        # Check to see if there is a result that can be used (a result without output can only be used when the file isn't written elsewhere)
+        if result is not None and (result['output'] is not None or file_path == file):
+            # Check to see if the result has output
+            if result['output'] is not None:
+                # Write the output to the file
+                write_file(file_path, lambda output_file: output_file.write(result['output']), fsync)
+
+            # Return the summary of the cached file
+            return {'file': file, 'status': 'complete', 'matches': result['matches'], 'output': file_path if result['output'] is not None else None, 'cached': True}
+
+        # Call the function to handle processing the file
+        summary = process_file(file, operation, find_and_replace, output_directory, memory_map, fsync, None, columnar)
+
+        # Grab the output of the file (which is the same content when the file wasn't written)
+        output = None
+        output_hash = content_hash
+
+        # Check to see if the file was written
+        if summary['output'] is not None:
+            # Read the output and hash it
+            with open(summary['output'], 'rb') as output_file:
+                output = output_file.read()
+            output_hash = hashlib.sha256(output).hexdigest()
+
+        # Store the result for the content
+        cache.put(content_hash, operation_key, get_rules_version(), summary['matches'], output_hash, output)
+
+        # Check to see if the file was modified in place by an operation that doesn't always rewrite the file
+        if summary['output'] == file and output_hash != content_hash and not get_operation(operation).always_save:
+            # Create the processor for the modified file and run the operation on it again without saving
+            processor = subtitle_processor(operation, find_and_replace, memory_map, False, columnar)
+            processor.load_data(file)
+            processor.parse_file()
+            processor.auto_approve()
+            processor.close_file()
+
+            # Check to see if running the operation again doesn't change the file
+            if not processor.modified:
+                # Store the modified content as a result that doesn't need the file to be rewritten so that reruns skip the file
+                cache.put(output_hash, operation_key, get_rules_version(), len(processor.sections_to_modify) // processor.get_section_span(), output_hash)
+
+        # Return the summary of the processed file
+        return summary
+    finally:
+        # Close the cache
+        cache.close()
+
+# The following function is used to handle detecting the matches of many operations in a file in a single pass
+def detect_file(file, operations, find_and_replace = None, memory_map = False, columnar = False):
+    # Create the processor for the file
+    processor = subtitle_processor(None, find_and_replace, memory_map, False, columnar)
+
+    # Call the function to handle loading the data from the file
+    if processor.load_data(file) == False:
+        # Return the summary noting that the file is missing
+        return {'file': file, 'status': 'missing', 'matches': {}}
+
+    # Call the function to handle detecting the sections that need modifying for each of the operations
+    sections_to_modify = processor.detect_operations(operations)
+
+    # Call the function to handle closing the file if it was memory mapped
+    processor.close_file()
+
+    # Grab the amount of matches for each operation
+    matches = {operation: len(sections) // get_operation(operation).span for operation, sections in sections_to_modify.items()}
+
+    # Grab the stats of the file (reported under the operations being detected along with the total amount of matches)
+    stats = dict(processor.get_stats(), operation = ', '.join(operations), matches = sum(matches.values()))
+
+    # Return the summary of the detected file with the amount of matches for each operation and the stats of each stage
+    return {'file': file, 'status': 'complete', 'matches': matches, 'stats': stats}
+
+# The following function is used to handle calling the provided function for many files, fanning them out over a process pool when more than one worker is requested (loading the provided plugins in each worker process)
+def map_files(function, files, arguments, workers = 1, plugins = None):
+    # Check to see if the files should be handled one after another
+    if workers == 1:
+        # Iterate over each of the files
+        for file in files:
+            # Attempt to handle the file (a file that can't be handled shouldn't stop the rest of the files)
+            try:
+                summary = function(file, *arguments)
+            except Exception as error:
+                summary = get_error_summary(file, error)
+
+            # Yield the summary of the file
+            yield summary
+
+        # Return to stop further processing
+        return
+
+    # Create the process pool (the amount of processors is used when no worker count is provided)
+    with ProcessPoolExecutor(max_workers = workers, initializer = load_plugins, initargs = (plugins,)) as executor:
+        # Submit each of the files to the process pool (keeping track of the file each of them is for)
+        futures = {executor.submit(function, file, *arguments): file for file in files}
+
+        # Iterate over each of the files as they complete
+        for future in as_completed(futures):
+            # Attempt to grab the summary of the file (a file that can't be handled shouldn't stop the rest of the files)
+            try:
+                summary = future.result()
+            except Exception as error:
+                summary = get_error_summary(futures[future], error)
+
+            # Yield the summary of the file
+            yield summary
+
+# The following function is used to handle creating the summary of a file that couldn't be handled because of the provided error
+def get_error_summary(file, error):
+    # Return the summary noting the error
+    return {'file': file, 'status': 'error', 'error': '%s: %s' % (type(error).__name__, error)}
+
+# The following function is used to handle running an operation on many files
+def process_files(files, operation, find_and_replace = None, output_directory = None, workers = 1, memory_map = False, fsync = False, cache_path = None, plugins = None, columnar = False):
+    # Return the summaries of the files as they're processed
+    return map_files(process_file, files, (operation, find_and_replace, output_directory, memory_map, fsync, cache_path, columnar), workers, plugins)
+
+# The following function is used to handle running a pipeline of operations on many files
+def process_pipeline_files(files, operations, find_and_replace = None, output_directory = None, workers = 1, memory_map = False, fsync = False, plugins = None, columnar = False):
+    # Return the summaries of the files as they're processed
+    return map_files(process_pipeline_file, files, (operations, find_and_replace, output_directory, memory_map, fsync, columnar), workers, plugins)
+
+# The following function is used to handle detecting the matches of many operations in many files
+def detect_files(files, operations, find_and_replace = None, workers = 1, memory_map = False, plugins = None, columnar = False):
+    # Return the summaries of the files as they're detected
+    return map_files(detect_file, files, (operations, find_and_replace, memory_map, columnar), workers, plugins)
@@ -0,0 +1,347 @@
+###
+#
+# N3rdP1um23
+# The following file is used to handle serving corrections over http so that other tools can send subtitle text and get the corrected text (or a report of the matches) back without writing any files
+#
+###
+
+# Import the required packages
+import asyncio
+import functools
+import json
+import os
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from subtitle_operations import get_operation_names
+from subtitle_processor import process_text
+from subtitle_stats import create_stats, add_stats, summarize_totals
+from subtitle_watcher import setup_worker
+
+# The following is a class that's used to hold an error that's sent back to the client as the response to a request
+class request_error(Exception):
+    # The following function is used as a constructor
+    def __init__(self, status, message):
+        # Store the message and status
+        super().__init__(message)
+        self.status = status
+
+# The following is a class that's used to handle serving corrections over http, reading requests with asyncio and running the operations in a process pool
+class correction_server:
+    # The following function is used as a constructor
+    def __init__(self, host = '127.0.0.1', port = 8080, workers = None, max_concurrent = None, keep_alive = 5.0, max_body_size = 50 * 1024 * 1024, plugins = None, pipelines = None, columnar = False, request_timeout = 30.0):
+        # Store the address to listen on
+        self.host = host
+        self.port = port
+
+        # Store the amount of worker processes (one per processor by default) and requests that are processed at once (one per worker by default)
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrent = max_concurrent or self.workers
+
+        # Store how long idle connections are kept open, how long a request has to be sent once it has started, and the largest body that's accepted
+        self.keep_alive = keep_alive
+        self.request_timeout = request_timeout
+        self.max_body_size = max_body_size
+
+        # Store the plugins that provide extra operations, the saved pipelines, and if the columnar backend is used
+        self.plugins = plugins
+        self.pipelines = pipelines or {}
+        self.columnar = columnar
+
+        # Initialize the server, process pool, and request values (the stats are kept as running totals for each operation so that they don't grow with every request)
+        self.server = None
+        self.executor = None
+        self.semaphore = None
+        self.request_count = 0
+        self.operation_stats = {}
+
+    # The following function is used to handle starting the process pool and listening for connections (returning the port being listened on)
+    async def start(self):
+        # Create the process pool (loading the plugins in each worker) and the limit of requests processed at once
+        self.executor = ProcessPoolExecutor(max_workers = self.workers, initializer = setup_worker, initargs = (self.plugins,))
+        self.semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        # Start the workers before listening (when they're forked on the first request they inherit its connection and keep it open after it's closed)
+        await asyncio.get_running_loop().run_in_executor(self.executor, os.getpid)
+
+        # Start listening for connections
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+
+        # Return the port being listened on (as port 0 picks a free port)
+        return self.server.sockets[0].getsockname()[1]
+
+    # The following function is used to handle serving until the server is closed
+    async def serve_forever(self):
+        # Serve the connections
+        async with self.server:
+            await self.server.serve_forever()
+
+    # The following function is used to handle closing the server and shutting down the process pool
+    async def close(self):
+        # Check to see if the server is listening
+        if self.server is not None:
+            # Stop listening for connections
+            self.server.close()
+            await self.server.wait_closed()
+
+        # Check to see if the process pool was created
+        if self.executor is not None:
+            # Shut down the process pool
+            self.executor.shutdown(cancel_futures = True)
+
+    ###
+    #
+    # Connection functions
+    #
+    ###
+
+    # The following function is used to handle each request sent over a connection until it's closed or idle for the keep alive time
+    async def handle_connection(self, reader, writer):
+        # Attempt to handle the requests
+        try:
+            # Continue handling requests while the connection is kept alive
+            keep_alive = True
+            while keep_alive:
+                # Attempt to read the next request (closing the connection if it's idle for too long)
+                try:
+                    request = await self.read_request(reader)
+                except asyncio.TimeoutError:
+                    # Return to close the connection
+                    return
+                except request_error as error:
+                    # Send the error and close the connection (as the rest of the request can't be trusted)
+                    self.write_json(writer, error.status, {'error': str(error)}, False)
+                    await writer.drain()
+                    return
+
+                # Check to see if the connection was closed by the client
+                if request is None:
+                    # Return to stop further processing
+                    return
+
+                # Grab if the connection should be kept alive after the response
+                method, target, version, headers, body = request
+                keep_alive = headers.get('connection', '').lower() != 'close' if version == 'HTTP/1.1' else headers.get('connection', '').lower() == 'keep-alive'
+
+                # Call the function to handle the request and send its response
+                try:
+                    status, content_type, content = await self.handle_request(method, target, body)
+                except request_error as error:
+                    status, content_type, content = error.status, 'application/json', json.dumps({'error': str(error)}).encode('utf-8')
+                self.write_response(writer, status, content_type, content, keep_alive)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # Return as the client went away
+            return
+        finally:
+            # Close the connection and wait for it to be closed (the client could have already gone away)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    # The following function is used to handle reading a request from the connection (returning None if the connection was closed before the request started)
+    async def read_request(self, reader):
+        # Attempt to read the request line and headers
+        try:
+            # Grab the request line (waiting up to the keep alive time for it to start)
+            request_line = await asyncio.wait_for(reader.readline(), self.keep_alive)
+
+            # Check to see if the connection was closed
+            if not request_line:
+                # Return None as there isn't a request
+                return None
+
+            # Grab the method, target, and version of the request
+            parts = request_line.decode('latin-1').rstrip('\r\n').split(' ')
+            if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+                raise request_error(HTTPStatus.BAD_REQUEST, 'malformed request line')
+            method, target, version = parts
+
+            # Grab when the rest of the request has to be sent by (so that a client can't hold the connection open by sending it slowly)
+            deadline = asyncio.get_running_loop().time() + self.request_timeout
+
+            # Grab the headers of the request (keyed by their lowercase name)
+            headers = {}
+            while True:
+                # Grab the next header line
+                line = (await self.wait_for_request(reader.readline(), deadline)).decode('latin-1').rstrip('\r\n')
+
+                # Check to see if the headers have ended
+                if line == '':
+                    break
+
+                # Check to see if there are too many headers or the header is malformed
+                if len(headers) >= 100 or ':' not in line:
+                    raise request_error(HTTPStatus.BAD_REQUEST, 'malformed headers')
+
+                # Store the header
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+        except (ValueError, asyncio.LimitOverrunError):
+            # Raise the error as the line was too long
+            raise request_error(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, 'request line or header too long')
+
+        # Check to see if the body is chunked (only bodies with a length are supported)
+        if 'transfer-encoding' in headers:
+            raise request_error(HTTPStatus.LENGTH_REQUIRED, 'send the body with a Content-Length instead of Transfer-Encoding')
+
+        # Grab the length of the body
+        try:
+            content_length = int(headers.get('content-length', '0'))
+        except ValueError:
+            raise request_error(HTTPStatus.BAD_REQUEST, 'invalid Content-Length')
+
+        # Check to see if the body is too large (or the length is invalid)
+        if content_length < 0 or content_length > self.max_body_size:
+            raise request_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'the body is larger than %d bytes' % self.max_body_size)
+
+        # Read the body
+        body = await self.wait_for_request(reader.readexactly(content_length), deadline) if content_length > 0 else b''
+
+        # Return the request
+        return (method, target, version, headers, body)
+
+    # The following function is used to handle waiting on part of a request that has already started (raising an error for the client if the request isn't sent by the deadline)
+    async def wait_for_request(self, awaitable, deadline):
+        # Attempt to wait for the part of the request until the deadline
+        try:
+            return await asyncio.wait_for(awaitable, max(deadline - asyncio.get_running_loop().time(), 0))
+        except asyncio.TimeoutError:
+            raise request_error(HTTPStatus.REQUEST_TIMEOUT, 'the request wasn\'t sent within %g seconds' % self.request_timeout)
+
+    # The following function is used to handle writing a response to the connection
+    def write_response(self, writer, status, content_type, content, keep_alive):
+        # Create the status line and headers
+        lines = ['HTTP/1.1 %d %s' % (status, HTTPStatus(status).phrase), 'Content-Type: ' + content_type, 'Content-Length: %d' % len(content)]
+        lines.append('Connection: keep-alive' if keep_alive else 'Connection: close')
+        if keep_alive:
+            lines.append('Keep-Alive: timeout=%d' % self.keep_alive)
+
+        # Write the response
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + content)
+
+    # The following function is used to handle writing a json response to the connection
+    def write_json(self, writer, status, value, keep_alive):
+        # Call the function to handle writing the response with the encoded value
+        self.write_response(writer, status, 'application/json', json.dumps(value).encode('utf-8'), keep_alive)
+
+    ###
+    #
+    # Request functions
+    #
+    ###
+
+    # The following function is used to handle a request and grab the status, content type, and content of its response
+    async def handle_request(self, method, target, body):
+        # Grab the path and query parameters of the request
+        url = urllib.parse.urlsplit(target)
+        parameters = urllib.parse.parse_qs(url.query)
+
+        # Check to see if the available operations are being listed
+        if url.path == '/operations':
+            # Check to see if the method isn't supported
+            if method != 'GET':
+                raise request_error(HTTPStatus.METHOD_NOT_ALLOWED, 'use GET for /operations')
+
+            # Return the operations and saved pipelines
+            return HTTPStatus.OK, 'application/json', json.dumps({'operations': get_operation_names(), 'pipelines': self.pipelines}).encode('utf-8')
+
+        # Check to see if the path isn't supported
+        if url.path not in ['/correct', '/detect']:
+            raise request_error(HTTPStatus.NOT_FOUND, 'unknown path (use /correct, /detect, or /operations)')
+
+        # Check to see if the method isn't supported
+        if method != 'POST':
+            raise request_error(HTTPStatus.METHOD_NOT_ALLOWED, 'use POST with the subtitle text as the body for ' + url.path)
+
+        # Call the function to handle grabbing the operations and find and replace values of the request
+        operations = self.get_operations(parameters)
+        find_and_replace = {'find': parameters['find'][0] if 'find' in parameters else '', 'replace': parameters['replace'][0] if 'replace' in parameters and parameters['replace'][0] != '' else None}
+
+        # Check to see if the user is finding and replacing without a value to find
+        if 'Find and replace' in operations and find_and_replace['find'] == '':
+            raise request_error(HTTPStatus.BAD_REQUEST, 'find is required when using the "Find and replace" operation')
+
+        # Attempt to decode the subtitle text
+        try:
+            text = body.decode('utf-8')
+        except UnicodeDecodeError:
+            raise request_error(HTTPStatus.BAD_REQUEST, 'the body must be utf-8 subtitle text')
+
+        # Grab the name of the request (used for its stats)
+        self.request_count = self.request_count + 1
+        name = 'request %d' % self.request_count
+
+        # Wait for a free slot and call the function to handle processing the text in the process pool
+        async with self.semaphore:
+            try:
+                summary = await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(process_text, text, operations, find_and_replace, url.path == '/detect', name, self.columnar))
+            except Exception as error:
+                raise request_error(HTTPStatus.INTERNAL_SERVER_ERROR, 'the subtitle text could not be processed (%s: %s)' % (type(error).__name__, error))
+
+        # Add the stats of the request to the running totals of its operation
+        add_stats(self.operation_stats.setdefault(summary['stats']['operation'], dict(create_stats(None, summary['stats']['operation']), files = 0)), summary['stats'])
+
+        # Check to see if the corrected text should be sent back on its own
+        if url.path == '/correct' and (parameters['format'][0] if 'format' in parameters else 'text') != 'json':
+            # Return the corrected text (as vtt when it still has the vtt header)
+            return HTTPStatus.OK, ('text/vtt' if summary['text'].startswith('WEBVTT') else 'application/x-subrip') + '; charset=utf-8', summary['text'].encode('utf-8')
+
+        # Return the report of the matches (along with the corrected text when correcting)
+        return HTTPStatus.OK, 'application/json', json.dumps({key: summary[key] for key in ['matches', 'text', 'stats'] if key in summary}).encode('utf-8')
+
+    # The following function is used to handle grabbing the operations of a request (either each operation parameter in order or the operations of a saved pipeline)
+    def get_operations(self, parameters):
+        # Check to see if a saved pipeline was requested
+        if 'pipeline' in parameters:
+            # Check to see if the pipeline doesn't exist
+            if parameters['pipeline'][0] not in self.pipelines:
+                raise request_error(HTTPStatus.BAD_REQUEST, 'the pipeline "%s" isn\'t saved in config.json' % parameters['pipeline'][0])
+
+            # Grab the operations of the pipeline
+            operations = list(self.pipelines[parameters['pipeline'][0]])
+        else:
+            # Grab the operations in order
+            operations = parameters['operation'] if 'operation' in parameters else []
+
+        # Check to see if there aren't any operations
+        if len(operations) == 0:
+            raise request_error(HTTPStatus.BAD_REQUEST, 'at least one operation (or a pipeline) is required')
+
+        # Check to see if any of the operations aren't available
+        for operation in [operation for operation in operations if operation not in get_operation_names()]:
+            raise request_error(HTTPStatus.BAD_REQUEST, 'unknown operation "%s"' % operation)
+
+        # Return the operations
+        return operations
+
+# The following function is used to handle running the correction server until it's interrupted (returning the summary of the stats of each operation that was requested)
+def serve_corrections(host = '127.0.0.1', port = 8080, workers = None, max_concurrent = None, keep_alive = 5.0, plugins = None, pipelines = None, columnar = False, started = None, request_timeout = 30.0):
+    # Create the server
+    server = correction_server(host, port, workers, max_concurrent, keep_alive, plugins = plugins, pipelines = pipelines, columnar = columnar, request_timeout = request_timeout)
+
+    # The following function is used to handle starting the server and serving until it's cancelled
+    async def run():
+        # Attempt to serve the connections
+        try:
+            # Start the server and call the provided function with the port being listened on
+            listening_port = await server.start()
+            if started is not None:
+                started(listening_port)
+
+            # Serve until cancelled
+            await server.serve_forever()
+        finally:
+            # Close the server
+            await server.close()
+
+    # Run the server until it's interrupted
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+    # Return the summaries of the running totals of each operation
+    return summarize_totals(server.operation_stats.values())
@@ -0,0 +1,165 @@
+###
+#
+# N3rdP1um23
+# The following file is used to handle recording how long each stage of processing a subtitle file takes (along with how much was read, written, and matched) and reporting on it
+#
+###
+
+# Import the required packages
+import csv
+import functools
+import json
+import time
+
+# Create the stages that are timed
+stages = ['load', 'detect', 'modify', 'approve', 'save']
+
+# Create the columns of the per-file stats when they're written as csv
+csv_columns = ['file', 'operation', 'sections', 'matches', 'bytes_read', 'bytes_written'] + [stage + '_time' for stage in stages] + ['total_time', 'sections_per_second']
+
+# Create the columns of the operation summaries when they're written as csv
+summary_csv_columns = ['operation', 'files', 'sections', 'matches', 'bytes_read', 'bytes_written'] + [stage + '_time' for stage in stages] + ['total_time', 'sections_per_second']
+
+# The following function is used to handle creating the stats of a file
+def create_stats(file = None, operation = None):
+    # Return the empty stats
+    return {'file': file, 'operation': operation, 'sections': 0, 'matches': 0, 'bytes_read': 0, 'bytes_written': 0, 'times': {stage: 0.0 for stage in stages}}
+
+# The following function is used to handle creating a decorator that adds the time a processor function takes to the provided stage of the processor's stats
+def timed_stage(stage):
+    # The following function is used to handle wrapping the function
+    def decorator(function):
+        # The following function is used to handle timing the function
+        @functools.wraps(function)
+        def timed_function(self, *arguments, **keyword_arguments):
+            # Grab when the function started
+            start_time = time.perf_counter()
+
+            # Call the function and return its result (adding the time it took even if it fails)
+            try:
+                return function(self, *arguments, **keyword_arguments)
+            finally:
+                self.stats['times'][stage] = self.stats['times'][stage] + time.perf_counter() - start_time
+
+        # Return the timed function
+        return timed_function
+
+    # Return the decorator
+    return decorator
+
+# The following function is used to handle grabbing the total time and throughput of the provided stats
+def get_throughput(stats):
+    # Grab the total time of all of the stages
+    total_time = sum(stats['times'].values())
+
+    # Return the total time and the amount of sections handled per second
+    return total_time, stats['sections'] / total_time if total_time > 0 else 0.0
+
+# The following function is used to handle adding the provided stats (of a single file or already added together) to the provided running totals
+def add_stats(totals, stats):
+    # Add the amount of files, the amounts handled, and the time of each stage
+    totals['files'] = (totals['files'] if 'files' in totals else 0) + (stats['files'] if 'files' in stats else 1)
+    for key in ['sections', 'matches', 'bytes_read', 'bytes_written']:
+        totals[key] = totals[key] + stats[key]
+    for stage in stages:
+        totals['times'][stage] = totals['times'][stage] + stats['times'][stage]
+
+# The following function is used to handle summarizing the stats of many files by their operation
+def summarize_stats(file_stats):
+    # Create the summaries keyed by the operation (keeping the order the operations were first seen in)
+    summaries = {}
+
+    # Iterate over each of the file stats
+    for stats in file_stats:
+        # Grab the summary of the operation (creating it if needed) and add the file's stats to it
+        summary = summaries.setdefault(stats['operation'], dict(create_stats(None, stats['operation']), files = 0))
+        add_stats(summary, stats)
+
+    # Return the summaries with their total time and throughput
+    return summarize_totals(summaries.values())
+
+# The following function is used to handle turning the running totals of each operation (from add_stats) into summaries with the total time and throughput
+def summarize_totals(totals):
+    # Create the summaries from copies of the totals (so that the totals can keep being added to)
+    summaries = [dict({key: value for key, value in total.items() if key != 'file'}, times = dict(total['times'])) for total in totals]
+
+    # Iterate over each of the summaries
+    for summary in summaries:
+        # Store the total time and throughput
+        summary['total_time'], summary['sections_per_second'] = get_throughput(summary)
+
+    # Return the summaries
+    return summaries
+
+# The following function is used to handle formatting an amount of bytes to be displayed
+def format_bytes(amount):
+    # Iterate over each of the units until the amount is small enough to display
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        # Check to see if the amount fits the unit
+        if amount < 1024 or unit == 'GB':
+            # Return the formatted amount
+            return ('%d %s' if unit == 'B' else '%.1f %s') % (amount, unit)
+
+        # Move onto the next unit
+        amount = amount / 1024
+
+# The following function is used to handle formatting the summaries of the provided file stats into lines that can be displayed
+def format_summary(file_stats):
+    # Return the lines of the summary of each operation
+    return format_summaries(summarize_stats(file_stats))
+
+# The following function is used to handle formatting the provided operation summaries into lines that can be displayed
+def format_summaries(summaries):
+    # Create the lines of the summary
+    lines = []
+
+    # Iterate over each of the operation summaries
+    for summary in summaries:
+        # Add the totals, the time of each stage, and the amount read and written
+        lines.append('{operation}: {files} file(s), {sections} sections, {matches} match(es) in {total_time:.2f}s ({sections_per_second:.0f} sections/s)'.format(**summary))
+        lines.append('    ' + ', '.join('{stage} {time:.2f}s'.format(stage = stage, time = summary['times'][stage]) for stage in stages))
+        lines.append('    read {read}, wrote {written}'.format(read = format_bytes(summary['bytes_read']), written = format_bytes(summary['bytes_written'])))
+
+    # Return the lines of the summary
+    return lines
+
+# The following function is used to handle flattening the stats of a file into a single row (for csv files)
+def flatten_stats(stats):
+    # Grab the total time and throughput
+    total_time, sections_per_second = get_throughput(stats)
+
+    # Return the row of the stats
+    return dict({key: stats[key] for key in ['file', 'operation', 'sections', 'matches', 'bytes_read', 'bytes_written']}, total_time = total_time, sections_per_second = sections_per_second, **{stage + '_time': stats['times'][stage] for stage in stages})
+
+# The following function is used to handle flattening an operation summary into a single row (for csv files)
+def flatten_summary(summary):
+    # Return the row of the summary
+    return dict({key: summary[key] for key in ['operation', 'files', 'sections', 'matches', 'bytes_read', 'bytes_written', 'total_time', 'sections_per_second']}, **{stage + '_time': summary['times'][stage] for stage in stages})
+
+# The following function is used to handle writing the stats of each file to the provided path (as csv when the path ends with .csv, otherwise as json along with the summaries)
+def write_stats(file_stats, path):
+    # Check to see if the stats should be written as csv
+    if path.lower().endswith('.csv'):
+        # Write a row for each file
+        with open(path, 'w', newline = '') as stats_file:
+            writer = csv.DictWriter(stats_file, fieldnames = csv_columns)
+            writer.writeheader()
+            writer.writerows(flatten_stats(stats) for stats in file_stats)
+    else:
+        # Write the stats of each file along with the summaries of each operation
+        with open(path, 'w') as stats_file:
+            json.dump({'files': file_stats, 'summary': summarize_stats(file_stats)}, stats_file, indent = 4)
+
+# The following function is used to handle writing the provided operation summaries to the provided path (as csv when the path ends with .csv, otherwise as json)
+def write_summaries(summaries, path):
+    # Check to see if the summaries should be written as csv
+    if path.lower().endswith('.csv'):
+        # Write a row for each operation
+        with open(path, 'w', newline = '') as stats_file:
+            writer = csv.DictWriter(stats_file, fieldnames = summary_csv_columns)
+            writer.writeheader()
+            writer.writerows(flatten_summary(summary) for summary in summaries)
+    else:
+        # Write the summaries of each operation
+        with open(path, 'w') as stats_file:
+            json.dump({'summary': summaries}, stats_file, indent = 4)
@@ -0,0 +1,333 @@
+###
+#
+# N3rdP1um23
+# The following file is used to handle watching folders for new subtitle files (with inotify on linux and polling everywhere else) and performing an operation or pipeline on each of them once they've finished being written
+#
+###
+
+# Import the required packages
+import collections
+import ctypes
+import ctypes.util
+import os
+import select
+import signal
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from subtitle_operations import load_plugins
+from subtitle_processor import get_error_summary, process_file, process_pipeline_file
+
+# Create the extensions of the files that are handled
+subtitle_extensions = ('.srt', '.vtt')
+
+# Create the inotify events that are watched for (a file being written, created, moved in or out, or deleted) along with the event sent when events were dropped
+inotify_events = 0x2 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200
+inotify_overflow = 0x4000
+
+# Create the layout of the header of each inotify event (the watch, event mask, cookie, and length of the name that follows)
+inotify_header = struct.Struct('iIII')
+
+# The following function is used to handle loading the inotify functions from libc (returning None when they aren't available, such as on windows or mac)
+def load_inotify():
+    # Check to see if the platform isn't linux
+    if not sys.platform.startswith('linux'):
+        # Return None as inotify isn't available
+        return None
+
+    # Attempt to load the inotify functions
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno = True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        # Return None as inotify isn't available
+        return None
+
+    # Return the loaded functions
+    return libc
+
+# The following function is used to check if the provided path is a subtitle file that's handled
+def is_subtitle_file(path):
+    # Return if the file has one of the handled extensions
+    return path.lower().endswith(subtitle_extensions)
+
+# The following is a class that's used to watch folders for subtitle files and report each of them once it hasn't changed for the settle time (so that files still being written aren't picked up)
+class folder_watcher:
+    # The following function is used as a constructor
+    def __init__(self, folders, settle_time = 2.0, poll_interval = 1.0, use_inotify = True):
+        # Store the folders being watched and how often (and how long) they're checked
+        self.folders = [os.path.abspath(folder) for folder in folders]
+        self.settle_time = settle_time
+        self.poll_interval = poll_interval
+
+        # Initialize the files waiting to settle (keyed by path with their size, modified time, and when they last changed) and the files that have been reported (keyed by path with their size and modified time)
+        self.pending_files = {}
+        self.handled_files = {}
+
+        # Initialize the inotify watches
+        self.inotify_file = None
+        self.watches = {}
+
+        # Check to see if inotify should be used and is available
+        libc = load_inotify() if use_inotify else None
+        if libc is not None:
+            # Call the function to handle setting up the inotify watches
+            self.setup_inotify(libc)
+
+        # Call the function to handle picking up the files that are already in the folders
+        self.scan_folders()
+
+    # The following function is used to handle setting up an inotify watch for each of the folders (falling back to polling if any of them fail)
+    def setup_inotify(self, libc):
+        # Create the inotify instance (without blocking reads)
+        inotify_file = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        # Check to see if the instance couldn't be created (such as when the limit of instances has been reached)
+        if inotify_file < 0:
+            # Return to fall back to polling
+            return
+
+        # Iterate over each of the folders
+        for folder in self.folders:
+            # Add the watch for the folder
+            watch = libc.inotify_add_watch(inotify_file, os.fsencode(folder), inotify_events)
+
+            # Check to see if the watch couldn't be added
+            if watch < 0:
+                # Close the instance and return to fall back to polling
+                os.close(inotify_file)
+                self.watches = {}
+                return
+
+            # Store the folder of the watch
+            self.watches[watch] = folder
+
+        # Store the instance
+        self.inotify_file = inotify_file
+
+    # The following function is used to grab how the folders are being watched
+    def get_method(self):
+        # Return the method used to watch the folders
+        return 'inotify' if self.inotify_file is not None else 'polling'
+
+    # The following function is used to handle checking every file in the folders (and forgetting the handled files that have been removed)
+    def scan_folders(self):
+        # Create a set to hold the files that were found
+        found_files = set()
+
+        # Iterate over each of the folders
+        for folder in self.folders:
+            # Attempt to list the files in the folder (it could have been removed or be unavailable for now)
+            try:
+                entries = [entry.path for entry in os.scandir(folder) if entry.is_file() and is_subtitle_file(entry.name)]
+            except OSError:
+                continue
+
+            # Iterate over each of the files and check them
+            for path in entries:
+                found_files.add(path)
+                self.check_file(path)
+
+        # Forget the handled files that no longer exist (so that a new file with the same name is picked up)
+        for path in [path for path in self.handled_files if path not in found_files]:
+            del self.handled_files[path]
+
+    # The following function is used to handle checking a file that has been created or changed (waiting for it to settle if it's new or has changed since it was handled)
+    def check_file(self, path):
+        # Attempt to grab the size and modified time of the file
+        try:
+            stats = os.stat(path)
+        except OSError:
+            # Forget the file as it has been removed
+            self.pending_files.pop(path, None)
+            self.handled_files.pop(path, None)
+
+            # Return to stop further processing
+            return
+
+        # Grab the signature of the file
+        signature = (stats.st_size, stats.st_mtime_ns)
+
+        # Check to see if the file hasn't changed since it was handled
+        if self.handled_files.get(path) == signature:
+            # Return to stop further processing
+            return
+
+        # Check to see if the file is new or has changed since it was last checked
+        if path not in self.pending_files or self.pending_files[path][0] != signature:
+            # Store the signature of the file and when it changed
+            self.pending_files[path] = (signature, time.monotonic())
+
+    # The following function is used to handle reading the pending inotify events and checking each of the files they're for
+    def read_events(self):
+        # Attempt to read the pending events
+        try:
+            data = os.read(self.inotify_file, 65536)
+        except BlockingIOError:
+            # Return as there aren't any events
+            return
+
+        # Iterate over each of the events
+        offset = 0
+        while offset < len(data):
+            # Grab the event's watch, mask, and name
+            watch, mask, cookie, length = inotify_header.unpack_from(data, offset)
+            name = os.fsdecode(data[(offset + inotify_header.size):(offset + inotify_header.size + length)].rstrip(b'\0'))
+            offset = offset + inotify_header.size + length
+
+            # Check to see if events were dropped
+            if mask & inotify_overflow:
+                # Call the function to handle checking every file in the folders
+                self.scan_folders()
+            elif watch in self.watches and is_subtitle_file(name):
+                # Call the function to handle checking the file
+                self.check_file(os.path.join(self.watches[watch], name))
+
+    # The following function is used to handle waiting for changes to the folders (up to the provided amount of seconds)
+    def wait_for_changes(self, timeout):
+        # Check to see if the folders are being polled
+        if self.inotify_file is None:
+            # Wait and then check every file in the folders
+            time.sleep(timeout)
+            self.scan_folders()
+
+            # Return to stop further processing
+            return
+
+        # Wait for any events and read them
+        if select.select([self.inotify_file], [], [], timeout)[0]:
+            self.read_events()
+
+    # The following function is used to handle grabbing the files that haven't changed for the settle time (marking them as handled)
+    def get_settled_files(self):
+        # Grab the current time and create a list to hold the settled files
+        current_time = time.monotonic()
+        settled_files = []
+
+        # Iterate over each of the pending files
+        for path, (signature, changed_time) in list(self.pending_files.items()):
+            # Attempt to grab the current size and modified time of the file
+            try:
+                stats = os.stat(path)
+            except OSError:
+                # Forget the file as it has been removed
+                del self.pending_files[path]
+                continue
+
+            # Check to see if the file has changed since it was last checked
+            if (stats.st_size, stats.st_mtime_ns) != signature:
+                # Store the new signature of the file and when it changed
+                self.pending_files[path] = ((stats.st_size, stats.st_mtime_ns), current_time)
+            elif current_time - changed_time >= self.settle_time:
+                # Mark the file as handled and add it to the settled files
+                del self.pending_files[path]
+                self.handled_files[path] = signature
+                settled_files.append(path)
+
+        # Return the settled files (oldest first)
+        return sorted(settled_files)
+
+    # The following function is used to handle waiting for changes to the folders and grabbing the files that have settled
+    def poll(self, timeout = None):
+        # Wait for changes (waking up at least as often as the poll interval so that pending files can settle)
+        self.wait_for_changes(self.poll_interval if timeout is None else timeout)
+
+        # Return the files that have settled
+        return self.get_settled_files()
+
+    # The following function is used to handle closing the inotify instance
+    def close(self):
+        # Check to see if there's an inotify instance
+        if self.inotify_file is not None:
+            # Close the instance
+            os.close(self.inotify_file)
+            self.inotify_file = None
+
+# The following function is used to handle setting up each worker process (ignoring interrupts so that stopping the watcher lets the files being processed finish, and loading the plugins that provide extra operations)
+def setup_worker(plugins = None):
+    # Ignore interrupts in the worker
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # Call the function to handle loading the plugins
+    load_plugins(plugins)
+
+# The following function is used to handle performing the operation (or the operations of a pipeline in order) on a file that has been picked up by the watcher (ran in the worker processes)
+def process_watched_file(file, operations, find_and_replace = None, output_directory = None, memory_map = False, fsync = False, cache_path = None, columnar = False):
+    # Attempt to process the file (a file that can't be handled shouldn't stop the watcher)
+    try:
+        # Check to see if a pipeline is being performed
+        if len(operations) > 1:
+            # Return the summary of the file after performing each operation in order
+            return process_pipeline_file(file, operations, find_and_replace, output_directory, memory_map, fsync, columnar)
+
+        # Return the summary of the file after performing the operation
+        return process_file(file, operations[0], find_and_replace, output_directory, memory_map, fsync, cache_path, columnar)
+    except Exception as error:
+        # Return the summary noting the error
+        return get_error_summary(file, error)
+
+# The following function is used to handle creating the process pool that the watched files are processed in (with the plugins that provide extra operations loaded in each worker)
+def create_pool(workers, plugins = None):
+    # Return the process pool
+    return ProcessPoolExecutor(max_workers = workers, initializer = setup_worker, initargs = (plugins,))
+
+# The following function is used to handle grabbing the summary of a watched file once its worker is done with it (noting the error when the worker couldn't return one, such as when it crashed)
+def get_watched_summary(future, file):
+    # Attempt to grab the summary of the file
+    try:
+        return future.result()
+    except Exception as error:
+        # Return the summary noting the error
+        return get_error_summary(file, error)
+
+# The following function is used to handle watching folders and performing the operation (or pipeline) on each new or changed subtitle file as it settles, yielding the summary of each file as it finishes (until the generator is closed)
+def watch_folders(folders, operations, output_directory, find_and_replace = None, workers = None, memory_map = False, fsync = False, cache_path = None, plugins = None, columnar = False, settle_time = 2.0, poll_interval = 1.0, use_inotify = True):
+    # Create the watcher for the folders
+    watcher = folder_watcher(folders, settle_time, poll_interval, use_inotify)
+
+    # Grab the most files that are processed at once (the amount of processors is used when no worker count is provided)
+    workers = workers or os.cpu_count() or 1
+
+    # Create the process pool once so that the workers stay loaded between files
+    executor = create_pool(workers, plugins)
+
+    # Create the queue of settled files waiting on a worker and the files being processed (keyed by their future with the file and the pool processing it)
+    queued_files = collections.deque()
+    futures = {}
+
+    # Watch the folders until the generator is closed
+    try:
+        while True:
+            # Wait for changes (checking back sooner while files are being processed) and queue the files that have settled
+            queued_files.extend(watcher.poll(min(poll_interval, 0.1) if len(futures) > 0 else None))
+
+            # Submit the queued files while there are free workers (so that only a bounded amount of files are in flight at once)
+            while len(queued_files) > 0 and len(futures) < workers:
+                file = queued_files.popleft()
+                futures[executor.submit(process_watched_file, file, operations, find_and_replace, output_directory, memory_map, fsync, cache_path, columnar)] = (file, executor)
+
+            # Iterate over each of the files that have finished processing
+            for future in [future for future in futures if future.done()]:
+                # Stop tracking the file and grab its summary
+                file, pool = futures.pop(future)
+                summary = get_watched_summary(future, file)
+
+                # Check to see if a worker of the current pool crashed (a broken pool doesn't take any more files)
+                if isinstance(future.exception(), BrokenProcessPool) and pool is executor:
+                    # Replace the process pool so that the watch carries on
+                    executor.shutdown(wait = False)
+                    executor = create_pool(workers, plugins)
+
+                # Yield the summary of the file
+                yield summary
+    except KeyboardInterrupt:
+        # Stop picking up files and yield the summaries of the files being processed as they finish (the workers ignore interrupts, and the files still waiting on a worker are picked up again when the watch restarts)
+        for future in as_completed(list(futures)):
+            yield get_watched_summary(future, futures[future][0])
+    finally:
+        # Stop watching the folders and shut down the process pool
+        watcher.close()
+        executor.shutdown(cancel_futures = True)